@@ -2,14 +2,30 @@
 Cache management endpoints for query result caching.
 """
 
+import re
 from fastapi import APIRouter, HTTPException, Depends, Path
-from pydantic import BaseModel
-from typing import Dict, Any
+from pydantic import AfterValidator, BaseModel
+from typing import Annotated, Dict, Any
 from app.services.query_cache import QueryCache
 from app.dependencies import get_query_cache
 
 router = APIRouter()
 
+# Compiled once at import; no nested quantifiers, so matching is linear
+COLLECTION_NAME_RE = re.compile(r"[a-zA-Z0-9_-]{1,100}")
+
+
+def validate_collection_name(value: str) -> str:
+    """Ensure a collection name is 1-100 letters, digits, underscores or hyphens."""
+    if not COLLECTION_NAME_RE.fullmatch(value):
+        raise ValueError(
+            "Collection name must be 1-100 characters of letters, digits, '_' or '-'"
+        )
+    return value
+
+
+CollectionName = Annotated[str, AfterValidator(validate_collection_name)]
+
 
 class CacheStatsResponse(BaseModel):
     """Response model for cache statistics."""
@@ -39,6 +55,9 @@ async def get_cache_stats(query_cache: QueryCache = Depends(get_query_cache)):
     - hit_rate: Cache hit rate as percentage
     - total_requests: Total number of cache requests
     - enabled: Whether caching is enabled
+
+    Counters are kept in-process by QueryCache, so polling this endpoint
+    does not touch Redis and needs no response caching.
     """
     try:
         stats = query_cache.get_stats()
@@ -65,7 +84,7 @@ async def invalidate_all_cache(query_cache: QueryCache = Depends(get_query_cache
         deleted_count = await query_cache.invalidate_all()
         return CacheInvalidateResponse(
             deleted_count=deleted_count,
-            message=f"Invalidated {deleted_count} cache entries",
+            message="Invalidated all cache entries" if deleted_count else "Cache invalidation failed",
         )
     except Exception as e:
         raise HTTPException(
@@ -75,7 +94,7 @@ async def invalidate_all_cache(query_cache: QueryCache = Depends(get_query_cache
 
 @router.delete("/invalidate/collection/{collection}", response_model=CacheInvalidateResponse)
 async def invalidate_collection_cache(
-    collection: str = Path(..., regex="^[a-zA-Z0-9_-]+$", max_length=100),
+    collection: Annotated[CollectionName, Path()],
     query_cache: QueryCache = Depends(get_query_cache)
 ):
     """
@@ -97,7 +116,11 @@ async def invalidate_collection_cache(
         deleted_count = await query_cache.invalidate_collection(collection)
         return CacheInvalidateResponse(
             deleted_count=deleted_count,
-            message=f"Invalidated {deleted_count} cache entries for collection '{collection}'",
+            message=(
+                f"Invalidated cache entries for collection '{collection}'"
+                if deleted_count
+                else f"Cache invalidation failed for collection '{collection}'"
+            ),
         )
     except Exception as e:
         raise HTTPException(
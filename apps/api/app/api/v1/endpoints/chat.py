@@ -7,21 +7,30 @@ Combines:
 - Conversation and message persistence
 """
 
-from typing import List, Optional, cast
-from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException, status
+import asyncio
+import logging
+import anyio
+from datetime import datetime, timezone
+from typing import AsyncIterator, List, Optional, Tuple, cast
+from uuid import UUID, uuid4
+from fastapi import APIRouter, Depends
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import insert, update
 from pydantic import BaseModel, ConfigDict
 
-from app.db.database import get_session
+from app.core.responses import model_response, sse_event
+from app.db.conversations import conversation_exists, raise_conversation_not_found
+from app.db.database import async_session_factory, get_session
 from app.db.models import Conversation, Message
 from app.services.embeddings import EmbeddingsService
 from app.services.vector_db import VectorDBService
 from app.services.llm import LLMService
 from app.dependencies import get_embeddings_service, get_vector_db_service, get_llm_service
 
-router = APIRouter()
+logger = logging.getLogger(__name__)
+
+router = APIRouter(default_response_class=ORJSONResponse)
 
 
 # ============================================================================
@@ -71,19 +80,139 @@ def generate_conversation_title(message: str, max_length: int = 50) -> str:
     return message[: max_length - 3] + "..."
 
 
+def _format_source(index: int, result: dict) -> str:
+    """Format one search result as a numbered context block."""
+    # VectorDBService returns content/metadata at the top level; raw Qdrant
+    # hits nest them under "payload"
+    payload = result.get("payload") or result
+    source_url = (payload.get("metadata") or {}).get("sourceURL", "Unknown")
+    return f"Source {index} ({source_url}):\n{payload.get('content', '')}"
+
+
 def format_context(search_results: List[dict]) -> str:
     """Format vector search results into context string for LLM."""
-    if not search_results:
-        return ""
+    return "\n\n".join(_format_source(i, r) for i, r in enumerate(search_results, 1))
+
+
+async def get_or_create_conversation(request: ChatRequest, db: AsyncSession) -> UUID:
+    """Return the requested conversation's ID, creating a conversation if none was given."""
+    if request.conversation_id:
+        # Verify conversation exists; loading the row would also pull in
+        # every message and tag through the selectin relationships
+        if not await conversation_exists(request.conversation_id, db):
+            raise_conversation_not_found(request.conversation_id)
+        return request.conversation_id
+
+    # Create new conversation. The ID is assigned here rather than by a flush,
+    # so the row is only written (autoflushed) together with the messages and
+    # no write transaction is held open while the LLM generates.
+    title = generate_conversation_title(request.message)
+    conversation_id = uuid4()
+    db.add(Conversation(id=conversation_id, title=title, space="default"))
+    return conversation_id
+
+
+async def retrieve_context(
+    request: ChatRequest, embeddings: EmbeddingsService, vector_db: VectorDBService
+) -> Tuple[List[dict], str]:
+    """Search the vector DB for the message and return (sources, formatted context)."""
+    if not request.use_rag:
+        return [], ""
+
+    # Generate embedding for query (coalesced with concurrent chats into one TEI call)
+    query_embedding = await embeddings.generate_embedding(request.message)
+
+    # Search vector database (coalesced with concurrent chats into one search_batch)
+    search_results = await vector_db.batched_search(
+        query_embedding=query_embedding, limit=request.limit
+    )
+
+    return search_results, format_context(search_results)
+
 
-    context_parts = []
-    for i, result in enumerate(search_results, 1):
-        content = result.get("payload", {}).get("content", "")
-        source_url = result.get("payload", {}).get("metadata", {}).get("sourceURL", "Unknown")
+async def prepare_chat(
+    request: ChatRequest,
+    db: AsyncSession,
+    embeddings: EmbeddingsService,
+    vector_db: VectorDBService,
+) -> Tuple[UUID, List[dict], str]:
+    """
+    Resolve the conversation and retrieve RAG context concurrently.
+
+    The conversation lookup and the embedding + vector search have no data
+    dependency and hit different backends, so the DB round-trip is hidden
+    behind the embedding latency.
+
+    Returns:
+        (conversation_id, sources, context)
+    """
+    # return_exceptions lets both finish before anything is raised, so the
+    # session is never left mid-query when the other branch fails
+    conversation_result, context_result = await asyncio.gather(
+        get_or_create_conversation(request, db),
+        retrieve_context(request, embeddings, vector_db),
+        return_exceptions=True,
+    )
 
-        context_parts.append(f"Source {i} ({source_url}):\n{content}")
+    # A missing conversation (404) takes precedence over retrieval errors
+    if isinstance(conversation_result, BaseException):
+        raise conversation_result
+    if isinstance(context_result, BaseException):
+        raise context_result
 
-    return "\n\n".join(context_parts)
+    sources, context = context_result
+    return conversation_result, sources, context
+
+
+async def save_exchange(
+    db: AsyncSession,
+    conversation_id: UUID,
+    user_content: str,
+    received_at: datetime,
+    assistant_content: str,
+    sources: List[dict],
+) -> Message:
+    """
+    Insert the user and assistant messages in one round-trip.
+
+    RETURNING hands back the populated rows, so no refresh SELECT is needed.
+
+    Returns:
+        The assistant Message row
+    """
+    stmt = insert(Message).returning(Message, sort_by_parameter_order=True)
+    rows = await db.scalars(
+        stmt,
+        [
+            {
+                "conversation_id": conversation_id,
+                "role": "user",
+                "content": user_content,
+                "created_at": received_at,
+                "extra_data": {},
+                "sources": [],
+            },
+            {
+                "conversation_id": conversation_id,
+                "role": "assistant",
+                "content": assistant_content,
+                "created_at": datetime.now(timezone.utc),
+                "extra_data": {},
+                "sources": sources,
+            },
+        ],
+    )
+    return rows.all()[-1]
+
+
+async def _persist_reply(message_id: UUID, content: str) -> None:
+    """Write a streamed reply back to its assistant message in its own session."""
+    # The request-scoped session may already be closed when the stream ends
+    async with async_session_factory() as session:
+        await session.execute(
+            update(Message).where(Message.id == message_id).values(content=content)
+        )
+        await session.commit()
 
 
 # ============================================================================
@@ -104,86 +233,93 @@ async def chat(
 
     Flow:
     1. Get or create conversation
-    2. Save user message
-    3. If RAG enabled: search vector DB for context
-    4. Generate LLM response with context
-    5. Save assistant message with sources
-    6. Return response
+    2. If RAG enabled: search vector DB for context (concurrently with step 1)
+    3. Generate LLM response with context
+    4. Save user and assistant messages (single INSERT ... RETURNING)
+    5. Return response
     """
-    # Step 1: Get or create conversation
-    conversation_id: Optional[UUID] = request.conversation_id
-
-    if conversation_id:
-        # Verify conversation exists
-        result = await db.execute(select(Conversation).where(Conversation.id == conversation_id))
-        conversation = result.scalar_one_or_none()
-
-        if not conversation:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Conversation {conversation_id} not found",
-            )
-    else:
-        # Create new conversation
-        title = generate_conversation_title(request.message)
-        conversation = Conversation(title=title, space="default")
-        db.add(conversation)
-        await db.flush()  # Get ID
-        # Cast to UUID since after flush, the id is populated and is a UUID instance
-        # mypy sees conversation.id as Column[UUID], but at runtime it's an actual UUID
-        conversation_id = cast(UUID, conversation.id)
-
-    # Step 2: Save user message
-    user_message = Message(
-        conversation_id=conversation_id,
-        role="user",
-        content=request.message,
-        extra_data={},
-        sources=[],
-    )
-    db.add(user_message)
-    await db.flush()
+    # Timestamp the user message on receipt so it sorts before the reply
+    received_at = datetime.now(timezone.utc)
 
-    # Step 3: RAG - Search for context if enabled
-    sources = []
-    context = ""
+    # Steps 1-2: Get or create conversation while searching for RAG context
+    conversation_id, sources, context = await prepare_chat(request, db, embeddings, vector_db)
 
-    if request.use_rag:
-        # Generate embedding for query (using injected service)
-        query_embedding = await embeddings.generate_embedding(request.message)
-
-        # Search vector database (using injected service)
-        search_results = await vector_db.search(
-            query_embedding=query_embedding, limit=request.limit
-        )
-
-        sources = search_results
-        context = format_context(search_results)
-
-    # Step 4: Generate LLM response (using injected service)
+    # Step 3: Generate LLM response (using injected service)
     llm_response = await llm.generate_response(query=request.message, context=context)
 
-    # Step 5: Save assistant message with sources
-    assistant_message = Message(
-        conversation_id=conversation_id,
-        role="assistant",
-        content=llm_response,
-        extra_data={},
-        sources=sources,
+    # Step 4: Save user and assistant messages in one round-trip
+    assistant_message = await save_exchange(
+        db, conversation_id, request.message, received_at, llm_response, sources
     )
-    db.add(assistant_message)
     await db.commit()
-    await db.refresh(assistant_message)
 
-    # Step 6: Return response
+    # Step 5: Return response
     # Use model_validate to properly convert ORM model to Pydantic model
     message_response = MessageResponse.model_validate(assistant_message)
 
-    # Ensure conversation_id is not None for the response
-    if conversation_id is None:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Conversation ID should not be None at this point",
-        )
+    return model_response(
+        ChatResponse(conversation_id=conversation_id, message=message_response, sources=sources)
+    )
 
-    return ChatResponse(conversation_id=conversation_id, message=message_response, sources=sources)
+
+@router.post("/stream")
+async def chat_stream(
+    request: ChatRequest,
+    db: AsyncSession = Depends(get_session),
+    embeddings: EmbeddingsService = Depends(get_embeddings_service),
+    vector_db: VectorDBService = Depends(get_vector_db_service),
+    llm: LLMService = Depends(get_llm_service),
+) -> StreamingResponse:
+    """
+    Chat with RAG, streaming the assistant reply as Server-Sent Events.
+
+    Same flow as chat(), except the assistant message is saved up front with
+    empty content, tokens are forwarded as the LLM produces them, and the
+    full text is written back with a single UPDATE when generation ends.
+
+    Events (``data: <json>`` frames):
+    - ``{"type": "start", "conversation_id", "message_id", "sources"}``
+    - ``{"type": "token", "content"}`` for each generated fragment
+    - ``{"type": "error", "error"}`` if generation fails part-way
+    - ``[DONE]`` once the reply has been persisted
+    """
+    received_at = datetime.now(timezone.utc)
+
+    conversation_id, sources, context = await prepare_chat(request, db, embeddings, vector_db)
+
+    assistant_message = await save_exchange(
+        db, conversation_id, request.message, received_at, "", sources
+    )
+    assistant_id = cast(UUID, assistant_message.id)
+    await db.commit()
+
+    async def event_stream() -> AsyncIterator[str]:
+        fragments: List[str] = []
+        yield sse_event(
+            {
+                "type": "start",
+                "conversation_id": conversation_id,
+                "message_id": assistant_id,
+                "sources": sources,
+            }
+        )
+        try:
+            async for fragment in llm.stream_response(query=request.message, context=context):
+                fragments.append(fragment)
+                yield sse_event({"type": "token", "content": fragment})
+        except Exception as e:
+            logger.error(f"❌ Chat stream failed for conversation {conversation_id}: {e}")
+            yield sse_event({"type": "error", "error": "Failed to generate response"})
+        finally:
+            # Persist whatever was generated, even if the client went away: a
+            # disconnect cancels the response task group, so shield the write
+            with anyio.CancelScope(shield=True):
+                await _persist_reply(assistant_id, "".join(fragments))
+
+        yield "data: [DONE]\n\n"
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"},
+    )
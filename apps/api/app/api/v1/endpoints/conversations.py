@@ -4,18 +4,27 @@ Conversation management API endpoints.
 Provides CRUD operations for conversations and messages.
 """
 
-from typing import List, Optional
+from typing import List, Optional, Tuple, cast
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, and_, desc
-from pydantic import BaseModel, ConfigDict, Field
+from sqlalchemy import select, func, and_, or_, desc, insert, delete
+from sqlalchemy.orm import raiseload, selectinload
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 from datetime import datetime
 
+from app.core.responses import model_response
+from app.db.conversations import (
+    conversation_exists,
+    get_conversation_or_404,
+    get_conversation_with_count_or_404,
+    raise_conversation_not_found,
+)
 from app.db.database import get_session
 from app.db.models import Conversation, Message, ConversationTag
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 
 
 # ============================================================================
@@ -50,6 +59,7 @@ class ConversationCreate(BaseModel):
 
     title: str
     space: Optional[str] = "default"
+    tags: List[str] = Field(default_factory=list)
     initial_message: Optional[MessageCreate] = None
 
 
@@ -69,9 +79,11 @@ class ConversationResponse(BaseModel):
 
 
 class ConversationDetail(ConversationResponse):
-    """Response model for detailed conversation with messages."""
+    """Response model for detailed conversation with a page of messages."""
 
     messages: List[MessageResponse]
+    # Pass as ``before`` to fetch the next (older) page; None on the oldest page
+    next_cursor: Optional[str] = None
 
     model_config = ConfigDict(from_attributes=True)
 
@@ -83,30 +95,52 @@ class ConversationUpdate(BaseModel):
     tags: Optional[List[str]] = None
 
 
+# Validates a whole page of ORM messages in one pydantic-core call
+MESSAGE_LIST_ADAPTER = TypeAdapter(List[MessageResponse])
+
+
 # ============================================================================
 # Helper Functions
 # ============================================================================
 
 
-async def get_conversation_or_404(conversation_id: UUID, db: AsyncSession) -> Conversation:
-    """Get conversation by ID or raise 404."""
-    result = await db.execute(select(Conversation).where(Conversation.id == conversation_id))
-    conversation = result.scalar_one_or_none()
+def encode_message_cursor(message: Message) -> str:
+    """Cursor pointing just past ``message``: its timestamp plus its ID as tie-breaker."""
+    return f"{message.created_at.isoformat()}|{message.id}"
 
-    if not conversation:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Conversation {conversation_id} not found",
-        )
 
-    return conversation
+def decode_message_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    """Parse a cursor from ``encode_message_cursor``, rejecting malformed ones with 400."""
+    created_at, _, message_id = cursor.rpartition("|")
+    try:
+        return datetime.fromisoformat(created_at), UUID(message_id)
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+
+
+async def insert_tags(db: AsyncSession, conversation_id: UUID, tag_names: List[str]) -> None:
+    """Insert tags for a conversation as one executemany INSERT (no-op when empty)."""
+    if tag_names:
+        await db.execute(
+            insert(ConversationTag),
+            [{"conversation_id": conversation_id, "tag": tag_name} for tag_name in tag_names],
+        )
 
 
 def build_conversation_response(
-    conversation: Conversation, message_count: int = 0, last_message: Optional[str] = None
+    conversation: Conversation,
+    message_count: int = 0,
+    last_message: Optional[str] = None,
+    tags: Optional[List[str]] = None,
 ) -> ConversationResponse:
-    """Build conversation response with computed fields."""
-    tags = [tag.tag for tag in conversation.tags]
+    """
+    Build conversation response with computed fields.
+
+    ``tags`` overrides the loaded tag collection when the caller has just
+    written tags without reloading the conversation.
+    """
+    if tags is None:
+        tags = list(conversation.tag_names)
 
     return ConversationResponse.model_validate(
         {
@@ -132,12 +166,15 @@ async def create_conversation(data: ConversationCreate, db: AsyncSession = Depen
     """
     Create a new conversation.
 
-    Optionally include an initial message.
+    Optionally include tags and an initial message.
     """
     # Create conversation
     conversation = Conversation(title=data.title, space=data.space)
     db.add(conversation)
-    await db.flush()  # Get ID before adding message
+    await db.flush()  # Get ID before adding tags and message
+
+    tag_names = list(dict.fromkeys(data.tags))  # tag is part of the PK
+    await insert_tags(db, cast(UUID, conversation.id), tag_names)
 
     # Add initial message if provided
     message_count = 0
@@ -157,7 +194,7 @@ async def create_conversation(data: ConversationCreate, db: AsyncSession = Depen
     await db.commit()
     await db.refresh(conversation)
 
-    return build_conversation_response(conversation, message_count, last_message)
+    return build_conversation_response(conversation, message_count, last_message, tags=tag_names)
 
 
 @router.get("/", response_model=List[ConversationResponse])
@@ -176,60 +213,44 @@ async def list_conversations(
     - **limit**: Maximum number of results (default: 50)
     - **offset**: Number of results to skip (default: 0)
     """
-    # Build base query with filters
-    conv_query = select(Conversation)
+    # Build base query with filters. Tags for the whole page arrive in one
+    # IN-query; messages are summarised by the stats subquery below instead.
+    conv_query = select(Conversation).options(
+        selectinload(Conversation.tags),
+        raiseload(Conversation.messages),
+    )
 
     # Apply filters
     if space:
         conv_query = conv_query.where(Conversation.space == space)
 
     if tag:
-        conv_query = conv_query.join(ConversationTag).where(ConversationTag.tag == tag)
-
-    # Count total messages per conversation (subquery)
-    msg_count_subquery = (
-        select(
-            Message.conversation_id,
-            func.count(Message.id).label("msg_count"),
-        )
-        .group_by(Message.conversation_id)
-        .correlate(Conversation)
-        .subquery()
-    )
-
-    # Get last message per conversation (subquery with row_number)
-    last_msg_subquery = (
-        select(
-            Message.conversation_id,
-            Message.content.label("last_content"),
-            func.row_number()
-            .over(
-                partition_by=Message.conversation_id,
-                order_by=desc(Message.created_at),
-            )
-            .label("rn"),
-        )
-        .correlate(Conversation)
-        .subquery()
-    )
-
-    # Main query with joins to aggregates
-    conv_query = (
-        conv_query.outerjoin(
-            msg_count_subquery,
-            Conversation.id == msg_count_subquery.c.conversation_id,
-        )
-        .outerjoin(
-            last_msg_subquery,
-            and_(
-                Conversation.id == last_msg_subquery.c.conversation_id,
-                last_msg_subquery.c.rn == 1,
-            ),
-        )
-        .add_columns(
-            msg_count_subquery.c.msg_count,
-            last_msg_subquery.c.last_content,
+        conv_query = conv_query.where(Conversation.tags.any(ConversationTag.tag == tag))
+
+    # Single pass over messages: per-conversation count and latest content.
+    # Both window functions share one partition, so messages is scanned once.
+    msg_stats_subquery = select(
+        Message.conversation_id,
+        Message.content.label("last_content"),
+        func.count().over(partition_by=Message.conversation_id).label("msg_count"),
+        func.row_number()
+        .over(
+            partition_by=Message.conversation_id,
+            order_by=desc(Message.created_at),
         )
+        .label("rn"),
+    ).subquery()
+
+    # Main query with a single join to the per-conversation stats row
+    conv_query = conv_query.outerjoin(
+        msg_stats_subquery,
+        and_(
+            Conversation.id == msg_stats_subquery.c.conversation_id,
+            msg_stats_subquery.c.rn == 1,
+        ),
+    ).add_columns(
+        msg_stats_subquery.c.msg_count,
+        msg_stats_subquery.c.last_content,
     )
 
     # Apply pagination and ordering
@@ -246,41 +267,70 @@ async def list_conversations(
         last_msg_content: Optional[str] = last_content
         responses.append(build_conversation_response(conversation, msg_count_int, last_msg_content))
 
-    return responses
+    return model_response(responses)
 
 
 @router.get("/{conversation_id}", response_model=ConversationDetail)
-async def get_conversation(conversation_id: UUID, db: AsyncSession = Depends(get_session)):
+async def get_conversation(
+    conversation_id: UUID,
+    limit: Optional[int] = Query(None, ge=1, le=500),
+    before: Optional[str] = None,
+    db: AsyncSession = Depends(get_session),
+):
     """
-    Get a single conversation with all messages.
+    Get a single conversation with its messages, optionally one page at a time.
+
+    - **limit**: Maximum number of messages to return, newest first
+      (default: all messages)
+    - **before**: Only return messages older than this cursor
+      (use the previous response's ``next_cursor`` to scroll back)
+
+    Messages within the page are returned oldest first.
     """
-    conversation = await get_conversation_or_404(conversation_id, db)
+    conversation, message_count, last_preview = await get_conversation_with_count_or_404(
+        conversation_id, db, with_last_message=True
+    )
 
-    # Get messages
-    messages_result = await db.execute(
+    # Newest messages first; the ID breaks ties between messages saved in the
+    # same instant (e.g. both halves of an exchange) so pages never skip rows
+    messages_query = (
         select(Message)
         .where(Message.conversation_id == conversation_id)
-        .order_by(Message.created_at.asc())
+        .order_by(desc(Message.created_at), desc(Message.id))
     )
-    messages = messages_result.scalars().all()
+    if before is not None:
+        before_created_at, before_id = decode_message_cursor(before)
+        messages_query = messages_query.where(
+            or_(
+                Message.created_at < before_created_at,
+                and_(Message.created_at == before_created_at, Message.id < before_id),
+            )
+        )
+    if limit is not None:
+        # One extra row tells whether an older page exists
+        messages_query = messages_query.limit(limit + 1)
 
-    # Build response
-    tags = [tag.tag for tag in conversation.tags]
-    last_preview: Optional[str] = messages[-1].content if messages else None
+    page = list((await db.scalars(messages_query)).all())
+    has_more = limit is not None and len(page) > limit
+    if has_more:
+        page = page[:limit]
+    page.reverse()
 
-    return ConversationDetail.model_validate(
+    detail = ConversationDetail.model_validate(
         {
             "id": conversation.id,
             "title": conversation.title,
             "space": conversation.space,
             "created_at": conversation.created_at,
             "updated_at": conversation.updated_at,
-            "tags": tags,
-            "message_count": len(messages),
+            "tags": list(conversation.tag_names),
+            "message_count": message_count,
             "last_message_preview": last_preview,
-            "messages": [MessageResponse.model_validate(m) for m in messages],
+            "messages": MESSAGE_LIST_ADAPTER.validate_python(page, from_attributes=True),
+            "next_cursor": encode_message_cursor(page[0]) if has_more else None,
         }
     )
+    return model_response(detail)
 
 
 @router.put("/{conversation_id}", response_model=ConversationResponse)
@@ -290,7 +340,9 @@ async def update_conversation(
     """
     Update conversation title and/or tags.
     """
-    conversation = await get_conversation_or_404(conversation_id, db)
+    # Message count comes with the conversation, so no COUNT is needed after the write
+    conversation, msg_count, _ = await get_conversation_with_count_or_404(conversation_id, db)
+    tags: Optional[List[str]] = None
 
     # Update title if provided
     if data.title is not None:
@@ -298,26 +350,27 @@ async def update_conversation(
 
     # Update tags if provided
     if data.tags is not None:
-        # Remove existing tags
-        for tag in conversation.tags:
-            await db.delete(tag)
-
-        # Add new tags
-        for tag_name in data.tags:
-            tag = ConversationTag(conversation_id=conversation.id, tag=tag_name)
-            db.add(tag)
+        # Write only the difference between the stored and requested tag sets
+        current_tags = set(conversation.tag_names)
+        requested_tags = list(dict.fromkeys(data.tags))  # tag is part of the PK
+        removed_tags = current_tags.difference(requested_tags)
+        added_tags = [tag_name for tag_name in requested_tags if tag_name not in current_tags]
+
+        if removed_tags:
+            await db.execute(
+                delete(ConversationTag).where(
+                    ConversationTag.conversation_id == conversation.id,
+                    ConversationTag.tag.in_(removed_tags),
+                )
+            )
+        await insert_tags(db, cast(UUID, conversation.id), added_tags)
+        tags = requested_tags
 
+    # expire_on_commit is off and updated_at is computed client-side, so the
+    # in-memory conversation is already current without a refresh
     await db.commit()
-    await db.refresh(conversation)
-
-    # Get message count
-    msg_count_result = await db.execute(
-        select(func.count()).select_from(Message).where(Message.conversation_id == conversation.id)
-    )
-    msg_count = msg_count_result.scalar()
-    msg_count_int: int = msg_count or 0  # Handle None case
 
-    return build_conversation_response(conversation, msg_count_int)
+    return build_conversation_response(conversation, msg_count, tags=tags)
 
 
 @router.delete("/{conversation_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -325,7 +378,10 @@ async def delete_conversation(conversation_id: UUID, db: AsyncSession = Depends(
     """
     Delete a conversation and all its messages.
     """
-    conversation = await get_conversation_or_404(conversation_id, db)
+    # ORM cascade needs both collections loaded to delete the children
+    conversation = await get_conversation_or_404(
+        conversation_id, db, load_tags=True, load_messages=True
+    )
 
     await db.delete(conversation)
     await db.commit()
@@ -342,18 +398,22 @@ async def add_message(
     """
     Add a message to a conversation.
     """
-    # Verify conversation exists
-    await get_conversation_or_404(conversation_id, db)
-
-    # Create message
-    message = Message(
-        conversation_id=conversation_id,
-        role=data.role,
-        content=data.content,
-        extra_data=data.extra_data,
+    # Verify conversation exists (SELECT 1, the row itself is not needed)
+    if not await conversation_exists(conversation_id, db):
+        raise_conversation_not_found(conversation_id)
+
+    # Create message; RETURNING populates id/created_at without a refresh SELECT
+    message = await db.scalar(
+        insert(Message).returning(Message),
+        {
+            "conversation_id": conversation_id,
+            "role": data.role,
+            "content": data.content,
+            "extra_data": data.extra_data,
+        },
     )
-    db.add(message)
     await db.commit()
-    await db.refresh(message)
 
-    return MessageResponse.model_validate(message)
+    return model_response(
+        MessageResponse.model_validate(message), status_code=status.HTTP_201_CREATED
+    )
@@ -3,15 +3,22 @@ Crawl management endpoints using Firecrawl v2 API.
 """
 
 import logging
+from httpx import TimeoutException
 from fastapi import APIRouter, HTTPException, BackgroundTasks, Depends
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, HttpUrl
 from typing import Optional, Dict, Any, List
 from app.services.firecrawl import FirecrawlService
 from app.core.config import settings
+from app.core.responses import model_response
 from app.dependencies import get_firecrawl_service
 
 logger = logging.getLogger(__name__)
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
+
+# Settings are fixed for the process lifetime, so build the callback URL once
+_WEBHOOK_URL = f"{settings.WEBHOOK_BASE_URL}/api/v1/webhooks/firecrawl"
+_TIMEOUT_DETAIL = "Firecrawl request timed out. Please try again."
 
 
 class CrawlRequest(BaseModel):
@@ -60,41 +67,25 @@ async def start_crawl(
     as pages are crawled. Each page will be automatically embedded and
     stored in Qdrant.
     """
+    url_str = str(request.url)
+
     try:
-        webhook_url = f"{settings.WEBHOOK_BASE_URL}/api/v1/webhooks/firecrawl"
-        
-        # Prepare crawl options
-        crawl_options: Dict[str, Any] = {
-            "url": str(request.url),
-            "webhook": webhook_url,
-        }
-        
+        # pydantic-core drops the unset optional fields; the field names
+        # already match Firecrawl's camelCase API
+        crawl_options: Dict[str, Any] = request.model_dump(
+            exclude_none=True, exclude={"url"}
+        ) | {"url": url_str, "webhook": _WEBHOOK_URL}
+
         logger.info(
-            f"🚀 Starting crawl: {request.url}",
+            f"🚀 Starting crawl: {url_str}",
             extra={
-                "crawl_url": str(request.url),
-                "webhook_url": webhook_url,
+                "crawl_url": url_str,
+                "webhook_url": _WEBHOOK_URL,
                 "max_depth": request.maxDiscoveryDepth,
                 "limit": request.limit,
             }
         )
 
-        # Add optional parameters
-        if request.includePaths:
-            crawl_options["includePaths"] = request.includePaths
-        if request.excludePaths:
-            crawl_options["excludePaths"] = request.excludePaths
-        if request.maxDiscoveryDepth is not None:
-            crawl_options["maxDiscoveryDepth"] = request.maxDiscoveryDepth
-        if request.limit is not None:
-            crawl_options["limit"] = request.limit
-        if request.crawlEntireDomain is not None:
-            crawl_options["crawlEntireDomain"] = request.crawlEntireDomain
-        if request.allowSubdomains is not None:
-            crawl_options["allowSubdomains"] = request.allowSubdomains
-        if request.scrapeOptions:
-            crawl_options["scrapeOptions"] = request.scrapeOptions
-
         # Start the crawl using singleton service
         result = await firecrawl_service.start_crawl(crawl_options)
 
@@ -106,6 +97,8 @@ async def start_crawl(
             "url": result["url"],
         }
 
+    except TimeoutException as e:
+        raise HTTPException(status_code=504, detail=_TIMEOUT_DETAIL) from e
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to start crawl: {str(e)}")
 
@@ -121,7 +114,10 @@ async def get_crawl_status(
     """
     try:
         status = await firecrawl_service.get_crawl_status(crawl_id)
-        return CrawlStatusResponse(**status)
+        # Validate once here, so a bad payload is reported as a status failure
+        return model_response(CrawlStatusResponse.model_validate(status))
+    except TimeoutException as e:
+        raise HTTPException(status_code=504, detail=_TIMEOUT_DETAIL) from e
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to get crawl status: {str(e)}")
 
@@ -134,5 +130,7 @@ async def cancel_crawl(
     try:
         await firecrawl_service.cancel_crawl(crawl_id)
         return {"success": True, "message": "Crawl cancelled successfully"}
+    except TimeoutException as e:
+        raise HTTPException(status_code=504, detail=_TIMEOUT_DETAIL) from e
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to cancel crawl: {str(e)}")
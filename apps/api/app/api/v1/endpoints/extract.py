@@ -3,24 +3,24 @@ Extract endpoint for structured data extraction using Firecrawl v2 API.
 """
 
 import asyncio
-import json
 import logging
 from typing import Any, Dict, List, Optional
 
-import aiohttp
-from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
+import httpx
+import orjson
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field, HttpUrl
 
+from app.core.work_queue import BoundedWorkQueue
 from app.services.firecrawl import FirecrawlService
 from app.services.document_processor import process_and_store_document
+from app.dependencies import get_firecrawl_service, get_ingestion_queue
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 logger = logging.getLogger(__name__)
 
-
-def get_firecrawl_service() -> FirecrawlService:
-    """Dependency provider for FirecrawlService."""
-    return FirecrawlService()
+_QUEUE_FULL_DETAIL = "Ingestion queue is full. Please retry shortly."
 
 
 class ExtractRequest(BaseModel):
@@ -41,15 +41,23 @@ class ExtractResponse(BaseModel):
 @router.post("/", response_model=ExtractResponse)
 async def extract_data(
     request: ExtractRequest,
-    background_tasks: BackgroundTasks,
     firecrawl_service: FirecrawlService = Depends(get_firecrawl_service),
+    ingestion_queue: BoundedWorkQueue = Depends(get_ingestion_queue),
 ):
     """
     Extract structured data from a webpage.
 
     Uses natural language or JSON schema to extract specific data.
-    Extracted data is automatically stored in the knowledge base via background task.
+    Extracted data is automatically stored in the knowledge base via the bounded
+    ingestion queue; when it is full the request is rejected with 429 before any
+    Firecrawl credits are spent. If it fills up while the extraction runs, the
+    data is still returned but not stored.
     """
+    if ingestion_queue.full():
+        raise HTTPException(status_code=429, detail=_QUEUE_FULL_DETAIL)
+
+    url_str = str(request.url)
+
     try:
         # Build scrapeOptions for Firecrawl v2 API
         scrape_options = {}
@@ -58,24 +66,31 @@ async def extract_data(
 
         # Firecrawl v2 API expects urls as array and formats under scrapeOptions
         result = await firecrawl_service.extract_data(
-            [str(request.url)],
+            [url_str],
             request.extraction_schema,
             {"scrapeOptions": scrape_options} if scrape_options else None,
         )
 
-        # Store extracted data in background
+        # Queue extracted data for ingestion after the response
         data = result.get("data", {})
 
         # Convert structured data to JSON string for embedding
-        content = json.dumps(data, indent=2)
-
-        background_tasks.add_task(
-            process_and_store_document,
-            content=content,
-            source_url=str(request.url),
-            metadata={"extraction_schema": request.extraction_schema, **data.get("metadata", {})},
-            source_type="extract",
-        )
+        content = orjson.dumps(data).decode()
+
+        try:
+            ingestion_queue.submit(
+                process_and_store_document,
+                content=content,
+                source_url=url_str,
+                metadata={
+                    "extraction_schema": request.extraction_schema,
+                    **data.get("metadata", {}),
+                },
+                source_type="extract",
+            )
+        except asyncio.QueueFull:
+            # The extraction is already paid for; return it even if it cannot be stored
+            logger.warning("Ingestion queue full, not storing extraction of %s", url_str)
 
         return {"success": True, "data": data}
 
@@ -83,13 +98,14 @@ async def extract_data(
         logger.exception("Validation error during extraction")
         raise HTTPException(status_code=400, detail=f"Invalid request: {str(e)}")
 
-    except asyncio.TimeoutError:
+    # TimeoutException is an HTTPError, so it must be caught first
+    except httpx.TimeoutException:
         logger.exception("Timeout error during extraction")
         raise HTTPException(
             status_code=504, detail="Extraction request timed out. Please try again."
         )
 
-    except aiohttp.ClientError:
+    except httpx.HTTPError:
         logger.exception("Network error during extraction")
         raise HTTPException(status_code=502, detail="Failed to connect to extraction service")
 
@@ -7,18 +7,22 @@ Provides REST API access to:
 - Entity search
 """
 
+import functools
 import time
 import logging
-from typing import List, Optional, Dict, Any
+from typing import Annotated, List, Optional, Dict, Any, Tuple
 from fastapi import APIRouter, Depends, HTTPException, Query
-from pydantic import BaseModel, Field
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, Field, StringConstraints
 
+from app.core.responses import model_response
 from app.services.hybrid_query import HybridQueryEngine
 from app.services.graph_db import GraphDBService
+from app.dependencies import get_graph_db_service
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 
 
 # ============================================================================
@@ -26,9 +30,8 @@ router = APIRouter()
 # ============================================================================
 
 
-# Global service instances
+# Global service instances (GraphDBService is the lifespan singleton from app.dependencies)
 _hybrid_query_engine: Optional[HybridQueryEngine] = None
-_graph_db_service: Optional[GraphDBService] = None
 
 
 def get_hybrid_query_engine() -> HybridQueryEngine:
@@ -44,17 +47,10 @@ def set_hybrid_query_engine(engine: HybridQueryEngine):
     _hybrid_query_engine = engine
 
 
-def get_graph_db_service() -> GraphDBService:
-    """Get GraphDBService instance (dependency injection)."""
-    if _graph_db_service is None:
-        raise RuntimeError("GraphDBService not initialized")
-    return _graph_db_service
-
-
-def set_graph_db_service(service: GraphDBService):
-    """Set GraphDBService instance."""
-    global _graph_db_service
-    _graph_db_service = service
+@functools.lru_cache(maxsize=512)
+def _parse_csv_filter(value: str) -> Tuple[str, ...]:
+    """Split a comma-separated query filter into stripped, non-empty parts (memoized)."""
+    return tuple(part for part in map(str.strip, value.split(",")) if part)
 
 
 # ============================================================================
@@ -65,7 +61,9 @@ def set_graph_db_service(service: GraphDBService):
 class GraphSearchRequest(BaseModel):
     """Request model for hybrid graph search."""
 
-    query: str = Field(..., min_length=1, description="Search query")
+    query: Annotated[str, StringConstraints(strip_whitespace=True, min_length=1)] = Field(
+        ..., description="Search query (surrounding whitespace is stripped)"
+    )
     vector_limit: int = Field(default=5, ge=1, le=50, description="Max vector search results")
     graph_depth: int = Field(default=2, ge=1, le=4, description="Graph traversal depth")
     rerank: bool = Field(default=True, description="Enable result reranking")
@@ -124,7 +122,7 @@ async def graph_search(
         Combined search results with execution metrics
 
     Raises:
-        HTTPException 400: Invalid query (empty or too short)
+        HTTPException 422: Empty or whitespace-only query (request validation)
         HTTPException 500: Service error during search
 
     Example:
@@ -136,13 +134,9 @@ async def graph_search(
             "rerank": true
         }
     """
-    # Validate query
-    if not request.query or not request.query.strip():
-        raise HTTPException(status_code=400, detail="Query cannot be empty")
-
     try:
         # Measure execution time
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
 
         # Perform hybrid search
         result = await hybrid_engine.hybrid_search(
@@ -152,23 +146,27 @@ async def graph_search(
             rerank=request.rerank,
         )
 
-        execution_time_ms = (time.time() - start_time) * 1000
+        execution_time_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
 
         # Extract combined results
         combined_results = result.get("combined_results", [])
         retrieval_strategy = result.get("retrieval_strategy", "unknown")
 
         logger.info(
-            f"Graph search completed: query='{request.query}', "
-            f"results={len(combined_results)}, time={execution_time_ms:.2f}ms, "
-            f"strategy={retrieval_strategy}"
+            "Graph search completed: query='%s', results=%d, time=%.2fms, strategy=%s",
+            request.query,
+            len(combined_results),
+            execution_time_ms,
+            retrieval_strategy,
         )
 
-        return GraphSearchResponse(
-            results=combined_results,
-            total=len(combined_results),
-            execution_time_ms=execution_time_ms,
-            retrieval_strategy=retrieval_strategy,
+        return model_response(
+            GraphSearchResponse(
+                results=combined_results,
+                total=len(combined_results),
+                execution_time_ms=execution_time_ms,
+                retrieval_strategy=retrieval_strategy,
+            )
         )
 
     except Exception as e:
@@ -206,28 +204,33 @@ async def get_entity_connections(
         GET /api/v1/graph/entities/PERSON_Alice_Smith/connections?max_depth=2&relationship_types=WORKS_AT
     """
     try:
-        # Check if entity exists
-        entity = await graph_db.get_entity_by_id(entity_id)
-        if entity is None:
-            raise HTTPException(status_code=404, detail=f"Entity '{entity_id}' not found")
-
         # Parse relationship types filter
         rel_types_list: Optional[List[str]] = None
         if relationship_types:
-            rel_types_list = [rt.strip() for rt in relationship_types.split(",")]
+            rel_types_list = list(_parse_csv_filter(relationship_types)) or None
 
-        # Find connected entities
-        connections = await graph_db.find_connected_entities(
+        # Existence check and traversal in a single Neo4j round-trip
+        connections = await graph_db.get_entity_connections(
             entity_id=entity_id, max_depth=max_depth, relationship_types=rel_types_list
         )
+        if connections is None:
+            raise HTTPException(status_code=404, detail=f"Entity '{entity_id}' not found")
 
         logger.info(
-            f"Found {len(connections)} connections for entity '{entity_id}' "
-            f"(depth={max_depth}, filters={rel_types_list})"
+            "Found %d connections for entity '%s' (depth=%d, filters=%s)",
+            len(connections),
+            entity_id,
+            max_depth,
+            rel_types_list,
         )
 
-        return EntityConnectionsResponse(
-            entity_id=entity_id, connections=connections, depth=max_depth, total=len(connections)
+        return model_response(
+            EntityConnectionsResponse(
+                entity_id=entity_id,
+                connections=connections,
+                depth=max_depth,
+                total=len(connections),
+            )
         )
 
     except HTTPException:
@@ -269,17 +272,22 @@ async def search_entities(
         # Parse entity types filter
         types_list: Optional[List[str]] = None
         if entity_types:
-            types_list = [et.strip() for et in entity_types.split(",")]
+            types_list = list(_parse_csv_filter(entity_types)) or None
 
         # Search entities
         entities = await graph_db.search_entities(query=query, entity_types=types_list, limit=limit)
 
         logger.info(
-            f"Entity search: query='{query}', types={types_list}, "
-            f"limit={limit}, found={len(entities)}"
+            "Entity search: query='%s', types=%s, limit=%d, found=%d",
+            query,
+            types_list,
+            limit,
+            len(entities),
         )
 
-        return EntitySearchResponse(entities=entities, total=len(entities), query=query)
+        return model_response(
+            EntitySearchResponse(entities=entities, total=len(entities), query=query)
+        )
 
     except Exception as e:
         logger.error(f"Entity search error for query '{query}': {e}", exc_info=True)
@@ -2,13 +2,14 @@
 Map endpoint for getting all URLs from a website using Firecrawl v2 API.
 """
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, HttpUrl
 from typing import Optional, List, Dict, Any
 from app.services.firecrawl import FirecrawlService
+from app.dependencies import get_firecrawl_service
 
-router = APIRouter()
-firecrawl_service = FirecrawlService()
+router = APIRouter(default_response_class=ORJSONResponse)
 
 
 class MapRequest(BaseModel):
@@ -28,11 +29,13 @@ class MapResponse(BaseModel):
 
 
 @router.post("/", response_model=MapResponse)
-async def map_website(request: MapRequest):
+async def map_website(
+    request: MapRequest, firecrawl_service: FirecrawlService = Depends(get_firecrawl_service)
+):
     """
     Map a website to get all URLs.
 
-    Returns a list of all URLs found on the website.
+    Returns a list of all unique URLs found on the website, in discovery order.
     """
     try:
         options: Dict[str, Any] = {}
@@ -43,11 +46,18 @@ async def map_website(request: MapRequest):
 
         result = await firecrawl_service.map_url(str(request.url), options)
 
-        # Extract URL strings from link objects
-        links = result.get("links", [])
-        urls = [link["url"] if isinstance(link, dict) else link for link in links]
-
-        return {"success": True, "urls": urls, "total": len(urls)}
+        # v2 returns link objects, v1 plain strings; a response is never mixed,
+        # so sniff the first entry instead of checking every link.
+        # Firecrawl repeats URLs linked from several anchors; dict.fromkeys
+        # drops them in one pass while keeping the original order.
+        links = result.get("links") or []
+        if links and isinstance(links[0], dict):
+            urls = list(dict.fromkeys(link["url"] for link in links))
+        else:
+            urls = list(dict.fromkeys(links))
+
+        # A Response skips FastAPI re-validating the body against response_model
+        return ORJSONResponse({"success": True, "urls": urls, "total": len(urls)})
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to map website: {str(e)}")
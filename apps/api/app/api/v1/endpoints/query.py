@@ -2,15 +2,38 @@
 RAG query endpoints for semantic search and LLM-powered responses.
 """
 
+import logging
+import orjson
 from fastapi import APIRouter, HTTPException, Depends
-from pydantic import BaseModel
-from typing import List, Dict, Any, Optional
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import BaseModel, Field
+from typing import AsyncIterator, Hashable, List, Dict, Any, Optional
+from app.core.config import settings
+from app.core.responses import sse_event
 from app.services.embeddings import EmbeddingsService
 from app.services.vector_db import VectorDBService
 from app.services.llm import LLMService
-from app.dependencies import get_embeddings_service, get_vector_db_service, get_llm_service
+from app.services.query_cache import QueryCache
+from app.services.semantic_cache import SemanticQueryCache
+from app.dependencies import (
+    get_embeddings_service,
+    get_vector_db_service,
+    get_llm_service,
+    get_query_cache,
+    get_semantic_cache,
+)
 
-router = APIRouter()
+logger = logging.getLogger(__name__)
+
+router = APIRouter(default_response_class=ORJSONResponse)
+
+# LLM context budget. No tokenizer for the Ollama model is available here, so
+# tokens are approximated at ~4 characters each.
+MAX_CONTEXT_TOKENS = 2048
+CHARS_PER_TOKEN = 4
+
+# Returned instead of an LLM answer when retrieval found nothing relevant
+INSUFFICIENT_CONTEXT_RESPONSE = "Insufficient context to answer confidently."
 
 
 class QueryRequest(BaseModel):
@@ -23,6 +46,15 @@ class QueryRequest(BaseModel):
     filters: Optional[Dict[str, Any]] = None
 
 
+class BatchQueryRequest(BaseModel):
+    """Request model for running several retrieval-only queries at once."""
+
+    queries: List[str] = Field(..., min_length=1, max_length=64)
+    limit: int = 5
+    score_threshold: Optional[float] = 0.5
+    filters: Optional[Dict[str, Any]] = None
+
+
 class SearchResult(BaseModel):
     """Individual search result."""
 
@@ -41,70 +73,279 @@ class QueryResponse(BaseModel):
     total_results: int
 
 
+class BatchQueryResponse(BaseModel):
+    """Response model for batch queries, one entry per input query in order."""
+
+    responses: List[QueryResponse]
+
+
+def to_search_results(search_results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Convert vector search hits into SearchResult-shaped dicts with truncated content.
+
+    Endpoints return these inside an ORJSONResponse, so no SearchResult models
+    are built or re-validated; ``response_model`` still documents the schema.
+    """
+    return [
+        {
+            "id": str(result["id"]),
+            "score": result["score"],
+            "content": result["content"][:500],  # Truncate for response
+            "metadata": result["metadata"],
+        }
+        for result in search_results
+    ]
+
+
+def semantic_cache_params(request: QueryRequest) -> Hashable:
+    """
+    Build the semantic cache parameter key for a query's search settings.
+
+    Filters may nest dicts and lists, so they are keyed by their canonical
+    (sorted-key) orjson encoding rather than by the unhashable dict itself.
+    """
+    filters_key = None
+    if request.filters:
+        filters_key = orjson.dumps(request.filters, option=orjson.OPT_SORT_KEYS)
+    return (request.limit, request.score_threshold, filters_key)
+
+
+def has_confident_context(search_results: List[Dict[str, Any]]) -> bool:
+    """Check the best hit (results are sorted by score) clears MIN_LLM_SCORE."""
+    return bool(search_results) and search_results[0]["score"] >= settings.MIN_LLM_SCORE
+
+
+def build_llm_context(
+    search_results: List[Dict[str, Any]],
+    max_chars: int = MAX_CONTEXT_TOKENS * CHARS_PER_TOKEN,
+) -> str:
+    """
+    Join search hits (best first) into an LLM context of at most ``max_chars``.
+
+    Sources are added until the budget is spent; the last one is truncated to
+    fit rather than dropped, so a single very long document cannot push the
+    prompt past the model's window.
+    """
+    parts: List[str] = []
+    remaining = max_chars
+    for result in search_results:
+        header = "[Source: " + str(result["metadata"].get("sourceURL") or "Unknown") + "]\n"
+        budget = remaining - len(header)
+        if budget <= 0:
+            break
+        part = header + result["content"][:budget]
+        parts.append(part)
+        remaining -= len(part) + 2  # "\n\n" separator
+    return "\n\n".join(parts)
+
+
+async def retrieve(
+    request: QueryRequest,
+    embeddings: EmbeddingsService,
+    vector_db: VectorDBService,
+    query_cache: QueryCache,
+    semantic_cache: SemanticQueryCache,
+) -> List[Dict[str, Any]]:
+    """
+    Find the vector search hits for a query, going through the semantic cache.
+
+    Steps:
+    1. Check the semantic cache for this exact query (skips embedding and search)
+    2. Generate embedding for the query
+    3. Check the semantic cache for a near-identical query (skips search)
+    4. Search vector database for relevant documents
+
+    Cached results are only reused for identical limit, score threshold and filters.
+    """
+    # The revision ties semantic cache entries to QueryCache invalidation
+    revision = None
+    if semantic_cache.enabled:
+        revision = await query_cache.current_revision(vector_db.collection_name)
+    cache_params = semantic_cache_params(request)
+
+    if revision is not None:
+        search_results = semantic_cache.get(request.query, cache_params, revision)
+        if search_results is not None:
+            return search_results
+
+    # Generate query embedding
+    query_embedding = await embeddings.generate_embedding(request.query)
+
+    if revision is not None:
+        search_results = semantic_cache.get_similar(query_embedding, cache_params, revision)
+        if search_results is not None:
+            return search_results
+
+    # Search vector database (with caching)
+    search_results = await vector_db.search(
+        query_embedding=query_embedding,
+        limit=request.limit,
+        score_threshold=request.score_threshold,
+        filters=request.filters,
+        query_text=request.query,  # Pass query text for cache key generation
+    )
+
+    if revision is not None:
+        semantic_cache.put(request.query, cache_params, revision, query_embedding, search_results)
+
+    return search_results
+
+
 @router.post("/", response_model=QueryResponse)
 async def query_knowledge_base(
     request: QueryRequest,
     embeddings: EmbeddingsService = Depends(get_embeddings_service),
     vector_db: VectorDBService = Depends(get_vector_db_service),
     llm: LLMService = Depends(get_llm_service),
+    query_cache: QueryCache = Depends(get_query_cache),
+    semantic_cache: SemanticQueryCache = Depends(get_semantic_cache),
 ):
     """
     Query the knowledge base using semantic search and optional LLM generation.
 
-    Steps:
-    1. Generate embedding for the query
-    2. Search vector database for relevant documents
-    3. (Optional) Use LLM to generate a response based on retrieved context
+    Retrieval goes through retrieve() (semantic cache, embedding, vector
+    search); if requested, the LLM then answers from the retrieved context.
+    When the best hit scores below MIN_LLM_SCORE the LLM is not called and
+    a fixed "insufficient context" answer is returned instead.
     """
     try:
-        # Generate query embedding
-        query_embedding = await embeddings.generate_embedding(request.query)
-
-        # Search vector database (with caching)
-        search_results = await vector_db.search(
-            query_embedding=query_embedding,
-            limit=request.limit,
-            score_threshold=request.score_threshold,
-            filters=request.filters,
-            query_text=request.query,  # Pass query text for cache key generation
-        )
+        search_results = await retrieve(request, embeddings, vector_db, query_cache, semantic_cache)
 
         # Convert to response format
-        results = [
-            SearchResult(
-                id=str(result["id"]),
-                score=result["score"],
-                content=result["content"][:500],  # Truncate for response
-                metadata=result["metadata"],
-            )
-            for result in search_results
-        ]
+        results = to_search_results(search_results)
 
         # Generate LLM response if requested
         llm_response = None
         if request.use_llm and search_results:
-            context = "\n\n".join(
-                [
-                    f"[Source: {r['metadata'].get('sourceURL', 'Unknown')}]\n{r['content']}"
-                    for r in search_results[:3]
-                ]
-            )
-            llm_response = await llm.generate_response(
-                query=request.query,
-                context=context,
-            )
+            if has_confident_context(search_results):
+                context = build_llm_context(search_results)
+                llm_response = await llm.generate_response(
+                    query=request.query,
+                    context=context,
+                )
+            else:
+                llm_response = INSUFFICIENT_CONTEXT_RESPONSE
 
-        return QueryResponse(
-            query=request.query,
-            results=results,
-            llm_response=llm_response,
-            total_results=len(results),
+        return ORJSONResponse(
+            {
+                "query": request.query,
+                "results": results,
+                "llm_response": llm_response,
+                "total_results": len(results),
+            }
         )
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Query failed: {str(e)}")
 
 
+@router.post("/stream")
+async def query_knowledge_base_stream(
+    request: QueryRequest,
+    embeddings: EmbeddingsService = Depends(get_embeddings_service),
+    vector_db: VectorDBService = Depends(get_vector_db_service),
+    llm: LLMService = Depends(get_llm_service),
+    query_cache: QueryCache = Depends(get_query_cache),
+    semantic_cache: SemanticQueryCache = Depends(get_semantic_cache),
+) -> StreamingResponse:
+    """
+    Query the knowledge base, streaming the LLM answer as Server-Sent Events.
+
+    Retrieval runs before the response starts, so search failures still
+    return a 500. The results are sent as the first event and the answer is
+    forwarded token by token as the LLM produces it. Low-confidence retrieval
+    gets the same fixed answer as /query, sent as a single token event.
+
+    Events (``data: <json>`` frames):
+    - ``{"type": "results", "query", "results", "total_results"}``
+    - ``{"type": "token", "content"}`` for each generated fragment
+    - ``{"type": "error", "error"}`` if generation fails part-way
+    - ``[DONE]`` at the end of the stream
+    """
+    try:
+        search_results = await retrieve(request, embeddings, vector_db, query_cache, semantic_cache)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Query failed: {str(e)}")
+
+    results = to_search_results(search_results)
+
+    async def event_stream() -> AsyncIterator[str]:
+        yield sse_event(
+            {
+                "type": "results",
+                "query": request.query,
+                "results": results,
+                "total_results": len(results),
+            }
+        )
+        if request.use_llm and search_results and not has_confident_context(search_results):
+            yield sse_event({"type": "token", "content": INSUFFICIENT_CONTEXT_RESPONSE})
+        elif request.use_llm and search_results:
+            context = build_llm_context(search_results)
+            try:
+                async for fragment in llm.stream_response(query=request.query, context=context):
+                    yield sse_event({"type": "token", "content": fragment})
+            except Exception as e:
+                logger.error(f"❌ Query stream failed: {e}")
+                yield sse_event({"type": "error", "error": str(e)})
+
+        yield "data: [DONE]\n\n"
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"},
+    )
+
+
+@router.post("/batch", response_model=BatchQueryResponse)
+async def batch_query_knowledge_base(
+    request: BatchQueryRequest,
+    embeddings: EmbeddingsService = Depends(get_embeddings_service),
+    vector_db: VectorDBService = Depends(get_vector_db_service),
+):
+    """
+    Run up to 64 retrieval-only queries in one round-trip each to TEI and Qdrant.
+
+    Duplicate queries are embedded and searched once. All unique queries are
+    embedded in a single TEI call and searched in a single Qdrant search_batch
+    request. No LLM response is generated.
+    """
+    try:
+        unique_queries = list(dict.fromkeys(request.queries))
+        query_embeddings = await embeddings.generate_embeddings(unique_queries)
+
+        batch_results = await vector_db.search_batch(
+            [
+                {
+                    "query_embedding": query_embedding,
+                    "limit": request.limit,
+                    "score_threshold": request.score_threshold,
+                    "filters": request.filters,
+                }
+                for query_embedding in query_embeddings
+            ]
+        )
+        results_by_query = dict(zip(unique_queries, batch_results))
+
+        responses = []
+        for query in request.queries:
+            results = to_search_results(results_by_query[query])
+            responses.append(
+                {
+                    "query": query,
+                    "results": results,
+                    "llm_response": None,
+                    "total_results": len(results),
+                }
+            )
+
+        return ORJSONResponse({"responses": responses})
+
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Batch query failed: {str(e)}")
+
+
 @router.get("/collection/info")
 async def get_collection_info(vector_db: VectorDBService = Depends(get_vector_db_service)):
     """Get information about the vector database collection."""
@@ -2,30 +2,32 @@
 Scrape endpoint for single-page scraping using Firecrawl v2 API.
 """
 
+import asyncio
 import logging
-from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks
+from fastapi import APIRouter, HTTPException, Depends
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, HttpUrl, field_validator
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 from httpx import TimeoutException, HTTPStatusError
 
+from app.core.work_queue import BoundedWorkQueue
 from app.services.firecrawl import FirecrawlService
 from app.services.document_processor import process_and_store_document
+from app.dependencies import get_firecrawl_service, get_ingestion_queue
 
 logger = logging.getLogger(__name__)
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 
-# Valid Firecrawl formats according to their API
-VALID_FORMATS = {"markdown", "html", "rawHtml", "links", "screenshot"}
+_QUEUE_FULL_DETAIL = "Ingestion queue is full. Please retry shortly."
 
+# Valid Firecrawl formats according to their API
+VALID_FORMATS = frozenset({"markdown", "html", "rawHtml", "links", "screenshot"})
 
-def get_firecrawl_service() -> FirecrawlService:
-    """
-    Dependency injection provider for FirecrawlService.
+ScrapeKey = Tuple[str, Tuple[str, ...]]
 
-    Returns a new instance of FirecrawlService for each request.
-    This enables proper testing via dependency override.
-    """
-    return FirecrawlService()
+# Firecrawl scrapes currently running, keyed by (url, formats). Concurrent
+# requests for the same page share one call instead of each hitting Firecrawl.
+_inflight: Dict[ScrapeKey, "asyncio.Task[Dict[str, Any]]"] = {}
 
 
 class ScrapeRequest(BaseModel):
@@ -38,10 +40,10 @@ class ScrapeRequest(BaseModel):
     @classmethod
     def validate_formats(cls, v: Optional[List[str]]) -> Optional[List[str]]:
         """Validate that only allowed formats are used."""
-        if v is not None:
+        # Membership checks only; the invalid set is built just for the error message
+        if v and not all(fmt in VALID_FORMATS for fmt in v):
             invalid = set(v) - VALID_FORMATS
-            if invalid:
-                raise ValueError(f"Invalid formats: {invalid}. Valid formats are: {VALID_FORMATS}")
+            raise ValueError(f"Invalid formats: {invalid}. Valid formats are: {set(VALID_FORMATS)}")
         return v
 
 
@@ -52,47 +54,82 @@ class ScrapeResponse(BaseModel):
     data: Optional[Dict[str, Any]] = None
 
 
+async def _scrape_once(
+    firecrawl_service: FirecrawlService, url_str: str, formats: Optional[List[str]]
+) -> Tuple[Dict[str, Any], bool]:
+    """
+    Scrape a URL, joining an identical scrape that is already in flight.
+
+    Returns:
+        Tuple of (Firecrawl result, whether this call started the scrape)
+    """
+    key: ScrapeKey = (url_str, tuple(sorted(formats or ())))
+    task = _inflight.get(key)
+    started = task is None
+    if task is None:
+        task = asyncio.create_task(firecrawl_service.scrape_url(url_str, {"formats": formats}))
+        _inflight[key] = task
+        task.add_done_callback(lambda _: _inflight.pop(key, None))
+
+    # Shield so one client disconnecting does not cancel the scrape for the others
+    return await asyncio.shield(task), started
+
+
 @router.post("/", response_model=ScrapeResponse)
 async def scrape_url(
     request: ScrapeRequest,
-    background_tasks: BackgroundTasks,
     firecrawl_service: FirecrawlService = Depends(get_firecrawl_service),
+    ingestion_queue: BoundedWorkQueue = Depends(get_ingestion_queue),
 ):
     """
     Scrape a single URL and return its content.
 
-    Content is automatically stored in the knowledge base via background task.
+    Content is automatically stored in the knowledge base via the bounded
+    ingestion queue; when it is full the request is rejected with 429 before
+    any Firecrawl credits are spent. If the queue fills up while the scrape runs,
+    the content is still returned but not stored. Concurrent requests for the same URL and
+    formats share a single Firecrawl call, and only the first of them stores
+    the content.
     """
-    try:
-        # Simplified: formats always has a value (either provided or default)
-        options = {"formats": request.formats}
+    if ingestion_queue.full():
+        raise HTTPException(status_code=429, detail=_QUEUE_FULL_DETAIL)
 
-        result = await firecrawl_service.scrape_url(str(request.url), options)
+    url_str = str(request.url)
 
-        # Store in background if successful
-        if result.get("success"):
+    try:
+        result, started = await _scrape_once(firecrawl_service, url_str, request.formats)
+
+        # Queue for ingestion after the response if successful
+        if started and result.get("success"):
             data = result.get("data", {})
             content = data.get("markdown", "")
 
             if content:
-                background_tasks.add_task(
-                    process_and_store_document,
-                    content=content,
-                    source_url=str(request.url),
-                    metadata=data.get("metadata", {}),
-                    source_type="scrape",
-                )
-
-        return {"success": result.get("success", True), "data": result.get("data", {})}
+                try:
+                    ingestion_queue.submit(
+                        process_and_store_document,
+                        content=content,
+                        source_url=url_str,
+                        metadata=data.get("metadata", {}),
+                        source_type="scrape",
+                    )
+                except asyncio.QueueFull:
+                    # The scrape is already paid for; return it even if it cannot be stored
+                    logger.warning("Ingestion queue full, not storing scrape of %s", url_str)
+
+        # A Response skips FastAPI re-validating the body against response_model
+        return ORJSONResponse(
+            {"success": result.get("success", True), "data": result.get("data", {})}
+        )
 
     except TimeoutException as e:
-        logger.error(f"Timeout scraping URL {request.url}: {e}")
+        logger.error(f"Timeout scraping URL {url_str}: {e}")
         raise HTTPException(status_code=504, detail="Request timeout while scraping URL")
 
     except HTTPStatusError as e:
-        logger.error(f"HTTP error scraping URL {request.url}: {e}")
+        logger.error(f"HTTP error scraping URL {url_str}: {e}")
         raise HTTPException(status_code=502, detail=f"Firecrawl API error: {str(e)}")
 
     except Exception:
-        logger.exception(f"Unexpected error scraping URL {request.url}")
+        logger.exception(f"Unexpected error scraping URL {url_str}")
         raise HTTPException(status_code=500, detail="Internal server error while scraping URL")
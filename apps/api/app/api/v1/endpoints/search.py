@@ -2,14 +2,65 @@
 Search endpoint for web search using Firecrawl v2 API.
 """
 
-from fastapi import APIRouter, HTTPException, BackgroundTasks
+import asyncio
+import hashlib
+import logging
+from collections import OrderedDict
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 from typing import Optional, List
+from app.core.work_queue import BoundedWorkQueue
 from app.services.firecrawl import FirecrawlService
 from app.services.document_processor import process_and_store_documents_batch
+from app.dependencies import get_firecrawl_service, get_ingestion_queue
 
-router = APIRouter()
-firecrawl_service = FirecrawlService()
+logger = logging.getLogger(__name__)
+router = APIRouter(default_response_class=ORJSONResponse)
+
+_QUEUE_FULL_DETAIL = "Ingestion queue is full. Please retry shortly."
+
+# Content fingerprints of recently queued search results (LRU). Syndicated
+# pages share content under different URLs; only the first is embedded.
+_DEDUP_SAMPLE_CHARS = 4096
+_DEDUP_MAX_ENTRIES = 100_000
+_recent_fingerprints: "OrderedDict[bytes, None]" = OrderedDict()
+
+
+def _content_fingerprint(content: str) -> bytes:
+    """
+    Fingerprint a page by the whitespace-normalised first 4096 characters,
+    so reflowed copies of the same page are treated as duplicates.
+    """
+    sample = " ".join(content[:_DEDUP_SAMPLE_CHARS].split())
+    return hashlib.blake2b(sample.encode(), digest_size=16).digest()
+
+
+def _seen_recently(fingerprint: bytes) -> bool:
+    """Check a fingerprint against recently queued content, refreshing its LRU slot."""
+    if fingerprint in _recent_fingerprints:
+        _recent_fingerprints.move_to_end(fingerprint)
+        return True
+    return False
+
+
+def _remember_fingerprints(fingerprints: List[bytes]) -> None:
+    """Record fingerprints of content that has been accepted for ingestion."""
+    for fingerprint in fingerprints:
+        _recent_fingerprints[fingerprint] = None
+    while len(_recent_fingerprints) > _DEDUP_MAX_ENTRIES:
+        _recent_fingerprints.popitem(last=False)
+
+
+async def _store_search_documents(documents: List[dict], fingerprints: List[bytes]) -> None:
+    """Store a batch of search results, forgetting its fingerprints if that fails."""
+    try:
+        await process_and_store_documents_batch(documents)
+    except Exception:
+        # Let a later search of the same content queue it again
+        for fingerprint in fingerprints:
+            _recent_fingerprints.pop(fingerprint, None)
+        raise
 
 
 class SearchRequest(BaseModel):
@@ -37,12 +88,23 @@ class SearchResponse(BaseModel):
 
 
 @router.post("/", response_model=SearchResponse)
-async def search_web(request: SearchRequest, background_tasks: BackgroundTasks):
+async def search_web(
+    request: SearchRequest,
+    firecrawl_service: FirecrawlService = Depends(get_firecrawl_service),
+    ingestion_queue: BoundedWorkQueue = Depends(get_ingestion_queue),
+):
     """
     Search the web and get full page content.
 
-    All search results are automatically stored in the knowledge base via background tasks.
+    All search results are automatically stored in the knowledge base as one
+    batch job on the bounded ingestion queue; when it is full the request is
+    rejected with 429 before any Firecrawl credits are spent. If it fills up
+    while the search runs, the results are still returned but not stored.
+    Results whose content was recently queued are returned but not stored again.
     """
+    if ingestion_queue.full():
+        raise HTTPException(status_code=429, detail=_QUEUE_FULL_DETAIL)
+
     try:
         options = {"limit": request.limit, "formats": request.formats}
 
@@ -50,37 +112,47 @@ async def search_web(request: SearchRequest, background_tasks: BackgroundTasks):
 
         raw_results = result.get("data", [])
 
-        # Prepare batch of documents to store
+        # Format the response and the batch of documents to store in one pass,
+        # reading each field of a result once
+        results = []
         documents = []
+        fingerprints: List[bytes] = []
         for item in raw_results:
-            content = item.get("markdown", item.get("html", ""))
             url = item.get("url", "")
-
-            if content and url:
-                documents.append(
-                    {
-                        "content": content,
-                        "source_url": url,
-                        "metadata": item.get("metadata", {}),
-                        "source_type": "search",
-                    }
-                )
-
-        # Store ALL documents in ONE background task (batch processing)
+            content = item.get("markdown") or item.get("html", "")
+            metadata = item.get("metadata") or {}
+
+            results.append(
+                {"url": url, "title": metadata.get("title", "Untitled"), "content": content}
+            )
+            if not (content and url):
+                continue
+            fingerprint = _content_fingerprint(content)
+            if fingerprint in fingerprints or _seen_recently(fingerprint):
+                continue
+            fingerprints.append(fingerprint)
+            documents.append(
+                {
+                    "content": content,
+                    "source_url": url,
+                    "metadata": metadata,
+                    "source_type": "search",
+                }
+            )
+
+        # Store ALL documents in ONE queued job (batch processing); content only
+        # counts as seen once the job has been accepted
         if documents:
-            background_tasks.add_task(process_and_store_documents_batch, documents)
-
-        # Format response
-        results = [
-            {
-                "url": r.get("url", ""),
-                "title": r.get("metadata", {}).get("title", "Untitled"),
-                "content": r.get("markdown", r.get("html", "")),
-            }
-            for r in raw_results
-        ]
-
-        return {"success": True, "results": results, "total": len(results)}
+            try:
+                ingestion_queue.submit(_store_search_documents, documents, fingerprints)
+            except asyncio.QueueFull:
+                # The search is already paid for; return it even if it cannot be stored
+                logger.warning("Ingestion queue full, not storing search for %r", request.query)
+            else:
+                _remember_fingerprints(fingerprints)
+
+        # A Response skips FastAPI re-validating the body against response_model
+        return ORJSONResponse({"success": True, "results": results, "total": len(results)})
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to search: {str(e)}")
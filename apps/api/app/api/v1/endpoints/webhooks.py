@@ -2,13 +2,16 @@
 Webhook endpoints for receiving callbacks from Firecrawl.
 """
 
+import asyncio
 import hmac
 import hashlib
 import logging
-import json
+import orjson
+from functools import lru_cache
 from fastapi import APIRouter, BackgroundTasks, Request, HTTPException
-from typing import Dict
-from pydantic import ValidationError
+from fastapi.responses import ORJSONResponse
+from typing import Annotated, Dict, List, Optional, Union
+from pydantic import Field, TypeAdapter, ValidationError
 from app.services.document_processor import (
     process_and_store_document,
     process_and_store_documents_batch,
@@ -19,13 +22,38 @@ from app.core.config import settings
 from app.models import (
     WebhookCrawlPage,
     WebhookCrawlCompleted,
+    FirecrawlMetadata,
     FirecrawlPageData,
 )
 from app.dependencies import get_redis_service, get_language_detection_service
 from fastapi import Depends
 
 logger = logging.getLogger(__name__)
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
+
+# Dumps the metadata of a whole crawl in one pydantic-core call
+METADATA_LIST_ADAPTER = TypeAdapter(List[FirecrawlMetadata])
+
+# Tagged union over the heavy events: pydantic-core reads "type" and validates
+# only the matching model, straight from bytes
+TYPED_EVENT_ADAPTER: TypeAdapter[Union[WebhookCrawlPage, WebhookCrawlCompleted]] = TypeAdapter(
+    Annotated[Union[WebhookCrawlPage, WebhookCrawlCompleted], Field(discriminator="type")]
+)
+
+
+# Adapter errors meaning "not a page/completed event", not "invalid event"
+_UNTYPED_EVENT_ERRORS = frozenset(
+    {"json_invalid", "dict_type", "union_tag_invalid", "union_tag_not_found"}
+)
+
+SIGNATURE_HEX_LENGTH = 2 * hashlib.sha256().digest_size
+SIGNATURE_OFFLOAD_BYTES = 16 * 1024
+
+
+@lru_cache(maxsize=4)
+def _keyed_hmac(secret: str) -> "hmac.HMAC":
+    """Build the HMAC state for a secret once; each request copies it."""
+    return hmac.new(secret.encode(), digestmod=hashlib.sha256)
 
 
 def verify_webhook_signature(payload: bytes, signature: str, secret: str) -> bool:
@@ -40,12 +68,28 @@ def verify_webhook_signature(payload: bytes, signature: str, secret: str) -> boo
     Returns:
         True if signature is valid, False otherwise
     """
-    if not secret or not signature:
+    if not secret or len(signature) != SIGNATURE_HEX_LENGTH:
         return False
 
-    expected = hmac.new(secret.encode(), payload, hashlib.sha256).hexdigest()
+    # Copying the keyed state skips re-encoding and re-padding the secret per request
+    mac = _keyed_hmac(secret).copy()
+    mac.update(payload)
+
+    return hmac.compare_digest(mac.hexdigest(), signature)
+
+
+async def _verify_signature_off_loop(payload: bytes, signature: str, secret: str) -> bool:
+    """
+    Verify a webhook signature without stalling the event loop on large bodies.
 
-    return hmac.compare_digest(expected, signature)
+    hashlib releases the GIL while hashing, so a multi-megabyte crawl.completed
+    body is verified in a worker thread while other requests keep being served.
+    Bodies under SIGNATURE_OFFLOAD_BYTES are verified inline, where the thread
+    handoff would cost more than the hash.
+    """
+    if len(payload) < SIGNATURE_OFFLOAD_BYTES:
+        return verify_webhook_signature(payload, signature, secret)
+    return await asyncio.to_thread(verify_webhook_signature, payload, signature, secret)
 
 
 # Services will be injected via Depends()
@@ -68,6 +112,38 @@ def _validate_webhook_security() -> None:
             )
 
 
+def _body_limit(event_type: Optional[str]) -> Optional[int]:
+    """Return the byte cap for an event named in X-Firecrawl-Event (None = uncapped)."""
+    if event_type == "crawl.page":
+        return settings.WEBHOOK_MAX_PAGE_BYTES
+    if event_type in ("crawl.started", "crawl.failed"):
+        return settings.WEBHOOK_MAX_EVENT_BYTES
+    return None
+
+
+def _parse_typed_event(body: bytes) -> Optional[Union[WebhookCrawlPage, WebhookCrawlCompleted]]:
+    """
+    Validate a crawl.page or crawl.completed body in one pass from bytes.
+
+    Returns None for other event types and for bodies that are not a JSON
+    object, so lifecycle events and malformed JSON fall back to the generic
+    parse. A page or completed event that fails validation raises.
+    """
+    try:
+        return TYPED_EVENT_ADAPTER.validate_json(body)
+    except ValidationError as e:
+        if e.errors()[0]["type"] in _UNTYPED_EVENT_ERRORS:
+            return None
+        raise
+
+
+def _is_allowed_language(detected_lang: str) -> bool:
+    """Apply the configured language allow-list (lenient mode also allows unknown)."""
+    return detected_lang in settings.allowed_languages_set or (
+        settings.LANGUAGE_FILTER_MODE == "lenient" and detected_lang == "unknown"
+    )
+
+
 async def process_crawled_page(page_data: FirecrawlPageData):
     """
     Process a crawled page: generate embeddings and store in vector DB.
@@ -116,9 +192,22 @@ async def firecrawl_webhook(
         # Validate security configuration
         _validate_webhook_security()
 
+        # Refuse oversized bodies from the headers alone, before buffering them
+        limit = _body_limit(request.headers.get("X-Firecrawl-Event"))
+        content_length = request.headers.get("content-length", "")
+        if limit is not None and content_length.isdigit() and int(content_length) > limit:
+            logger.warning(
+                "🚨 Rejecting %s-byte %s webhook (limit %d)",
+                content_length,
+                request.headers["X-Firecrawl-Event"],
+                limit,
+            )
+            raise HTTPException(status_code=413, detail="Webhook payload too large")
+
+        body = await request.body()
+
         # Verify webhook signature if secret is configured
         if settings.FIRECRAWL_WEBHOOK_SECRET:
-            body = await request.body()
             signature = request.headers.get("X-Firecrawl-Signature", "")
 
             if not signature:
@@ -131,7 +220,9 @@ async def firecrawl_webhook(
                 )
                 raise HTTPException(status_code=401, detail="Missing webhook signature")
 
-            if not verify_webhook_signature(body, signature, settings.FIRECRAWL_WEBHOOK_SECRET):
+            if not await _verify_signature_off_loop(
+                body, signature, settings.FIRECRAWL_WEBHOOK_SECRET
+            ):
                 logger.warning(
                     "🚨 Invalid webhook signature",
                     extra={
@@ -144,66 +235,50 @@ async def firecrawl_webhook(
                 raise HTTPException(status_code=401, detail="Invalid webhook signature")
 
             logger.debug("✅ Webhook signature verified")
-            # Parse and validate JSON from verified body
-            try:
-                payload_dict = json.loads(body.decode("utf-8"))
-            except json.JSONDecodeError as e:
-                logger.error(f"Invalid JSON in webhook payload: {e}")
-                return {"status": "error", "error": "Invalid JSON payload"}
         else:
-            # No secret configured - parse directly (DEBUG mode only)
+            # No secret configured (DEBUG mode only)
             logger.debug("⚠️ Webhook processed without signature verification (DEBUG mode)")
-            try:
-                payload_dict = await request.json()
-            except json.JSONDecodeError as e:
-                logger.error(f"Invalid JSON in webhook payload: {e}")
-                return {"status": "error", "error": "Invalid JSON payload"}
 
-        # Validate webhook payload with Pydantic (provides type safety)
+        # Page events are dispatched on their "type" tag and validated from bytes
         try:
-            event_type = payload_dict.get("type")
-            if event_type == "crawl.page":
-                payload = WebhookCrawlPage(**payload_dict)
-            elif event_type == "crawl.completed":
-                payload = WebhookCrawlCompleted(**payload_dict)
-            else:
-                # For other events, use raw dict (backwards compatible)
-                payload = payload_dict
+            payload = _parse_typed_event(body)
         except ValidationError as e:
-            logger.error(f"Webhook payload validation error: {e}")
+            logger.error("Webhook payload validation error: %s", e)
             raise HTTPException(status_code=400, detail=f"Invalid payload: {str(e)}")
 
-        crawl_id = payload_dict.get("id")  # Extract crawl_id early for all events
+        if payload is not None:
+            event_type, crawl_id = payload.type, payload.id
+        else:
+            # Lifecycle events: parse the raw bytes directly, no str decode
+            try:
+                payload_dict = orjson.loads(body)
+            except orjson.JSONDecodeError as e:
+                # Also raised for bodies that are not valid UTF-8
+                logger.error("Invalid JSON in webhook payload: %s", e)
+                return {"status": "error", "error": "Invalid JSON payload"}
+
+            event_type = payload_dict.get("type")
+            crawl_id = payload_dict.get("id")
 
         if event_type == "crawl.started":
-            logger.info(f"Crawl started: {crawl_id}")
+            logger.info("Crawl started: %s", crawl_id)
             return {"status": "acknowledged"}
 
-        elif event_type == "crawl.page":
+        elif isinstance(payload, WebhookCrawlPage):
             # Process the crawled page in the background
-            # payload is now a validated WebhookCrawlPage Pydantic model
-            page_data_model: FirecrawlPageData = (
-                payload.data
-                if isinstance(payload, WebhookCrawlPage)
-                else FirecrawlPageData(**payload.get("data", {}))
-            )
+            page_data_model = payload.data
             source_url = page_data_model.metadata.sourceURL
             content = page_data_model.markdown
 
-            logger.debug(f"📄 Received crawl.page: {source_url}")
+            logger.debug("📄 Received crawl.page: %s", source_url)
 
             # Language filtering (if enabled) - BEFORE processing
             if settings.ENABLE_LANGUAGE_FILTERING and content:
                 detected_lang = lang.detect_language(content)
 
-                # Check if language is allowed
-                is_allowed = detected_lang in settings.allowed_languages_list or (
-                    settings.LANGUAGE_FILTER_MODE == "lenient" and detected_lang == "unknown"
-                )
-
-                if not is_allowed:
+                if not _is_allowed_language(detected_lang):
                     # Skip non-English page
-                    logger.info(f"🚫 FILTERED ({detected_lang}): {source_url}")
+                    logger.info("🚫 FILTERED (%s): %s", detected_lang, source_url)
 
                     # Mark as processed so we skip it in crawl.completed too
                     if crawl_id and source_url:
@@ -211,123 +286,136 @@ async def firecrawl_webhook(
 
                     return {"status": "filtered", "language": detected_lang}
                 else:
-                    logger.info(f"✅ ALLOWED ({detected_lang}): {source_url}")
+                    logger.info("✅ ALLOWED (%s): %s", detected_lang, source_url)
 
             # Track this page as processed (for deduplication in crawl.completed)
             if crawl_id and source_url:
                 await redis.mark_page_processed(crawl_id, source_url)
-                logger.debug(f"Marked page as processed: {source_url}")
+                logger.debug("Marked page as processed: %s", source_url)
 
             # Process immediately if streaming is enabled
             if settings.ENABLE_STREAMING_PROCESSING:
-                logger.info(f"⚡ PROCESSING (streaming): {source_url}")
+                logger.info("⚡ PROCESSING (streaming): %s", source_url)
                 background_tasks.add_task(process_crawled_page, page_data_model)
                 return {"status": "processing"}
             else:
-                logger.info(f"📋 QUEUED (batch): {source_url}")
+                logger.info("📋 QUEUED (batch): %s", source_url)
                 return {"status": "acknowledged"}
 
-        elif event_type == "crawl.completed":
-            # payload is now a validated WebhookCrawlCompleted Pydantic model
-            data: list[FirecrawlPageData] = (
-                payload.data if isinstance(payload, WebhookCrawlCompleted) else []
-            )
-            total_pages = len(data)
-            logger.info(f"✓ Crawl completed: {crawl_id} ({total_pages} pages)")
-            
-            # Detect if we received pages in crawl.completed but NONE via crawl.page events
-            if settings.ENABLE_STREAMING_PROCESSING and total_pages > 0:
-                # Check how many pages were processed during streaming
-                processed_count = 0
-                for page in data:
-                    if await redis.is_page_processed(crawl_id, page.metadata.sourceURL):
-                        processed_count += 1
-                
-                if processed_count == 0:
-                    logger.error(
-                        f"⚠️ WEBHOOK DELIVERY ISSUE: Crawl {crawl_id} completed with "
-                        f"{total_pages} pages but 0 were received via crawl.page webhooks! "
-                        f"Webhook URL may be unreachable: {settings.WEBHOOK_BASE_URL}"
-                    )
-                    logger.error(
-                        f"⚠️ Verify Firecrawl can reach: "
-                        f"{settings.WEBHOOK_BASE_URL}/api/v1/webhooks/firecrawl"
-                    )
+        elif isinstance(payload, WebhookCrawlCompleted):
+            pages = payload.data
+            total_pages = len(pages)
+            logger.info("✓ Crawl completed: %s (%d pages)", crawl_id, total_pages)
 
-            # Process all pages in BATCH, skipping those already processed via streaming
-            if data:
-                documents = []
-                skipped_count = 0
-                skipped_languages: Dict[str, int] = {}  # Track filtered languages
+            skipped_count = 0
+            # Per-page lines only when DEBUG is on; INFO gets the summaries below
+            debug_enabled = logger.isEnabledFor(logging.DEBUG)
+            skipped_languages: Dict[str, int] = {}  # Track filtered languages
 
-                for page_data_model in data:
-                    content = page_data_model.markdown
-                    metadata = page_data_model.metadata.model_dump()
-                    source_url = page_data_model.metadata.sourceURL
+            # Phase 1: keep pages with content and a URL
+            new_pages = [page for page in pages if page.markdown and page.metadata.sourceURL]
 
-                    if not content or not source_url:
-                        continue
+            # Phase 2: skip pages already processed during streaming (one SMISMEMBER)
+            processed_flags = await redis.are_pages_processed(
+                crawl_id, [page.metadata.sourceURL for page in new_pages]
+            )
+            streamed_count = sum(processed_flags)
+            skipped_count += streamed_count
+            if debug_enabled:
+                for page, already_processed in zip(new_pages, processed_flags):
+                    if already_processed:
+                        logger.debug("Skipping already-processed page: %s", page.metadata.sourceURL)
+            new_pages = [
+                page
+                for page, already_processed in zip(new_pages, processed_flags)
+                if not already_processed
+            ]
+
+            # Phase 3: language filtering (if enabled), one detection batch for
+            # the whole crawl in a worker thread so the event loop keeps serving
+            if settings.ENABLE_LANGUAGE_FILTERING and new_pages:
+                languages = await asyncio.to_thread(
+                    lang.detect_languages_batch, [page.markdown for page in new_pages]
+                )
 
-                    # Check if this page was already processed during streaming
-                    if await redis.is_page_processed(crawl_id, source_url):
-                        skipped_count += 1
-                        logger.debug(f"Skipping already-processed page: {source_url}")
+                allowed_pages = []
+                filtered_urls = []
+                for page, detected_lang in zip(new_pages, languages):
+                    source_url = page.metadata.sourceURL
+                    if _is_allowed_language(detected_lang):
+                        if debug_enabled:
+                            logger.debug("✅ ALLOWED (batch, %s): %s", detected_lang, source_url)
+                        allowed_pages.append(page)
                         continue
 
-                    # Language filtering (if enabled)
-                    if settings.ENABLE_LANGUAGE_FILTERING:
-                        detected_lang = lang.detect_language(content)
-
-                        # Check if language is allowed
-                        is_allowed = detected_lang in settings.allowed_languages_list or (
-                            settings.LANGUAGE_FILTER_MODE == "lenient"
-                            and detected_lang == "unknown"
-                        )
-
-                        if not is_allowed:
-                            skipped_count += 1
-                            skipped_languages[detected_lang] = (
-                                skipped_languages.get(detected_lang, 0) + 1
-                            )
-                            logger.info(f"🚫 FILTERED (batch, {detected_lang}): {source_url}")
-
-                            # Mark as processed so we don't check again
-                            await redis.mark_page_processed(crawl_id, source_url)
-                            continue
-                        else:
-                            logger.debug(f"✅ ALLOWED (batch, {detected_lang}): {source_url}")
-
-                    # Page passes all filters - add to batch
-                    documents.append(
-                        {
-                            "content": content,
-                            "source_url": source_url,
-                            "metadata": metadata,
-                            "source_type": "crawl",
-                        }
-                    )
+                    skipped_count += 1
+                    skipped_languages[detected_lang] = skipped_languages.get(detected_lang, 0) + 1
+                    if debug_enabled:
+                        logger.debug("🚫 FILTERED (batch, %s): %s", detected_lang, source_url)
+                    filtered_urls.append(source_url)
+
+                # Mark filtered pages as processed so we don't check again
+                await redis.mark_pages_processed(crawl_id, filtered_urls)
+                new_pages = allowed_pages
+
+            # Phase 4: build documents only for pages that will be ingested,
+            # dumping their metadata in one pydantic-core call
+            documents = [
+                {
+                    "content": page.markdown,
+                    "source_url": page.metadata.sourceURL,
+                    "metadata": metadata,
+                    "source_type": "crawl",
+                }
+                for page, metadata in zip(
+                    new_pages,
+                    METADATA_LIST_ADAPTER.dump_python([page.metadata for page in new_pages]),
+                )
+            ]
 
+            # Detect if we received pages in crawl.completed but NONE via crawl.page events
+            if settings.ENABLE_STREAMING_PROCESSING and total_pages > 0 and streamed_count == 0:
+                logger.error(
+                    "⚠️ WEBHOOK DELIVERY ISSUE: Crawl %s completed with %d pages but 0 were "
+                    "received via crawl.page webhooks! Webhook URL may be unreachable: %s",
+                    crawl_id,
+                    total_pages,
+                    settings.WEBHOOK_BASE_URL,
+                )
+                logger.error(
+                    "⚠️ Verify Firecrawl can reach: %s/api/v1/webhooks/firecrawl",
+                    settings.WEBHOOK_BASE_URL,
+                )
+
+            if total_pages:
                 # Log filtering statistics
                 if skipped_count > 0:
-                    logger.info(f"📊 Crawl {crawl_id}: {skipped_count}/{total_pages} pages skipped")
+                    logger.info(
+                        "📊 Crawl %s: %d/%d pages skipped", crawl_id, skipped_count, total_pages
+                    )
 
                 # Log language filtering details
                 if skipped_languages:
                     logger.warning(
-                        f"🌍 Crawl {crawl_id}: Filtered {sum(skipped_languages.values())} "
-                        f"non-English pages: {skipped_languages}"
+                        "🌍 Crawl %s: Filtered %d non-English pages: %s",
+                        crawl_id,
+                        sum(skipped_languages.values()),
+                        skipped_languages,
                     )
 
                 # Process new pages in batch mode
                 if documents:
                     logger.info(
-                        f"✅ Crawl {crawl_id}: Processing {len(documents)} new pages in batch mode"
+                        "✅ Crawl %s: Processing %d new pages in batch mode",
+                        crawl_id,
+                        len(documents),
                     )
                     background_tasks.add_task(process_and_store_documents_batch, documents)
                 else:
                     logger.info(
-                        f"✓ Crawl {crawl_id}: All {total_pages} pages "
-                        f"already processed (via streaming)"
+                        "✓ Crawl %s: All %d pages already processed (via streaming)",
+                        crawl_id,
+                        total_pages,
                     )
 
                 # Cleanup tracking data
@@ -336,12 +424,12 @@ async def firecrawl_webhook(
             return {
                 "status": "completed",
                 "pages_processed": total_pages,
-                "pages_skipped": skipped_count if data else 0,
+                "pages_skipped": skipped_count,
             }
 
         elif event_type == "crawl.failed":
-            error = payload.get("error", "Unknown error")
-            logger.error(f"✗ Crawl failed: {crawl_id} - {error}")
+            error = payload_dict.get("error", "Unknown error")
+            logger.error("✗ Crawl failed: %s - %s", crawl_id, error)
 
             # Cleanup tracking data on failure
             if crawl_id:
@@ -350,7 +438,7 @@ async def firecrawl_webhook(
             return {"status": "error", "error": error}
 
         else:
-            logger.warning(f"Unknown webhook event: {event_type}")
+            logger.warning("Unknown webhook event: %s", event_type)
             return {"status": "unknown_event"}
 
     except HTTPException:
@@ -359,5 +447,5 @@ async def firecrawl_webhook(
     except ValidationError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
-        logger.exception(f"Webhook processing error: {str(e)}")
+        logger.exception("Webhook processing error: %s", e)
         raise HTTPException(status_code=500, detail="Internal server error")
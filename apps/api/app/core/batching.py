@@ -0,0 +1,146 @@
+"""
+Micro-batching for coalescing concurrent calls into a single backend request.
+
+Implements:
+- Short debounce window that collects concurrent submissions
+- Size-capped batches dispatched to a single handler call
+- Per-caller futures resolved with their own result (or the batch error)
+"""
+
+# Standard library imports
+import asyncio
+import logging
+from typing import Awaitable, Callable, Generic, List, Optional, Set, Tuple, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class MicroBatcher(Generic[T, R]):
+    """
+    Coalesce concurrent single-item requests into batched handler calls.
+
+    The first submission wakes a background worker which waits up to
+    ``max_wait_ms`` for more submissions, drains up to ``max_batch_size``
+    items and passes them to ``handler`` in one call. The handler must
+    return one result per item, in order.
+
+    Usage:
+        batcher = MicroBatcher(embeddings.generate_embeddings, max_batch_size=32)
+
+        vector = await batcher.submit("some text")
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[List[T]], Awaitable[List[R]]],
+        max_batch_size: int = 32,
+        max_wait_ms: float = 5.0,
+        name: str = "batcher",
+    ):
+        if max_batch_size < 1:
+            raise ValueError(f"max_batch_size must be >= 1, got {max_batch_size}")
+
+        self.handler = handler
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self.name = name
+        self._queue: Optional["asyncio.Queue[Tuple[T, asyncio.Future[R]]]"] = None
+        self._worker: Optional[asyncio.Task[None]] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._inflight: Set[asyncio.Task[None]] = set()
+
+    async def submit(self, item: T) -> R:
+        """
+        Submit a single item and wait for its result from the next batch.
+
+        Raises:
+            Exception: Whatever the handler raised for the batch containing this item
+        """
+        loop = asyncio.get_running_loop()
+        queue = self._ensure_worker(loop)
+        future: asyncio.Future[R] = loop.create_future()
+        queue.put_nowait((item, future))
+        return await future
+
+    def _ensure_worker(
+        self, loop: asyncio.AbstractEventLoop
+    ) -> "asyncio.Queue[Tuple[T, asyncio.Future[R]]]":
+        """Start (or restart) the background worker bound to the running loop."""
+        if (
+            self._queue is None
+            or self._worker is None
+            or self._worker.done()
+            or self._loop is not loop
+        ):
+            self._queue = asyncio.Queue()
+            self._loop = loop
+            self._worker = loop.create_task(self._run(self._queue))
+        return self._queue
+
+    async def _run(self, queue: "asyncio.Queue[Tuple[T, asyncio.Future[R]]]") -> None:
+        """Collect submissions into batches and dispatch them."""
+        while True:
+            batch = [await queue.get()]
+
+            # Give concurrent callers a brief window to join this batch
+            if self.max_wait > 0 and queue.qsize() < self.max_batch_size - 1:
+                await asyncio.sleep(self.max_wait)
+
+            while len(batch) < self.max_batch_size and not queue.empty():
+                batch.append(queue.get_nowait())
+
+            # Dispatch without blocking collection of the next batch
+            task = asyncio.create_task(self._dispatch(batch))
+            self._inflight.add(task)
+            task.add_done_callback(self._inflight.discard)
+
+    async def _dispatch(self, batch: List[Tuple[T, "asyncio.Future[R]"]]) -> None:
+        """Call the handler once for the batch and resolve each caller's future."""
+        # Drop callers that gave up while waiting
+        batch = [(item, future) for item, future in batch if not future.done()]
+        if not batch:
+            return
+
+        try:
+            results = await self.handler([item for item, _ in batch])
+            if len(results) != len(batch):
+                raise RuntimeError(
+                    f"{self.name}: handler returned {len(results)} results "
+                    f"for a batch of {len(batch)}"
+                )
+        except Exception as e:
+            logger.warning("%s: batch of %d failed: %s", self.name, len(batch), e)
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+    async def close(self) -> None:
+        """Stop the worker and fail any submissions that were never dispatched."""
+        worker, queue = self._worker, self._queue
+        self._worker = None
+        self._queue = None
+        self._loop = None
+
+        if worker is not None and not worker.done():
+            worker.cancel()
+            try:
+                await worker
+            except asyncio.CancelledError:
+                pass
+
+        if queue is not None:
+            while not queue.empty():
+                _, future = queue.get_nowait()
+                if not future.done():
+                    future.set_exception(RuntimeError(f"{self.name} closed"))
+
+        if self._inflight:
+            await asyncio.gather(*self._inflight, return_exceptions=True)
@@ -5,14 +5,30 @@ Provides Redis-backed persistence to ensure circuit breaker state survives
 application restarts, preventing immediate failures when services are still down.
 """
 
-import json
+import asyncio
 import logging
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Set
 
 import redis.asyncio as redis
 
 logger = logging.getLogger(__name__)
 
+# Hash fields are stored as strings; these are cast back on load
+_INT_FIELDS = frozenset({"failure_count", "half_open_attempts"})
+_FLOAT_FIELDS = frozenset({"opened_at", "last_failure_time"})
+
+# Strong references to fire-and-forget saves; the loop only keeps weak ones
+_background_saves: Set["asyncio.Task[None]"] = set()
+
+
+def _decode_field(field: str, value: str) -> Any:
+    """Cast a stored hash field back to its native type."""
+    if field in _INT_FIELDS:
+        return int(value)
+    if field in _FLOAT_FIELDS:
+        return float(value)
+    return value
+
 
 class CircuitBreakerPersistenceBackend:
     """Base class for circuit breaker persistence."""
@@ -39,6 +55,18 @@ class CircuitBreakerPersistenceBackend:
         """
         raise NotImplementedError
 
+    def schedule_save(self, name: str, state: Dict[str, Any]) -> None:
+        """
+        Save circuit breaker state in the background without waiting for it.
+
+        Args:
+            name: Circuit breaker name
+            state: State dictionary containing state, failure_count, etc.
+        """
+        task = asyncio.create_task(self.save_state(name, state))
+        _background_saves.add(task)
+        task.add_done_callback(_background_saves.discard)
+
     async def delete_state(self, name: str) -> None:
         """
         Delete circuit breaker state.
@@ -48,18 +76,30 @@ class CircuitBreakerPersistenceBackend:
         """
         raise NotImplementedError
 
+    async def close(self) -> None:
+        """Wait for background saves still in flight (call on shutdown)."""
+        if _background_saves:
+            await asyncio.gather(*_background_saves, return_exceptions=True)
+
 
 class RedisCircuitBreakerBackend(CircuitBreakerPersistenceBackend):
     """Redis-backed circuit breaker persistence."""
 
-    def __init__(self, redis_client: redis.Redis):
+    def __init__(self, redis_client: redis.Redis, flush_interval: float = 0.05):
         """
         Initialize Redis persistence backend.
 
         Args:
             redis_client: Redis async client instance
+            flush_interval: Seconds schedule_save() buffers states before writing them
         """
         self.redis = redis_client
+        self.flush_interval = flush_interval
+        # Write-behind buffer: latest unsaved state per breaker
+        self._pending: Dict[str, Dict[str, Any]] = {}
+        self._flush_task: Optional[asyncio.Task[None]] = None
+        # Every flush task until it finishes, including ones already writing
+        self._flush_tasks: Set["asyncio.Task[None]"] = set()
 
     def _get_key(self, name: str) -> str:
         """
@@ -85,23 +125,97 @@ class RedisCircuitBreakerBackend(CircuitBreakerPersistenceBackend):
             Failures are logged but not raised - persistence errors should not
             break the circuit breaker functionality.
         """
+        # A direct save supersedes any older buffered state for this breaker
+        self._pending.pop(name, None)
         try:
-            key = self._get_key(name)
-            # Store as JSON for easy debugging
-            serialized = json.dumps(state)
-
-            # Set TTL based on state:
-            # - OPEN: 24 hours (service might be down for a while)
-            # - CLOSED: 1 hour (normal operation, can expire)
-            # - HALF_OPEN: 1 hour (transient state)
-            ttl = 86400 if state.get("state") == "open" else 3600
-
-            await self.redis.set(key, serialized, ex=ttl)
+            async with self.redis.pipeline(transaction=True) as pipe:
+                self._queue_write(pipe, name, state)
+                await pipe.execute()
             logger.debug(f"Persisted circuit breaker state for {name}: {state}")
         except Exception as e:
             logger.warning(f"Failed to persist circuit breaker state for {name}: {e}")
             # Don't raise - persistence failure shouldn't break the app
 
+    def schedule_save(self, name: str, state: Dict[str, Any]) -> None:
+        """
+        Buffer a state change and write it behind, coalesced with other changes.
+
+        Only the latest state per breaker is kept. All breakers that changed
+        within ``flush_interval`` are written in one pipeline round-trip.
+
+        Args:
+            name: Circuit breaker name
+            state: State dictionary to persist
+        """
+        self._pending[name] = state
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_after_interval())
+            self._flush_tasks.add(self._flush_task)
+            self._flush_task.add_done_callback(self._flush_tasks.discard)
+
+    async def _flush_after_interval(self) -> None:
+        """Wait for more changes to arrive, then write the buffer."""
+        await asyncio.sleep(self.flush_interval)
+        # Changes made while flushing schedule a new flush
+        self._flush_task = None
+        await self.flush()
+
+    async def flush(self) -> None:
+        """
+        Write all buffered states in one pipeline.
+
+        Note:
+            Failures are logged but not raised, as with save_state().
+        """
+        pending, self._pending = self._pending, {}
+        if not pending:
+            return
+
+        try:
+            async with self.redis.pipeline(transaction=True) as pipe:
+                for name, state in pending.items():
+                    self._queue_write(pipe, name, state)
+                await pipe.execute()
+            logger.debug(f"Persisted {len(pending)} circuit breaker state(s)")
+        except Exception as e:
+            logger.warning(f"Failed to persist circuit breaker states {list(pending)}: {e}")
+
+    async def close(self) -> None:
+        """Write whatever is buffered and wait for flushes already writing."""
+        # _flush_task is only set while its timer runs; cancel it and flush now
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+        await self.flush()
+        if self._flush_tasks:
+            await asyncio.gather(*self._flush_tasks, return_exceptions=True)
+
+    def _queue_write(self, pipe: Any, name: str, state: Dict[str, Any]) -> None:
+        """
+        Queue the commands replacing one breaker's stored state on a pipeline.
+
+        Args:
+            pipe: Redis pipeline to add the commands to
+            name: Circuit breaker name
+            state: State dictionary to persist
+        """
+        key = self._get_key(name)
+        # Store as a small hash of native fields; None values are omitted
+        mapping = {field: value for field, value in state.items() if value is not None}
+
+        # Set TTL based on state:
+        # - OPEN: 24 hours (service might be down for a while)
+        # - CLOSED: 1 hour (normal operation, can expire)
+        # - HALF_OPEN: 1 hour (transient state)
+        ttl = 86400 if state.get("state") == "open" else 3600
+
+        # DEL first so fields cleared since the last save (e.g. opened_at
+        # after a reset) do not linger
+        pipe.delete(key)
+        if mapping:
+            pipe.hset(key, mapping=mapping)
+            pipe.expire(key, ttl)
+
     async def load_state(self, name: str) -> Optional[Dict[str, Any]]:
         """
         Load circuit breaker state from Redis.
@@ -114,9 +228,9 @@ class RedisCircuitBreakerBackend(CircuitBreakerPersistenceBackend):
         """
         try:
             key = self._get_key(name)
-            data = await self.redis.get(key)
+            data = await self.redis.hgetall(key)
             if data:
-                state = json.loads(data)
+                state = {field: _decode_field(field, value) for field, value in data.items()}
                 logger.info(f"Loaded circuit breaker state for {name}: {state}")
                 return state
             return None
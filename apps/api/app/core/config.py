@@ -2,8 +2,8 @@
 Application configuration using Pydantic settings.
 """
 
-import re
 import logging
+from functools import cached_property
 from typing import List, Dict, Any
 from pydantic import field_validator, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -33,6 +33,11 @@ SUPPORTED_LANGUAGES = [
     "no",
     "da",
 ]
+# Hashed lookup for validation; the list keeps its order for error messages
+SUPPORTED_LANGUAGES_SET = frozenset(SUPPORTED_LANGUAGES)
+
+# Webhook hosts Firecrawl in another container cannot reach
+_LOCAL_HOSTS = ("localhost", "127.0.0.1")
 
 
 class Settings(BaseSettings):
@@ -70,6 +75,8 @@ class Settings(BaseSettings):
 
     # TEI embeddings service
     TEI_URL: str
+    EMBEDDINGS_BATCH_SIZE: int = 80  # Texts per /embed request (TEI --max-batch-requests)
+    EMBEDDINGS_MAX_CONCURRENT_REQUESTS: int = 4  # /embed requests in flight per call
 
     # Reranker service (optional)
     RERANKER_URL: str = ""
@@ -80,6 +87,9 @@ class Settings(BaseSettings):
 
     # Webhook URL for Firecrawl callbacks
     WEBHOOK_BASE_URL: str = "http://localhost:4400"
+    # Body caps, enforced from Content-Length when Firecrawl sends X-Firecrawl-Event
+    WEBHOOK_MAX_PAGE_BYTES: int = 10 * 1024 * 1024  # crawl.page (markdown, html, screenshot)
+    WEBHOOK_MAX_EVENT_BYTES: int = 64 * 1024  # crawl.started / crawl.failed
 
     # Redis Configuration
     REDIS_HOST: str = "steamy-wsl"
@@ -113,6 +123,26 @@ class Settings(BaseSettings):
     # Query Cache Configuration
     QUERY_CACHE_TTL: int = 300  # Default cache TTL in seconds (5 minutes)
 
+    # Semantic Query Cache (in-process, near-duplicate /query lookups)
+    ENABLE_SEMANTIC_CACHE: bool = True
+    SEMANTIC_CACHE_MAX_ENTRIES: int = 10000  # Cached queries per worker before LRU eviction
+    SEMANTIC_CACHE_SIMILARITY: float = 0.97  # Minimum cosine similarity for a cache hit
+
+    # LLM Answer Gate
+    MIN_LLM_SCORE: float = 0.3  # Skip LLM generation when the best hit scores below this
+
+    # Request Micro-Batching (embeddings + vector search)
+    MICRO_BATCH_MAX_SIZE: int = 32  # Maximum requests coalesced into one backend call
+    MICRO_BATCH_MAX_WAIT_MS: float = 5.0  # Debounce window before dispatching a batch
+
+    # Background Ingestion Queue (embed + store after the response is sent)
+    INGESTION_QUEUE_SIZE: int = 256  # Pending documents before new requests get 429
+    INGESTION_WORKERS: int = 8  # Documents embedded and stored concurrently
+
+    # Startup Warm-up (embed, search and generate once before serving)
+    ENABLE_STARTUP_WARMUP: bool = True
+    STARTUP_WARMUP_TIMEOUT: float = 30.0  # Seconds allowed per warm-up step
+
     # Validators
     @field_validator("REDIS_PORT")
     @classmethod
@@ -130,7 +160,7 @@ class Settings(BaseSettings):
             return v
 
         codes = [lang.strip().lower() for lang in v.split(",")]
-        invalid_codes = [code for code in codes if code and code not in SUPPORTED_LANGUAGES]
+        invalid_codes = [code for code in codes if code and code not in SUPPORTED_LANGUAGES_SET]
 
         if invalid_codes:
             raise ValueError(
@@ -154,11 +184,11 @@ class Settings(BaseSettings):
     @classmethod
     def validate_webhook_base_url(cls, v: str) -> str:
         """Validate webhook base URL format."""
-        if not re.match(r"^https?://", v):
+        if not v.startswith(("http://", "https://")):
             raise ValueError(f"Invalid webhook URL: {v}. Must start with http:// or https://")
 
         # Warn about localhost in production (will be checked in model_validator)
-        if "localhost" in v or "127.0.0.1" in v:
+        if any(host in v for host in _LOCAL_HOSTS):
             logger.warning(
                 "⚠️ Webhook URL uses localhost. This won't work if Firecrawl "
                 "is on a different host. Consider using a public URL or container name."
@@ -186,11 +216,16 @@ class Settings(BaseSettings):
         return self
 
     # Properties
-    @property
+    @cached_property
     def allowed_languages_list(self) -> list[str]:
-        """Parse ALLOWED_LANGUAGES string into a list."""
+        """Parse ALLOWED_LANGUAGES string into a list (once per instance)."""
         return [lang.strip() for lang in self.ALLOWED_LANGUAGES.split(",") if lang.strip()]
 
+    @cached_property
+    def allowed_languages_set(self) -> frozenset[str]:
+        """ALLOWED_LANGUAGES parsed once into a set for per-page membership checks."""
+        return frozenset(self.allowed_languages_list)
+
     @property
     def is_production(self) -> bool:
         """Check if running in production mode (not DEBUG)."""
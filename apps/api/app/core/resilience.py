@@ -12,10 +12,10 @@ import asyncio
 import logging
 import random
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 from functools import wraps
-from typing import Any, Callable, Optional, TypeVar, TYPE_CHECKING
+from typing import Any, Callable, Optional, Tuple, TypeVar, TYPE_CHECKING
 
 # Third-party imports
 import httpx
@@ -59,7 +59,11 @@ class CircuitState(str, Enum):
     HALF_OPEN = "half_open"  # Testing if service recovered
 
 
-@dataclass
+# Persisted state strings back to members, without going through Enum.__call__
+_STATE_FROM_STR = {state.value: state for state in CircuitState}
+
+
+@dataclass(frozen=True, slots=True)
 class RetryPolicy:
     """Configuration for retry behavior."""
 
@@ -68,25 +72,47 @@ class RetryPolicy:
     max_delay: float = 30.0  # seconds
     exponential_base: float = 2.0
     jitter: bool = True
+    # (delay, jitter span) per attempt, fixed once the policy is built
+    _schedule: Tuple[Tuple[float, float], ...] = field(
+        init=False, repr=False, compare=False, default=()
+    )
+    # Jitter only spreads retries out and is not security-sensitive, so a
+    # plain PRNG of the policy's own (not the shared module one) is enough
+    _rng: random.Random = field(
+        init=False, repr=False, compare=False, default_factory=random.Random
+    )
+
+    def __post_init__(self) -> None:
+        object.__setattr__(
+            self, "_schedule", tuple(self._backoff(a) for a in range(self.max_attempts))
+        )
+
+    def _backoff(self, attempt: int) -> Tuple[float, float]:
+        """Base delay and maximum jitter for an attempt."""
+        delay = min(self.base_delay * (self.exponential_base**attempt), self.max_delay)
+
+        # Add jitter: random value between 0 and 25% of delay.
+        # 25% is a common industry standard to prevent the thundering herd problem,
+        # balancing randomness with predictability. See:
+        # https://aws.amazon.com/blogs/architecture/exponential-backoff-and-jitter/
+        jitter_cap = max(0.0, self.max_delay - delay)
+        jitter_span = min(delay * 0.25, jitter_cap) if self.jitter else 0.0
+        return delay, jitter_span
 
     def get_delay(self, attempt: int) -> float:
         """Calculate delay for given attempt number (0-indexed)."""
-        delay = min(self.base_delay * (self.exponential_base**attempt), self.max_delay)
+        if attempt < len(self._schedule):
+            delay, jitter_span = self._schedule[attempt]
+        else:
+            delay, jitter_span = self._backoff(attempt)
 
-        if self.jitter:
-            # Add jitter: random value between 0 and 25% of delay.
-            # 25% is a common industry standard to prevent the thundering herd problem,
-            # balancing randomness with predictability. See:
-            # https://aws.amazon.com/blogs/architecture/exponential-backoff-and-jitter/
-            jitter_cap = max(0.0, self.max_delay - delay)
-            jitter_span = min(delay * 0.25, jitter_cap)
-            if jitter_span > 0:
-                delay += random.uniform(0, jitter_span)
+        if jitter_span > 0:
+            delay += self._rng.random() * jitter_span
 
         return delay
 
 
-@dataclass
+@dataclass(slots=True)
 class CircuitBreakerConfig:
     """Configuration for circuit breaker behavior."""
 
@@ -95,6 +121,13 @@ class CircuitBreakerConfig:
     half_open_max_attempts: int = 1  # Test requests in half-open state
 
 
+def _wall_to_monotonic(timestamp: Optional[float]) -> Optional[float]:
+    """Map a persisted wall-clock timestamp onto this process's monotonic clock."""
+    if timestamp is None:
+        return None
+    return time.monotonic() - max(0.0, time.time() - timestamp)
+
+
 class CircuitBreaker:
     """
     Circuit breaker to prevent cascading failures.
@@ -110,6 +143,18 @@ class CircuitBreaker:
         result = await breaker.execute(async_function, *args, **kwargs)
     """
 
+    __slots__ = (
+        "_last_failure_monotonic",
+        "_state_loaded",
+        "config",
+        "failure_count",
+        "half_open_attempts",
+        "last_failure_time",
+        "name",
+        "persistence_backend",
+        "state",
+    )
+
     def __init__(
         self,
         name: str,
@@ -121,7 +166,11 @@ class CircuitBreaker:
         self.persistence_backend = persistence_backend
         self.state = CircuitState.CLOSED
         self.failure_count = 0
+        # Wall-clock time of the last failure, persisted as "opened_at"
         self.last_failure_time: Optional[float] = None
+        # Monotonic reading of the same instant; recovery timing uses this so
+        # NTP steps and manual clock changes cannot open or close the circuit
+        self._last_failure_monotonic: Optional[float] = None
         self.half_open_attempts = 0
 
         # Load state from persistence if available
@@ -139,9 +188,10 @@ class CircuitBreaker:
             if state_data:
                 # Restore state
                 state_str = state_data.get("state", "closed")
-                self.state = CircuitState(state_str)
+                self.state = _STATE_FROM_STR.get(state_str, CircuitState.CLOSED)
                 self.failure_count = state_data.get("failure_count", 0)
                 self.last_failure_time = state_data.get("opened_at")
+                self._last_failure_monotonic = _wall_to_monotonic(self.last_failure_time)
                 self.half_open_attempts = state_data.get("half_open_attempts", 0)
                 logger.info(
                     f"Loaded circuit breaker '{self.name}' state: {self.state.value}, "
@@ -158,72 +208,79 @@ class CircuitBreaker:
             return
 
         try:
-            state_data = {
-                "state": self.state.value,
-                "failure_count": self.failure_count,
-                "opened_at": self.last_failure_time,
-                "half_open_attempts": self.half_open_attempts,
-            }
-            await self.persistence_backend.save_state(self.name, state_data)
+            await self.persistence_backend.save_state(self.name, self._state_snapshot())
         except Exception as e:
             logger.warning(f"Failed to sync circuit breaker state for {self.name}: {e}")
 
+    def _schedule_sync(self) -> None:
+        """Hand the current state to the backend's write-behind buffer."""
+        if self.persistence_backend:
+            self.persistence_backend.schedule_save(self.name, self._state_snapshot())
+
+    def _state_snapshot(self) -> dict[str, Any]:
+        """Current state in the form persistence backends store."""
+        return {
+            "state": self.state.value,
+            "failure_count": self.failure_count,
+            "opened_at": self.last_failure_time,
+            "half_open_attempts": self.half_open_attempts,
+        }
+
     def reset(self) -> None:
         """Reset circuit breaker to CLOSED state."""
         self.state = CircuitState.CLOSED
         self.failure_count = 0
         self.last_failure_time = None
+        self._last_failure_monotonic = None
         self.half_open_attempts = 0
         logger.info(f"🔄 Circuit breaker '{self.name}' reset to CLOSED")
 
-        # Sync to backend (fire and forget)
-        if self.persistence_backend:
-            asyncio.create_task(self.sync_to_backend())
+        # Sync to backend (write-behind)
+        self._schedule_sync()
 
     def record_success(self) -> None:
         """Record successful request."""
-        if self.state == CircuitState.HALF_OPEN:
+        if self.state is CircuitState.HALF_OPEN:
             # Service recovered, close circuit
             self.reset()
             logger.info(f"✅ Circuit breaker '{self.name}' recovered")
-        else:
+        elif self.failure_count:
             # In CLOSED state, reset failure count on success
             self.failure_count = 0
-            # Sync to backend
-            if self.persistence_backend:
-                asyncio.create_task(self.sync_to_backend())
+            # Sync to backend (write-behind); steady-state successes change nothing
+            self._schedule_sync()
 
     def record_failure(self) -> None:
         """Record failed request."""
         self.failure_count += 1
         self.last_failure_time = time.time()
+        self._last_failure_monotonic = time.monotonic()
 
-        if self.state == CircuitState.CLOSED:
+        if self.state is CircuitState.CLOSED:
             if self.failure_count >= self.config.failure_threshold:
                 self.state = CircuitState.OPEN
                 logger.warning(
                     f"🚨 Circuit breaker '{self.name}' OPEN after {self.failure_count} failures"
                 )
-        elif self.state == CircuitState.HALF_OPEN:
+        elif self.state is CircuitState.HALF_OPEN:
             # Failed again during recovery test, reopen circuit
             self.state = CircuitState.OPEN
             logger.warning(f"🚨 Circuit breaker '{self.name}' reopened after failed test")
 
-        # Sync to backend
-        if self.persistence_backend:
-            asyncio.create_task(self.sync_to_backend())
+        # Sync to backend (write-behind)
+        self._schedule_sync()
 
     def can_attempt(self) -> bool:
         """Check if request should be allowed."""
-        if self.state == CircuitState.CLOSED:
+        if self.state is CircuitState.CLOSED:
             return True
 
-        if self.state == CircuitState.OPEN:
+        if self.state is CircuitState.OPEN:
             # Check if recovery timeout has elapsed
-            if self.last_failure_time is None:
+            if self._last_failure_monotonic is None:
                 return True
 
-            elapsed = time.time() - self.last_failure_time
+            elapsed = time.monotonic() - self._last_failure_monotonic
             if elapsed >= self.config.recovery_timeout:
                 # Try recovery
                 self.state = CircuitState.HALF_OPEN
@@ -309,6 +366,7 @@ async def retry_with_backoff(
         policy = RetryPolicy()
 
     last_exception: Optional[Exception] = None
+    last_attempt = policy.max_attempts - 1
 
     for attempt in range(policy.max_attempts):
         try:
@@ -328,20 +386,23 @@ async def retry_with_backoff(
             last_exception = e
 
             # Don't retry if circuit breaker is open
-            if circuit_breaker and circuit_breaker.get_state() == CircuitState.OPEN:
-                logger.error(f"Circuit breaker open, not retrying: {e}")
+            if circuit_breaker and circuit_breaker.state is CircuitState.OPEN:
+                logger.error("Circuit breaker open, not retrying: %s", e)
                 raise
 
             # Don't retry on last attempt
-            if attempt == policy.max_attempts - 1:
-                logger.error(f"❌ All {policy.max_attempts} retry attempts exhausted: {e}")
+            if attempt == last_attempt:
+                logger.error("❌ All %d retry attempts exhausted: %s", policy.max_attempts, e)
                 raise
 
             # Calculate delay and retry
             delay = policy.get_delay(attempt)
             logger.warning(
-                f"⚠️ Attempt {attempt + 1}/{policy.max_attempts} failed: {e}. "
-                f"Retrying in {delay:.2f}s..."
+                "⚠️ Attempt %d/%d failed: %s. Retrying in %.2fs...",
+                attempt + 1,
+                policy.max_attempts,
+                e,
+                delay,
             )
             await asyncio.sleep(delay)
 
@@ -351,16 +412,16 @@ async def retry_with_backoff(
 
         except Exception as e:
             # Check if circuit breaker is open - don't retry
-            if circuit_breaker and circuit_breaker.get_state() == CircuitState.OPEN:
-                logger.error(f"Circuit breaker open, not retrying: {e}")
+            if circuit_breaker and circuit_breaker.state is CircuitState.OPEN:
+                logger.error("Circuit breaker open, not retrying: %s", e)
                 raise
 
             # Unknown exceptions - log and retry (conservative approach)
             last_exception = e
-            logger.warning(f"⚠️ Unknown exception type {type(e).__name__}, retrying: {e}")
+            logger.warning("⚠️ Unknown exception type %s, retrying: %s", type(e).__name__, e)
 
-            if attempt == policy.max_attempts - 1:
-                logger.error(f"❌ All {policy.max_attempts} retry attempts exhausted: {e}")
+            if attempt == last_attempt:
+                logger.error("❌ All %d retry attempts exhausted: %s", policy.max_attempts, e)
                 raise
 
             delay = policy.get_delay(attempt)
@@ -414,6 +475,32 @@ CONSERVATIVE_RETRY_POLICY = RetryPolicy(
 
 # Global circuit breakers for services (can be accessed across modules)
 _circuit_breakers: dict[str, CircuitBreaker] = {}
+# One backend per Redis client (keyed by id; the backend keeps the client alive)
+_persistence_backends: dict[int, "CircuitBreakerPersistenceBackend"] = {}
+
+
+def _persistence_backend_for(redis_client: Any) -> Optional["CircuitBreakerPersistenceBackend"]:
+    """
+    Return the persistence backend shared by every breaker on this Redis client.
+
+    Sharing the backend lets its write-behind buffer batch state changes from
+    all breakers into one pipeline. Returns None when persistence is disabled.
+    """
+    from app.core.config import settings
+
+    if not settings.ENABLE_CIRCUIT_BREAKER_PERSISTENCE:
+        return None
+
+    key = id(redis_client)
+    try:
+        return _persistence_backends[key]
+    except KeyError:
+        pass
+
+    from app.core.circuit_breaker_persistence import RedisCircuitBreakerBackend
+
+    backend = _persistence_backends[key] = RedisCircuitBreakerBackend(redis_client)
+    return backend
 
 
 def get_circuit_breaker(
@@ -437,26 +524,36 @@ def get_circuit_breaker(
         If ENABLE_CIRCUIT_BREAKER_PERSISTENCE is True and redis_client is provided,
         the circuit breaker will persist its state to Redis.
     """
-    if name not in _circuit_breakers:
-        if config is None:
-            config = CircuitBreakerConfig()
-
-        # Create persistence backend if enabled and Redis is available
-        persistence_backend = None
+    # Existing breakers cost one dict lookup; settings are only read on creation
+    try:
+        return _circuit_breakers[name]
+    except KeyError:
+        pass
+
+    if config is None:
+        config = CircuitBreakerConfig()
+
+    # Create persistence backend if enabled and Redis is available
+    persistence_backend = None
+    if redis_client:
         try:
-            from app.core.config import settings
-
-            if settings.ENABLE_CIRCUIT_BREAKER_PERSISTENCE and redis_client:
-                from app.core.circuit_breaker_persistence import RedisCircuitBreakerBackend
-
-                persistence_backend = RedisCircuitBreakerBackend(redis_client)
+            persistence_backend = _persistence_backend_for(redis_client)
+            if persistence_backend:
                 logger.info(f"Circuit breaker '{name}' using Redis persistence")
         except Exception as e:
             logger.warning(f"Failed to initialize circuit breaker persistence: {e}")
 
-        _circuit_breakers[name] = CircuitBreaker(name, config, persistence_backend)
+    breaker = _circuit_breakers[name] = CircuitBreaker(name, config, persistence_backend)
+    return breaker
+
 
-    return _circuit_breakers[name]
+async def close_persistence_backends() -> None:
+    """Flush and close every circuit breaker persistence backend (call on shutdown)."""
+    for backend in _persistence_backends.values():
+        try:
+            await backend.close()
+        except Exception as e:
+            logger.warning(f"Failed to close circuit breaker persistence backend: {e}")
 
 
 def reset_all_circuit_breakers() -> None:
@@ -0,0 +1,44 @@
+"""
+Pre-serialized responses: JSON for endpoints that build their own Pydantic
+models, and Server-Sent Events frames for the streaming endpoints.
+
+When an endpoint returns a plain model, FastAPI validates it against
+``response_model`` a second time before serializing it. Returning a
+``Response`` skips that pass. The model is dumped once with Pydantic's
+Rust serializer, and ``response_model`` still documents the schema.
+"""
+
+from typing import Any, Dict, Sequence, Union
+
+import orjson
+from fastapi import Response, status
+from pydantic import BaseModel
+
+
+def model_response(
+    content: Union[BaseModel, Sequence[BaseModel]],
+    status_code: int = status.HTTP_200_OK,
+) -> Response:
+    """
+    Serialize an already-validated model (or list of models) to a JSON response.
+
+    Args:
+        content: Pydantic model instance, or a sequence of them for list endpoints
+        status_code: HTTP status code (the decorator's status_code is not applied
+            to returned Response objects)
+
+    Returns:
+        Response with the JSON body and ``application/json`` media type
+    """
+    if isinstance(content, BaseModel):
+        body = content.model_dump_json()
+    else:
+        body = "[" + ",".join(item.model_dump_json() for item in content) + "]"
+
+    return Response(content=body, status_code=status_code, media_type="application/json")
+
+
+def sse_event(data: Dict[str, Any]) -> str:
+    """Format a payload as a Server-Sent Events data frame."""
+    # orjson encodes UUIDs natively; this runs once per streamed token
+    return f"data: {orjson.dumps(data, default=str).decode()}\n\n"
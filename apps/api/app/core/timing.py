@@ -0,0 +1,47 @@
+"""
+Response timing middleware.
+
+Implements:
+- One monotonic clock read at request start and one at response start
+- ``X-Response-Time-ms`` header with the time until the response headers are sent
+- Pure ASGI, so streaming responses pass through without buffering
+"""
+
+# Standard library imports
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+RESPONSE_TIME_HEADER = b"x-response-time-ms"
+
+
+class ResponseTimeMiddleware:
+    """
+    Add an ``X-Response-Time-ms`` header to every HTTP response.
+
+    For streaming endpoints (e.g. chat SSE) the value is time-to-first-byte,
+    since headers go out before the body.
+
+    Usage:
+        app.add_middleware(ResponseTimeMiddleware)
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start_ns = time.perf_counter_ns()
+
+        async def send_with_timing(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                elapsed_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
+                headers = list(message.get("headers", []))
+                headers.append((RESPONSE_TIME_HEADER, f"{elapsed_ms:.2f}".encode()))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        await self.app(scope, receive, send_with_timing)
@@ -0,0 +1,74 @@
+"""
+Startup warm-up for the services on the /query and /chat hot path.
+
+Implements:
+- One throwaway embedding, vector search and LLM generation during lifespan startup
+- Steps run concurrently, each bounded by its own timeout
+- Best effort: failures are logged and never block the application from starting
+"""
+
+# Standard library imports
+import asyncio
+import logging
+import time
+from typing import Awaitable, Dict
+
+from app.services.embeddings import EmbeddingsService
+from app.services.llm import LLMService
+from app.services.vector_db import VectorDBService
+
+logger = logging.getLogger(__name__)
+
+WARMUP_TEXT = "warmup"
+
+
+async def _embed_and_search(embeddings: EmbeddingsService, vector_db: VectorDBService) -> None:
+    """Open the TEI and Qdrant connections with one uncached search."""
+    embedding = await embeddings.generate_embedding(WARMUP_TEXT)
+    # No query_text, so the warm-up search is never written to the query cache
+    await vector_db.search(query_embedding=embedding, limit=1)
+
+
+async def _timed(name: str, step: Awaitable[object], timeout: float) -> bool:
+    """Run one warm-up step, logging its duration or why it failed."""
+    start_ns = time.perf_counter_ns()
+    try:
+        await asyncio.wait_for(step, timeout=timeout)
+    except asyncio.TimeoutError:
+        logger.warning("  ⚠️  %s warm-up timed out after %.0fs", name, timeout)
+        return False
+    except Exception as e:
+        logger.warning("  ⚠️  %s warm-up failed: %s", name, e)
+        return False
+
+    logger.info("  🔥 %s warmed in %.0fms", name, (time.perf_counter_ns() - start_ns) / 1e6)
+    return True
+
+
+async def warm_up_services(
+    embeddings: EmbeddingsService,
+    vector_db: VectorDBService,
+    llm: LLMService,
+    timeout: float = 30.0,
+) -> Dict[str, bool]:
+    """
+    Pay the cold-start cost of the query path before the first request arrives.
+
+    The embedding and search share a step because the search needs the vector.
+    The LLM step makes Ollama load the model into memory.
+
+    Args:
+        embeddings: Embeddings service singleton
+        vector_db: Initialized vector database service singleton
+        llm: LLM service singleton
+        timeout: Seconds allowed for each step
+
+    Returns:
+        Mapping of step name to whether it completed
+    """
+    steps = {
+        "Embeddings + vector search": _embed_and_search(embeddings, vector_db),
+        "LLM": llm.generate_response(query=WARMUP_TEXT, context=""),
+    }
+    results = await asyncio.gather(*(_timed(name, step, timeout) for name, step in steps.items()))
+    return dict(zip(steps, results))
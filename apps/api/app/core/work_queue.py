@@ -0,0 +1,108 @@
+"""
+Bounded background work queue with a fixed pool of worker tasks.
+
+Implements:
+- Fixed-size queue that rejects new work when full (backpressure)
+- Fixed number of workers capping how many jobs run concurrently
+- Graceful shutdown that drains queued work before cancelling workers
+"""
+
+# Standard library imports
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+Job = Tuple[Callable[..., Awaitable[Any]], Tuple[Any, ...], Dict[str, Any]]
+
+
+class BoundedWorkQueue:
+    """
+    Run fire-and-forget coroutines on a bounded queue drained by N workers.
+
+    Unlike FastAPI BackgroundTasks, which start every job on the event loop
+    as soon as the response is sent, jobs here wait in a queue of at most
+    ``maxsize`` entries and at most ``workers`` run at once. ``submit`` raises
+    ``asyncio.QueueFull`` instead of growing without bound.
+
+    Usage:
+        queue = BoundedWorkQueue(maxsize=256, workers=8, name="ingestion")
+        queue.start()
+
+        queue.submit(process_and_store_document, content=..., source_url=...)
+    """
+
+    def __init__(self, maxsize: int = 256, workers: int = 8, name: str = "work_queue"):
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be >= 1, got {maxsize}")
+        if workers < 1:
+            raise ValueError(f"workers must be >= 1, got {workers}")
+
+        self.maxsize = maxsize
+        self.workers = workers
+        self.name = name
+        self._queue: Optional["asyncio.Queue[Job]"] = None
+        self._tasks: List[asyncio.Task[None]] = []
+
+    def start(self) -> None:
+        """Create the queue and spawn the worker tasks on the running loop."""
+        if self._tasks:
+            return
+
+        self._queue = asyncio.Queue(maxsize=self.maxsize)
+        self._tasks = [
+            asyncio.create_task(self._worker(self._queue), name=f"{self.name}-{i}")
+            for i in range(self.workers)
+        ]
+
+    def full(self) -> bool:
+        """Return True if a submit() right now would be rejected."""
+        return self._queue is not None and self._queue.full()
+
+    def qsize(self) -> int:
+        """Return the number of jobs waiting to run."""
+        return self._queue.qsize() if self._queue is not None else 0
+
+    def submit(self, func: Callable[..., Awaitable[Any]], /, *args: Any, **kwargs: Any) -> None:
+        """
+        Enqueue ``func(*args, **kwargs)`` to run on a worker.
+
+        Raises:
+            RuntimeError: If the queue has not been started
+            asyncio.QueueFull: If ``maxsize`` jobs are already waiting
+        """
+        if self._queue is None:
+            raise RuntimeError(f"{self.name} not started")
+        self._queue.put_nowait((func, args, kwargs))
+
+    async def _worker(self, queue: "asyncio.Queue[Job]") -> None:
+        """Run queued jobs one at a time; a failing job never stops the worker."""
+        while True:
+            func, args, kwargs = await queue.get()
+            try:
+                await func(*args, **kwargs)
+            except Exception:
+                logger.exception("%s: job %s failed", self.name, getattr(func, "__name__", func))
+            finally:
+                queue.task_done()
+
+    async def close(self, timeout: float = 10.0) -> None:
+        """
+        Wait up to ``timeout`` seconds for queued jobs to finish, then stop the workers.
+
+        Jobs still waiting after the timeout are dropped and logged.
+        """
+        queue, tasks = self._queue, self._tasks
+        self._queue = None
+        self._tasks = []
+
+        if queue is not None:
+            try:
+                await asyncio.wait_for(queue.join(), timeout=timeout)
+            except asyncio.TimeoutError:
+                logger.warning("%s: dropping %d queued jobs on shutdown", self.name, queue.qsize())
+
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
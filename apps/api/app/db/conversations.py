@@ -0,0 +1,100 @@
+"""
+Conversation lookups shared by the conversation and chat endpoints.
+"""
+
+from typing import NoReturn, Optional, Tuple
+from uuid import UUID
+from fastapi import HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import Select, select, func, desc, literal
+from sqlalchemy.orm import raiseload, selectinload
+
+from app.db.models import Conversation, Message
+
+
+def conversation_select(
+    conversation_id: UUID, load_tags: bool = False, load_messages: bool = False
+) -> Select:
+    """
+    Build the SELECT for one conversation.
+
+    Relationships are only eager-loaded when requested; unrequested ones are
+    set to raise on access instead of silently issuing extra SELECTs.
+    """
+    return (
+        select(Conversation)
+        .where(Conversation.id == conversation_id)
+        .options(
+            selectinload(Conversation.tags) if load_tags else raiseload(Conversation.tags),
+            selectinload(Conversation.messages)
+            if load_messages
+            else raiseload(Conversation.messages),
+        )
+    )
+
+
+def raise_conversation_not_found(conversation_id: UUID) -> NoReturn:
+    """Raise the 404 for a missing conversation."""
+    raise HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail=f"Conversation {conversation_id} not found",
+    )
+
+
+async def conversation_exists(conversation_id: UUID, db: AsyncSession) -> bool:
+    """Check a conversation exists without loading the row or its relationships."""
+    result = await db.execute(select(literal(1)).where(Conversation.id == conversation_id))
+    return result.scalar() is not None
+
+
+async def get_conversation_or_404(
+    conversation_id: UUID,
+    db: AsyncSession,
+    load_tags: bool = False,
+    load_messages: bool = False,
+) -> Conversation:
+    """Get conversation by ID or raise 404."""
+    result = await db.execute(conversation_select(conversation_id, load_tags, load_messages))
+    conversation = result.scalar_one_or_none()
+
+    if not conversation:
+        raise_conversation_not_found(conversation_id)
+
+    return conversation
+
+
+async def get_conversation_with_count_or_404(
+    conversation_id: UUID, db: AsyncSession, with_last_message: bool = False
+) -> Tuple[Conversation, int, Optional[str]]:
+    """
+    Get conversation (with tags) and its message stats in one SELECT, or raise 404.
+
+    Returns:
+        (conversation, message_count, last_message_content). The last message
+        content is only looked up when ``with_last_message`` is set.
+    """
+    message_count = (
+        select(func.count())
+        .where(Message.conversation_id == Conversation.id)
+        .correlate(Conversation)
+        .scalar_subquery()
+    )
+    query = conversation_select(conversation_id, load_tags=True).add_columns(message_count)
+    if with_last_message:
+        last_content = (
+            select(Message.content)
+            .where(Message.conversation_id == Conversation.id)
+            .order_by(desc(Message.created_at))
+            .limit(1)
+            .correlate(Conversation)
+            .scalar_subquery()
+        )
+        query = query.add_columns(last_content)
+
+    result = await db.execute(query)
+    row = result.one_or_none()
+
+    if row is None:
+        raise_conversation_not_found(conversation_id)
+
+    return row[0], row[1] or 0, row[2] if with_last_message else None
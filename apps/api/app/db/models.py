@@ -9,6 +9,7 @@ Defines SQLAlchemy ORM models for:
 
 from sqlalchemy import Column, String, Text, DateTime, ForeignKey, JSON
 from sqlalchemy.orm import relationship, DeclarativeBase
+from sqlalchemy.ext.associationproxy import association_proxy
 from sqlalchemy.dialects.postgresql import UUID
 from datetime import datetime, timezone
 import uuid
@@ -34,6 +35,7 @@ class Conversation(Base):
         extra_data: Additional metadata (JSON)
         messages: Related messages (relationship)
         tags: Related tags (relationship)
+        tag_names: Tag strings, proxied through the tags relationship
     """
 
     __tablename__ = "conversations"
@@ -61,6 +63,7 @@ class Conversation(Base):
         cascade="all, delete-orphan",
         lazy="selectin",
     )
+    tag_names = association_proxy("tags", "tag", creator=lambda tag: ConversationTag(tag=tag))
 
 
 class Message(Base):
@@ -9,10 +9,12 @@ from app.services.embeddings import EmbeddingsService
 from app.services.llm import LLMService
 from app.services.redis_service import RedisService
 from app.services.query_cache import QueryCache
+from app.services.semantic_cache import SemanticQueryCache
 from app.services.language_detection import LanguageDetectionService
 from app.services.graph_db import GraphDBService
 from app.services.entity_extractor import EntityExtractor
 from app.services.relationship_extractor import RelationshipExtractor
+from app.core.work_queue import BoundedWorkQueue
 
 # Global service instances
 _firecrawl_service: Optional[FirecrawlService] = None
@@ -21,10 +23,12 @@ _embeddings_service: Optional[EmbeddingsService] = None
 _llm_service: Optional[LLMService] = None
 _redis_service: Optional[RedisService] = None
 _query_cache: Optional[QueryCache] = None
+_semantic_cache: Optional[SemanticQueryCache] = None
 _language_detection_service: Optional[LanguageDetectionService] = None
 _graph_db_service: Optional[GraphDBService] = None
 _entity_extractor: Optional[EntityExtractor] = None
 _relationship_extractor: Optional[RelationshipExtractor] = None
+_ingestion_queue: Optional[BoundedWorkQueue] = None
 
 
 def get_firecrawl_service() -> FirecrawlService:
@@ -257,6 +261,48 @@ def clear_query_cache() -> None:
     _query_cache = None
 
 
+# SemanticQueryCache dependency functions
+def get_semantic_cache() -> SemanticQueryCache:
+    """Get the singleton SemanticQueryCache instance."""
+    global _semantic_cache
+    if _semantic_cache is None:
+        raise RuntimeError("SemanticQueryCache not initialized. Application may not be started.")
+    return _semantic_cache
+
+
+def set_semantic_cache(cache: SemanticQueryCache) -> None:
+    """Set the singleton SemanticQueryCache instance."""
+    global _semantic_cache
+    _semantic_cache = cache
+
+
+def clear_semantic_cache() -> None:
+    """Clear the singleton SemanticQueryCache instance."""
+    global _semantic_cache
+    _semantic_cache = None
+
+
+# Ingestion queue dependency functions
+def get_ingestion_queue() -> BoundedWorkQueue:
+    """Get the singleton background ingestion queue."""
+    global _ingestion_queue
+    if _ingestion_queue is None:
+        raise RuntimeError("Ingestion queue not initialized. Application may not be started.")
+    return _ingestion_queue
+
+
+def set_ingestion_queue(queue: BoundedWorkQueue) -> None:
+    """Set the singleton background ingestion queue."""
+    global _ingestion_queue
+    _ingestion_queue = queue
+
+
+def clear_ingestion_queue() -> None:
+    """Clear the singleton background ingestion queue."""
+    global _ingestion_queue
+    _ingestion_queue = None
+
+
 # Utility function to clear all services
 def clear_all_services() -> None:
     """Clear all singleton service instances."""
@@ -266,7 +312,9 @@ def clear_all_services() -> None:
     clear_llm_service()
     clear_redis_service()
     clear_query_cache()
+    clear_semantic_cache()
     clear_language_detection_service()
     clear_graph_db_service()
     clear_entity_extractor()
     clear_relationship_extractor()
+    clear_ingestion_queue()
@@ -11,15 +11,20 @@ from app.api.v1.router import api_router
 from app.db.database import init_db, close_db
 from app.services.firecrawl import FirecrawlService
 from app.services.vector_db import VectorDBService
-from app.services.embeddings import EmbeddingsService
+from app.services.embeddings import BatchedEmbeddingsService
 from app.services.llm import LLMService
 from app.services.redis_service import RedisService
 from app.services.query_cache import QueryCache
+from app.services.semantic_cache import SemanticQueryCache
 from app.services.language_detection import LanguageDetectionService
 from app.services.graph_db import GraphDBService
 from app.services.entity_extractor import EntityExtractor
 from app.services.relationship_extractor import RelationshipExtractor
 from app.services.hybrid_query import HybridQueryEngine
+from app.core.resilience import close_persistence_backends
+from app.core.work_queue import BoundedWorkQueue
+from app.core.timing import ResponseTimeMiddleware
+from app.core.warmup import warm_up_services
 from app.dependencies import (
     set_firecrawl_service,
     set_vector_db_service,
@@ -27,10 +32,12 @@ from app.dependencies import (
     set_llm_service,
     set_redis_service,
     set_query_cache,
+    set_semantic_cache,
     set_language_detection_service,
     set_graph_db_service,
     set_entity_extractor,
     set_relationship_extractor,
+    set_ingestion_queue,
     clear_all_services,
 )
 from app.api.v1.endpoints.graph import set_hybrid_query_engine
@@ -121,6 +128,21 @@ async def lifespan(app: FastAPI):
         else:
             logger.info("  ⚠️  QueryCache DISABLED via configuration")
 
+    # In-process near-duplicate cache for /query; entries are tagged with the
+    # QueryCache revision, so it is only useful (and only safe) with Redis up
+    semantic_cache = SemanticQueryCache(
+        max_entries=settings.SEMANTIC_CACHE_MAX_ENTRIES,
+        ttl=settings.QUERY_CACHE_TTL,
+        similarity_threshold=settings.SEMANTIC_CACHE_SIMILARITY,
+        enabled=settings.ENABLE_SEMANTIC_CACHE and query_cache.enabled,
+    )
+    set_semantic_cache(semantic_cache)
+    logger.info(
+        "  %s SemanticQueryCache %s",
+        "✅" if semantic_cache.enabled else "⚠️ ",
+        "initialized" if semantic_cache.enabled else "DISABLED",
+    )
+
     # Initialize VectorDBService with QueryCache
     logger.info("🔌 Connecting to Qdrant at %s...", settings.QDRANT_URL)
     vector_db_service = VectorDBService(query_cache=query_cache)
@@ -128,9 +150,10 @@ async def lifespan(app: FastAPI):
     set_vector_db_service(vector_db_service)
     logger.info("  ✅ VectorDBService initialized")
 
-    embeddings_service = EmbeddingsService()
+    # Coalesces concurrent single-query embeddings (chat/query) into batched TEI calls
+    embeddings_service = BatchedEmbeddingsService()
     set_embeddings_service(embeddings_service)
-    logger.info("  ✅ EmbeddingsService initialized")
+    logger.info("  ✅ EmbeddingsService initialized (micro-batching enabled)")
 
     llm_service = LLMService()
     set_llm_service(llm_service)
@@ -149,16 +172,35 @@ async def lifespan(app: FastAPI):
     set_entity_extractor(entity_extractor)
     logger.info("  ✅ EntityExtractor initialized")
 
-    relationship_extractor = RelationshipExtractor()
+    relationship_extractor = RelationshipExtractor(llm_service=llm_service)
     set_relationship_extractor(relationship_extractor)
     logger.info("  ✅ RelationshipExtractor initialized")
 
-    # Initialize HybridQueryEngine with QueryCache
-    hybrid_query_engine = HybridQueryEngine(query_cache=query_cache)
-    await hybrid_query_engine.vector_db_service.initialize()
+    # Initialize HybridQueryEngine with QueryCache, reusing the service singletons
+    hybrid_query_engine = HybridQueryEngine(
+        query_cache=query_cache,
+        entity_extractor=entity_extractor,
+        embeddings_service=embeddings_service,
+        vector_db_service=vector_db_service,
+        graph_db_service=graph_db_service,
+    )
     set_hybrid_query_engine(hybrid_query_engine)
     logger.info("  ✅ HybridQueryEngine initialized")
 
+    # Bounded queue for post-response document ingestion (extract)
+    ingestion_queue = BoundedWorkQueue(
+        maxsize=settings.INGESTION_QUEUE_SIZE,
+        workers=settings.INGESTION_WORKERS,
+        name="ingestion",
+    )
+    ingestion_queue.start()
+    set_ingestion_queue(ingestion_queue)
+    logger.info(
+        "  ✅ Ingestion queue started (%d workers, max %d pending)",
+        settings.INGESTION_WORKERS,
+        settings.INGESTION_QUEUE_SIZE,
+    )
+
     # Validate critical service configuration
     if not settings.FIRECRAWL_URL:
         logger.warning(
@@ -169,6 +211,16 @@ async def lifespan(app: FastAPI):
     if not settings.TEI_URL:
         logger.warning("TEI_URL not configured - embeddings generation will fail")
 
+    # Open connections and load models now rather than in the first request
+    if settings.ENABLE_STARTUP_WARMUP:
+        logger.info("🔥 Warming up query path...")
+        await warm_up_services(
+            embeddings_service,
+            vector_db_service,
+            llm_service,
+            timeout=settings.STARTUP_WARMUP_TIMEOUT,
+        )
+
     # Log language filtering configuration
     if settings.ENABLE_LANGUAGE_FILTERING:
         logger.info(
@@ -202,6 +254,20 @@ async def lifespan(app: FastAPI):
     # Shutdown: Clean up resources
     logger.info("🛑 Shutting down GraphRAG API...")
 
+    # Drain queued ingestion jobs while the services they use are still open
+    try:
+        await ingestion_queue.close()
+        logger.info("✅ Ingestion queue drained")
+    except Exception as e:
+        logger.error(f"❌ Error closing ingestion queue: {e}")
+
+    # Write buffered circuit breaker state while Redis is still open
+    try:
+        await close_persistence_backends()
+        logger.info("✅ Circuit breaker state flushed")
+    except Exception as e:
+        logger.error(f"❌ Error flushing circuit breaker state: {e}")
+
     # Close all services
     try:
         await firecrawl_service.close()
@@ -215,6 +281,12 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error(f"❌ Error closing VectorDBService: {e}")
 
+    try:
+        await embeddings_service.close()
+        logger.info("✅ EmbeddingsService closed")
+    except Exception as e:
+        logger.error(f"❌ Error closing EmbeddingsService: {e}")
+
     try:
         await redis_service.close()
         logger.info("✅ RedisService closed")
@@ -253,6 +325,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Response timing (X-Response-Time-ms) measured once here instead of per handler
+app.add_middleware(ResponseTimeMiddleware)
+
 # Include API router
 app.include_router(api_router, prefix=settings.API_V1_STR)
 
@@ -280,9 +355,13 @@ async def health_check_head():
 if __name__ == "__main__":
     import uvicorn
 
+    # uvloop and httptools ship with uvicorn[standard] and are picked automatically.
+    # Keep idle connections open well past the 5s default so Firecrawl's stream of
+    # crawl.page webhooks reuses its connections instead of reconnecting per page.
     uvicorn.run(
         "app.main:app",
         host="0.0.0.0",
         port=4400,
         reload=True,
+        timeout_keep_alive=75,
     )
@@ -9,6 +9,7 @@ import hashlib
 import asyncio
 import logging
 from datetime import datetime, UTC
+from functools import lru_cache
 from typing import Dict, Any, List
 from app.dependencies import get_embeddings_service, get_vector_db_service
 
@@ -22,6 +23,18 @@ MAX_BATCH_SIZE = 80  # Optimal batch size matching TEI max-batch-requests
 MAX_CONCURRENT_BATCHES = 10  # Limit parallel batch processing
 
 
+@lru_cache(maxsize=16384)
+def _doc_id(source_url: str) -> str:
+    """
+    Derive the Qdrant point ID for a source URL.
+
+    Stays MD5 so re-ingesting a URL overwrites its existing point; a different
+    hash would give every already-indexed URL a second, duplicate point.
+    Cached because crawls resend the same URLs via crawl.page and crawl.completed.
+    """
+    return hashlib.md5(source_url.encode()).hexdigest()
+
+
 async def process_and_store_documents_batch(documents: List[Dict[str, Any]]):
     """
     Process and store multiple documents in optimized batches.
@@ -69,12 +82,16 @@ async def process_and_store_documents_batch(documents: List[Dict[str, Any]]):
     try:
         # Add doc IDs and metadata
         for doc in valid_docs:
-            doc["doc_id"] = hashlib.md5(doc["source_url"].encode()).hexdigest()
+            doc["doc_id"] = _doc_id(doc["source_url"])
             if "metadata" not in doc:
                 doc["metadata"] = {}
             doc["metadata"]["source_type"] = doc["source_type"]
             doc["metadata"]["indexed_at"] = datetime.now(UTC).isoformat()
 
+        # Group similar lengths into the same batch so TEI pads each batch to a
+        # length close to its real contents instead of to one outlier page
+        valid_docs.sort(key=lambda doc: len(doc["content"]))
+
         # Split into batches of 80 documents (TEI max-batch-requests)
         batches = [
             valid_docs[i : i + MAX_BATCH_SIZE] for i in range(0, len(valid_docs), MAX_BATCH_SIZE)
@@ -2,8 +2,11 @@
 TEI (Text Embeddings Inference) service for generating embeddings.
 """
 
+import asyncio
 import httpx
+import orjson
 from typing import List
+from app.core.batching import MicroBatcher
 from app.core.config import settings
 
 
@@ -30,18 +33,88 @@ class EmbeddingsService:
         """
         Generate embeddings for multiple texts.
 
+        Inputs larger than EMBEDDINGS_BATCH_SIZE are split into chunks of
+        similar-length texts sent concurrently (at most
+        EMBEDDINGS_MAX_CONCURRENT_REQUESTS at a time) over one connection
+        pool, so callers can pass a whole crawl at once.
+
         Args:
             texts: List of texts to embed
 
         Returns:
-            List of embedding vectors
+            List of embedding vectors, in the same order as texts
         """
+        batch_size = settings.EMBEDDINGS_BATCH_SIZE
         async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/embed",
-                json={"inputs": texts},
-                timeout=60.0,
+            if len(texts) <= batch_size:
+                return await self._embed(client, texts)
+
+            semaphore = asyncio.Semaphore(settings.EMBEDDINGS_MAX_CONCURRENT_REQUESTS)
+
+            async def embed_chunk(chunk: List[str]) -> List[List[float]]:
+                async with semaphore:
+                    return await self._embed(client, chunk)
+
+            # Chunk in length order so each request pads to similar lengths,
+            # then put the vectors back in the caller's order
+            order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+            by_length = [texts[i] for i in order]
+            chunks = await asyncio.gather(
+                *(
+                    embed_chunk(by_length[i : i + batch_size])
+                    for i in range(0, len(by_length), batch_size)
+                )
             )
-            response.raise_for_status()
-            result: List[List[float]] = response.json()
-            return result
+
+            vectors: List[List[float]] = [[] for _ in texts]
+            for i, vector in zip(order, (v for chunk in chunks for v in chunk)):
+                vectors[i] = vector
+            return vectors
+
+    async def _embed(self, client: httpx.AsyncClient, texts: List[str]) -> List[List[float]]:
+        """Send one /embed request."""
+        response = await client.post(
+            f"{self.base_url}/embed",
+            json={"inputs": texts},
+            timeout=60.0,
+        )
+        response.raise_for_status()
+        # Batches are thousands of floats; orjson decodes them several times
+        # faster than the stdlib json behind response.json()
+        result: List[List[float]] = orjson.loads(response.content)
+        return result
+
+
+class BatchedEmbeddingsService(EmbeddingsService):
+    """
+    EmbeddingsService that coalesces concurrent single-text requests.
+
+    Concurrent generate_embedding() calls (e.g. parallel chat requests) are
+    collected for a few milliseconds and sent to TEI as one /embed call.
+    generate_embeddings() is unchanged and still issues its own request.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._batcher: MicroBatcher[str, List[float]] = MicroBatcher(
+            self.generate_embeddings,
+            max_batch_size=settings.MICRO_BATCH_MAX_SIZE,
+            max_wait_ms=settings.MICRO_BATCH_MAX_WAIT_MS,
+            name="embeddings",
+        )
+
+    async def generate_embedding(self, text: str) -> List[float]:
+        """
+        Generate embedding for a single text via the shared micro-batch.
+
+        Args:
+            text: The text to embed
+
+        Returns:
+            List of floats representing the embedding vector
+        """
+        return await self._batcher.submit(text)
+
+    async def close(self) -> None:
+        """Stop the batching worker."""
+        await self._batcher.close()
@@ -42,9 +42,12 @@ class FirecrawlService:
             self._client = httpx.AsyncClient(
                 headers=self.headers,
                 timeout=httpx.Timeout(60.0, connect=10.0),
+                # One pool shared by every Firecrawl endpoint via the app singleton;
+                # keep enough warm connections for concurrent crawl/scrape traffic
                 limits=httpx.Limits(
-                    max_connections=100,
-                    max_keepalive_connections=20,
+                    max_connections=128,
+                    max_keepalive_connections=64,
+                    keepalive_expiry=60.0,
                 ),
             )
         return self._client
@@ -187,6 +190,9 @@ class FirecrawlService:
         Map a website to get all URLs with retry logic.
 
         POST /v2/map
+
+        The v2 map endpoint returns every discovered link (up to ``limit``) in a
+        single response; unlike crawl status there is no ``next`` page to follow.
         """
 
         async def _make_request():
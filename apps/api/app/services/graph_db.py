@@ -216,15 +216,61 @@ class GraphDBService:
         if not self._initialized:
             raise RuntimeError("GraphDBService not initialized. Call initialize() first.")
 
+        async with self.driver.session() as session:
+            query = self._connections_query(max_depth, relationship_types, optional=False)
+            result = await session.run(query, entity_id=entity_id)
+
+            return [self._connection_from_record(record) async for record in result]
+
+    async def get_entity_connections(
+        self, entity_id: str, max_depth: int = 2, relationship_types: Optional[List[str]] = None
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Find connected entities, distinguishing a missing entity from one with no connections.
+
+        Uses OPTIONAL MATCH so the existence check and the traversal share one
+        round-trip: no rows means the start entity does not exist, a single row
+        with a null ``connected`` means it exists but has no matching neighbours.
+
+        Args:
+            entity_id: Starting entity ID
+            max_depth: Maximum traversal depth (1-4 recommended)
+            relationship_types: Optional filter on relationship types
+
+        Returns:
+            Same shape as find_connected_entities, or None if the entity does not exist
+        """
+        if not self._initialized:
+            raise RuntimeError("GraphDBService not initialized. Call initialize() first.")
+
+        async with self.driver.session() as session:
+            query = self._connections_query(max_depth, relationship_types, optional=True)
+            result = await session.run(query, entity_id=entity_id)
+
+            records = [record async for record in result]
+            if not records:
+                return None
+
+            return [
+                self._connection_from_record(record)
+                for record in records
+                if record["connected"] is not None
+            ]
+
+    @staticmethod
+    def _connections_query(
+        max_depth: int, relationship_types: Optional[List[str]], optional: bool
+    ) -> str:
+        """Build the variable-length traversal query used by the connection lookups."""
         # Build relationship type filter
         rel_filter = ""
         if relationship_types:
             rel_filter = f":{('|'.join(relationship_types))}"
 
-        async with self.driver.session() as session:
-            query = f"""
+        match = "OPTIONAL MATCH" if optional else "MATCH"
+        return f"""
             MATCH (start:Entity {{id: $entity_id}})
-            MATCH path = (start)-[r{rel_filter}*1..{max_depth}]-(connected)
+            {match} path = (start)-[r{rel_filter}*1..{max_depth}]-(connected)
             WHERE connected.id <> start.id
             RETURN DISTINCT connected,
                    [rel in relationships(path) | type(rel)] as relationship_path,
@@ -232,19 +278,14 @@ class GraphDBService:
             ORDER BY distance
             """
 
-            result = await session.run(query, entity_id=entity_id)
-
-            connected_entities = []
-            async for record in result:
-                connected_entities.append(
-                    {
-                        "connected": dict(record["connected"]),
-                        "relationship_path": record["relationship_path"],
-                        "distance": record["distance"],
-                    }
-                )
-
-            return connected_entities
+    @staticmethod
+    def _connection_from_record(record: Any) -> Dict[str, Any]:
+        """Convert a traversal record into a connection dictionary."""
+        return {
+            "connected": dict(record["connected"]),
+            "relationship_path": record["relationship_path"],
+            "distance": record["distance"],
+        }
 
     async def search_entities(
         self, query: str, entity_types: Optional[List[str]] = None, limit: int = 10
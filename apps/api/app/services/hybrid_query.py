@@ -22,17 +22,31 @@ logger = logging.getLogger(__name__)
 class HybridQueryEngine:
     """Orchestrate hybrid queries across vector and graph databases."""
 
-    def __init__(self, query_cache: Optional["QueryCache"] = None):
+    def __init__(
+        self,
+        query_cache: Optional["QueryCache"] = None,
+        entity_extractor: Optional[EntityExtractor] = None,
+        embeddings_service: Optional[EmbeddingsService] = None,
+        vector_db_service: Optional[VectorDBService] = None,
+        graph_db_service: Optional[GraphDBService] = None,
+    ):
         """
         Initialize the hybrid query engine with all required services.
 
+        Services that are not passed in are created here. The application
+        passes its singletons so connection pools and loaded models are shared.
+
         Args:
             query_cache: Optional QueryCache instance for caching hybrid query results
+            entity_extractor: Optional shared EntityExtractor
+            embeddings_service: Optional shared EmbeddingsService
+            vector_db_service: Optional shared VectorDBService
+            graph_db_service: Optional shared GraphDBService
         """
-        self.entity_extractor = EntityExtractor()
-        self.embeddings_service = EmbeddingsService()
-        self.vector_db_service = VectorDBService(query_cache=query_cache)
-        self.graph_db_service = GraphDBService()
+        self.entity_extractor = entity_extractor or EntityExtractor()
+        self.embeddings_service = embeddings_service or EmbeddingsService()
+        self.vector_db_service = vector_db_service or VectorDBService(query_cache=query_cache)
+        self.graph_db_service = graph_db_service or GraphDBService()
         self.query_cache = query_cache
         logger.info("Initialized HybridQueryEngine")
 
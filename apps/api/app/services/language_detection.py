@@ -5,7 +5,7 @@ Language detection service for filtering non-English content.
 import hashlib
 import logging
 from functools import lru_cache
-from typing import Dict
+from typing import Dict, List
 from langdetect import detect, LangDetectException
 from app.core.config import settings
 
@@ -92,6 +92,22 @@ class LanguageDetectionService:
 
         return result
 
+    def detect_languages_batch(self, texts: List[str]) -> List[str]:
+        """
+        Detect the language of several texts in one call.
+
+        Meant to be run once per batch in a worker thread (asyncio.to_thread),
+        so a large crawl costs one thread hop instead of blocking the event
+        loop per page. Identical samples are answered from the cache.
+
+        Args:
+            texts: Text contents to analyze
+
+        Returns:
+            Language codes in the same order as texts
+        """
+        return [self.detect_language(text) for text in texts]
+
     def get_cache_stats(self) -> Dict[str, int]:
         """
         Get cache statistics.
@@ -2,8 +2,9 @@
 LLM service for generating responses using Ollama.
 """
 
+import json
 import httpx
-from typing import Optional
+from typing import Any, AsyncIterator, Dict, Optional
 from app.core.config import settings
 
 
@@ -34,6 +35,70 @@ class LLMService:
         if not self.base_url:
             return "LLM service not configured"
 
+        payload = self._build_payload(query, context, system_prompt, stream=False)
+
+        async with httpx.AsyncClient() as client:
+            response = await client.post(
+                f"{self.base_url}/api/generate",
+                json=payload,
+                timeout=120.0,
+            )
+            response.raise_for_status()
+            result = response.json()
+            # Explicitly cast to str to satisfy mypy
+            llm_response: str = result.get("response", "No response generated")
+            return llm_response
+
+    async def stream_response(
+        self,
+        query: str,
+        context: str,
+        system_prompt: Optional[str] = None,
+    ) -> AsyncIterator[str]:
+        """
+        Stream a response token-by-token as the LLM generates it.
+
+        Args:
+            query: User's question
+            context: Retrieved context from vector database
+            system_prompt: Optional custom system prompt
+
+        Yields:
+            Response text fragments, in order
+        """
+        if not self.base_url:
+            yield "LLM service not configured"
+            return
+
+        payload = self._build_payload(query, context, system_prompt, stream=True)
+
+        async with httpx.AsyncClient() as client:
+            async with client.stream(
+                "POST",
+                f"{self.base_url}/api/generate",
+                json=payload,
+                timeout=120.0,
+            ) as response:
+                response.raise_for_status()
+                # Ollama streams one JSON object per line
+                async for line in response.aiter_lines():
+                    if not line:
+                        continue
+                    chunk = json.loads(line)
+                    fragment = chunk.get("response", "")
+                    if fragment:
+                        yield fragment
+                    if chunk.get("done"):
+                        break
+
+    def _build_payload(
+        self,
+        query: str,
+        context: str,
+        system_prompt: Optional[str],
+        stream: bool,
+    ) -> Dict[str, Any]:
+        """Build the Ollama /api/generate request body."""
         default_system = (
             "You are a helpful assistant that answers questions based on the provided context. "
             "If the context doesn't contain enough information to answer the question, "
@@ -47,21 +112,10 @@ Question: {query}
 
 Answer based on the context above:"""
 
-        payload = {
+        payload: Dict[str, Any] = {
             "model": self.model,
             "prompt": prompt,
             "system": system_prompt or default_system,
-            "stream": False,
+            "stream": stream,
         }
-
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/api/generate",
-                json=payload,
-                timeout=120.0,
-            )
-            response.raise_for_status()
-            result = response.json()
-            # Explicitly cast to str to satisfy mypy
-            llm_response: str = result.get("response", "No response generated")
-            return llm_response
+        return payload
@@ -4,7 +4,7 @@ Redis-backed query result cache for improving RAG query performance.
 Provides:
 - Query result caching with configurable TTL
 - Cache key generation from query + parameters
-- Cache invalidation by pattern
+- Cache invalidation via generational revision counters
 - Cache statistics (hit/miss ratio)
 """
 
@@ -12,14 +12,26 @@ import hashlib
 import json
 import logging
 import time
-from typing import Any, Optional, Dict, List
+from typing import Any, Optional, Dict, Tuple
 from redis.asyncio import Redis
 
 logger = logging.getLogger(__name__)
 
 
 class QueryCache:
-    """Redis-backed query result cache."""
+    """
+    Redis-backed query result cache.
+
+    Invalidation is generational: every key embeds the current global and
+    per-collection revision numbers, so invalidating is a single INCR and
+    entries from older generations are never read again. They expire via
+    their TTL (or LRU eviction under ``maxmemory-policy allkeys-lru``).
+    """
+
+    GLOBAL_REVISION_KEY = "query_cache:global_rev"
+    COLLECTION_REVISION_PREFIX = "query_cache:rev:"
+    # Seconds a process trusts its locally cached revision numbers
+    REVISION_CACHE_TTL = 2.0
 
     def __init__(
         self,
@@ -39,25 +51,72 @@ class QueryCache:
         self.default_ttl = default_ttl
         self.enabled = enabled
         self._stats = {"hits": 0, "misses": 0}
+        # collection -> (revision string, monotonic expiry)
+        self._revisions: Dict[str, Tuple[str, float]] = {}
+
+    async def _get_revision(self, collection: str) -> str:
+        """
+        Get the current cache generation for a collection.
+
+        Combines the global and per-collection revision counters (one MGET),
+        cached in-process for REVISION_CACHE_TTL seconds.
+
+        Args:
+            collection: Collection name
+
+        Returns:
+            Revision string in format: {global_rev}.{collection_rev}
+        """
+        cached = self._revisions.get(collection)
+        now = time.monotonic()
+        if cached and cached[1] > now:
+            return cached[0]
+
+        global_rev, collection_rev = await self.redis.mget(
+            self.GLOBAL_REVISION_KEY, f"{self.COLLECTION_REVISION_PREFIX}{collection}"
+        )
+        revision = f"{int(global_rev or 0)}.{int(collection_rev or 0)}"
+        self._revisions[collection] = (revision, now + self.REVISION_CACHE_TTL)
+        return revision
+
+    async def current_revision(self, collection: str) -> Optional[str]:
+        """
+        Get the current cache generation for callers keeping their own caches.
+
+        Args:
+            collection: Collection name
+
+        Returns:
+            Revision string, or None if caching is disabled or Redis is unreachable
+        """
+        if not self.enabled:
+            return None
+
+        try:
+            return await self._get_revision(collection)
+        except Exception as e:
+            logger.warning(f"Cache revision lookup error: {e}")
+            return None
 
     def _generate_cache_key(
-        self, collection: str, query_text: str, **params: Any
+        self, collection: str, revision: str, query_text: str, **params: Any
     ) -> str:
         """
         Generate deterministic cache key from query parameters.
 
         Args:
             collection: Collection name (e.g., "graphrag")
+            revision: Cache generation from _get_revision()
             query_text: Query text
             **params: Additional query parameters (limit, filters, etc.)
 
         Returns:
-            Cache key in format: query_cache:v1:{collection}:{query_hash}
+            Cache key in format: query_cache:v1:{collection}:{revision}:{query_hash}
         """
         # Create deterministic string from query + params
         cache_input = f"{collection}:{query_text}:{json.dumps(params, sort_keys=True)}"
         query_hash = hashlib.sha256(cache_input.encode()).hexdigest()
-        return f"query_cache:v1:{collection}:{query_hash}"
+        return f"query_cache:v1:{collection}:{revision}:{query_hash}"
 
     async def get(
         self, collection: str, query_text: str, **params: Any
@@ -77,7 +136,8 @@ class QueryCache:
             return None
 
         try:
-            key = self._generate_cache_key(collection, query_text, **params)
+            revision = await self._get_revision(collection)
+            key = self._generate_cache_key(collection, revision, query_text, **params)
             data = await self.redis.get(key)
 
             if data:
@@ -129,7 +189,8 @@ class QueryCache:
             return
 
         try:
-            key = self._generate_cache_key(collection, query_text, **params)
+            revision = await self._get_revision(collection)
+            key = self._generate_cache_key(collection, revision, query_text, **params)
             cached_data = {
                 "results": results,
                 "metadata": {
@@ -151,30 +212,20 @@ class QueryCache:
         """
         Invalidate all cached queries for a collection.
 
+        Bumps the collection revision, so existing entries are orphaned in O(1)
+        rather than scanned and deleted.
+
         Args:
             collection: Collection name
 
         Returns:
-            Number of cache entries deleted
+            Number of cache generations invalidated (1, or 0 on error)
         """
         try:
-            pattern = f"query_cache:v1:{collection}:*"
-            deleted_total = 0
-            batch_size = 1000
-            keys_batch: List[str] = []
-
-            async for key in self.redis.scan_iter(match=pattern):
-                keys_batch.append(key)
-                if len(keys_batch) >= batch_size:
-                    deleted_total += await self.redis.delete(*keys_batch)
-                    keys_batch = []
-
-            if keys_batch:
-                deleted_total += await self.redis.delete(*keys_batch)
-
-            if deleted_total > 0:
-                logger.info(f"Invalidated {deleted_total} cache entries for {collection}")
-            return deleted_total
+            revision = await self.redis.incr(f"{self.COLLECTION_REVISION_PREFIX}{collection}")
+            self._revisions.pop(collection, None)
+            logger.info(f"Invalidated cache for {collection} (revision {revision})")
+            return 1
 
         except Exception as e:
             logger.warning(f"Cache invalidation error: {e}")
@@ -184,27 +235,16 @@ class QueryCache:
         """
         Invalidate all cached queries.
 
+        Bumps the global revision that is part of every cache key.
+
         Returns:
-            Number of cache entries deleted
+            Number of cache generations invalidated (1, or 0 on error)
         """
         try:
-            pattern = "query_cache:v1:*"
-            deleted_total = 0
-            batch_size = 1000
-            keys_batch: List[str] = []
-
-            async for key in self.redis.scan_iter(match=pattern):
-                keys_batch.append(key)
-                if len(keys_batch) >= batch_size:
-                    deleted_total += await self.redis.delete(*keys_batch)
-                    keys_batch = []
-
-            if keys_batch:
-                deleted_total += await self.redis.delete(*keys_batch)
-
-            if deleted_total > 0:
-                logger.info(f"Invalidated {deleted_total} total cache entries")
-            return deleted_total
+            revision = await self.redis.incr(self.GLOBAL_REVISION_KEY)
+            self._revisions.clear()
+            logger.info(f"Invalidated all cache entries (global revision {revision})")
+            return 1
 
         except Exception as e:
             logger.warning(f"Cache invalidation error: {e}")
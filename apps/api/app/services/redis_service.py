@@ -8,7 +8,7 @@ Provides methods for:
 """
 
 import logging
-from typing import Optional
+from typing import List, Optional
 import redis.asyncio as redis
 from app.core.config import settings
 
@@ -95,6 +95,62 @@ class RedisService:
             logger.error(f"Failed to check if page processed: {e}")
             return False
 
+    async def mark_pages_processed(self, crawl_id: str, source_urls: List[str]) -> bool:
+        """
+        Mark several pages as processed for a crawl in one round-trip.
+
+        Args:
+            crawl_id: Unique identifier for the crawl job
+            source_urls: Source URLs of the processed pages
+
+        Returns:
+            True if marked successfully (or nothing to mark), False if Redis unavailable
+        """
+        if not source_urls:
+            return True
+
+        if not await self.is_available():
+            logger.debug("Redis unavailable, skipping page tracking")
+            return False
+
+        try:
+            key = f"crawl:{crawl_id}:processed"
+            async with self.client.pipeline(transaction=False) as pipe:
+                pipe.sadd(key, *source_urls)
+                pipe.expire(key, 3600)  # 1 hour TTL
+                await pipe.execute()
+            logger.debug(f"Marked {len(source_urls)} pages as processed")
+            return True
+        except Exception as e:
+            logger.error(f"Failed to mark pages as processed: {e}")
+            return False
+
+    async def are_pages_processed(self, crawl_id: str, source_urls: List[str]) -> List[bool]:
+        """
+        Check which of several pages were already processed, with one SMISMEMBER.
+
+        Args:
+            crawl_id: Unique identifier for the crawl job
+            source_urls: Source URLs to check
+
+        Returns:
+            One flag per URL, in order; all False if Redis is unavailable
+        """
+        if not source_urls:
+            return []
+
+        if not await self.is_available():
+            logger.debug("Redis unavailable, assuming pages not processed")
+            return [False] * len(source_urls)
+
+        try:
+            key = f"crawl:{crawl_id}:processed"
+            result = await self.client.smismember(key, source_urls)
+            return [bool(member) for member in result]
+        except Exception as e:
+            logger.error(f"Failed to check if pages processed: {e}")
+            return [False] * len(source_urls)
+
     async def get_processed_count(self, crawl_id: str) -> int:
         """
         Get count of processed pages for a crawl.
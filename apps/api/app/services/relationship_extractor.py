@@ -6,7 +6,7 @@ Extracts semantic relationships between entities in text.
 
 import json
 import logging
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Optional, Tuple
 from app.services.llm import LLMService
 
 logger = logging.getLogger(__name__)
@@ -39,9 +39,14 @@ RELATIONSHIP_TYPES = [
 class RelationshipExtractor:
     """Extract relationships between entities using LLM."""
 
-    def __init__(self):
-        """Initialize the relationship extractor with LLM service."""
-        self.llm_service = LLMService()
+    def __init__(self, llm_service: Optional[LLMService] = None):
+        """
+        Initialize the relationship extractor with LLM service.
+
+        Args:
+            llm_service: Optional shared LLMService (a new one is created if omitted)
+        """
+        self.llm_service = llm_service or LLMService()
         logger.info("Initialized RelationshipExtractor with LLM service")
 
     async def extract_relationships(
@@ -0,0 +1,253 @@
+"""
+In-process semantic cache for RAG query results.
+
+Provides:
+- Exact lookup on (query text, search parameters) before any embedding work
+- Near-duplicate lookup by cosine similarity against cached query embeddings
+- LRU eviction and per-entry TTL
+- Revision tagging so entries die with QueryCache invalidation
+"""
+
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _Entry:
+    """A cached result set and where its embedding lives in the matrix."""
+
+    slot: int
+    params: Hashable
+    revision: str
+    results: List[Dict[str, Any]]
+    expires_at: float
+
+
+class SemanticQueryCache:
+    """
+    Similarity cache sitting in front of embedding generation and vector search.
+
+    Cached query embeddings are L2-normalised rows of one contiguous float32
+    matrix, so a near-duplicate lookup is a single matrix-vector product.
+    A hit requires the same search parameters and cache revision, and a
+    cosine similarity of at least ``similarity_threshold``.
+
+    All methods are synchronous and never await, so they are safe to call
+    from concurrent request handlers on one event loop without a lock.
+    """
+
+    _INITIAL_CAPACITY = 256
+
+    def __init__(
+        self,
+        max_entries: int = 10_000,
+        ttl: float = 300.0,
+        similarity_threshold: float = 0.97,
+        enabled: bool = True,
+    ):
+        """
+        Initialize semantic cache.
+
+        Args:
+            max_entries: Maximum cached queries before LRU eviction
+            ttl: Seconds an entry stays valid
+            similarity_threshold: Minimum cosine similarity for a near-duplicate hit
+            enabled: Whether caching is enabled (default: True)
+        """
+        if max_entries < 1:
+            raise ValueError(f"max_entries must be >= 1, got {max_entries}")
+
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.similarity_threshold = similarity_threshold
+        self.enabled = enabled
+        self._entries: "OrderedDict[Tuple[str, Hashable], _Entry]" = OrderedDict()
+        self._matrix: Optional[np.ndarray] = None
+        # slot -> owning key, None for free slots
+        self._slot_keys: List[Optional[Tuple[str, Hashable]]] = []
+        self._free_slots: List[int] = []
+        self._stats = {"exact_hits": 0, "similar_hits": 0, "misses": 0}
+
+    def get(
+        self, query_text: str, params: Hashable, revision: str
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Look up results for an identical query without computing its embedding.
+
+        Args:
+            query_text: Query text
+            params: Hashable search parameters (limit, score threshold, ...)
+            revision: Current QueryCache revision for the collection
+
+        Returns:
+            Cached results, or None on miss
+        """
+        if not self.enabled:
+            return None
+
+        key = (query_text, params)
+        entry = self._entries.get(key)
+        if entry is None or not self._is_live(entry, revision):
+            return None
+
+        self._entries.move_to_end(key)
+        self._stats["exact_hits"] += 1
+        return entry.results
+
+    def get_similar(
+        self, embedding: List[float], params: Hashable, revision: str
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Look up results for a semantically near-identical query.
+
+        Args:
+            embedding: Query embedding
+            params: Hashable search parameters; must match the cached entry
+            revision: Current QueryCache revision for the collection
+
+        Returns:
+            Cached results of the most similar live entry, or None on miss
+        """
+        if not self.enabled:
+            return None
+
+        if self._matrix is None or not self._entries:
+            self._stats["misses"] += 1
+            return None
+
+        query = self._normalise(embedding)
+        if query is None or query.shape[0] != self._matrix.shape[1]:
+            self._stats["misses"] += 1
+            return None
+
+        used = len(self._slot_keys)
+        similarities = self._matrix[:used] @ query
+        candidates = np.flatnonzero(similarities >= self.similarity_threshold)
+
+        # Best match first; stale or mismatched candidates fall through to the next
+        for slot in candidates[np.argsort(similarities[candidates])[::-1]]:
+            key = self._slot_keys[slot]
+            if key is None:
+                continue
+            entry = self._entries[key]
+            if entry.params == params and self._is_live(entry, revision):
+                self._entries.move_to_end(key)
+                self._stats["similar_hits"] += 1
+                return entry.results
+
+        self._stats["misses"] += 1
+        return None
+
+    def put(
+        self,
+        query_text: str,
+        params: Hashable,
+        revision: str,
+        embedding: List[float],
+        results: List[Dict[str, Any]],
+    ) -> None:
+        """
+        Cache results for a query.
+
+        Args:
+            query_text: Query text
+            params: Hashable search parameters
+            revision: QueryCache revision the results were computed under
+            embedding: Query embedding
+            results: Search results to cache
+        """
+        if not self.enabled:
+            return
+
+        vector = self._normalise(embedding)
+        if vector is None:
+            return
+        if self._matrix is not None and vector.shape[0] != self._matrix.shape[1]:
+            logger.warning("Embedding dimension changed, clearing semantic cache")
+            self.clear()
+
+        key = (query_text, params)
+        if key in self._entries:
+            self._release(key)
+        while len(self._entries) >= self.max_entries:
+            self._release(next(iter(self._entries)))
+
+        slot, matrix = self._allocate_slot(vector.shape[0])
+        matrix[slot] = vector
+        self._slot_keys[slot] = key
+        self._entries[key] = _Entry(
+            slot=slot,
+            params=params,
+            revision=revision,
+            results=results,
+            expires_at=time.monotonic() + self.ttl,
+        )
+
+    def clear(self) -> None:
+        """Drop every cached entry."""
+        self._entries.clear()
+        self._matrix = None
+        self._slot_keys = []
+        self._free_slots = []
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with exact_hits, similar_hits, misses and size
+        """
+        return {**self._stats, "size": len(self._entries)}
+
+    def _is_live(self, entry: _Entry, revision: str) -> bool:
+        """Check an entry is from the current revision and not expired."""
+        return entry.revision == revision and entry.expires_at > time.monotonic()
+
+    @staticmethod
+    def _normalise(embedding: List[float]) -> Optional[np.ndarray]:
+        """Convert an embedding to a unit-length float32 vector (None if zero)."""
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = float(np.linalg.norm(vector))
+        if vector.ndim != 1 or norm == 0.0:
+            return None
+        return vector / norm
+
+    def _allocate_slot(self, dim: int) -> Tuple[int, np.ndarray]:
+        """
+        Reuse a free matrix row, or append one (growing the matrix in chunks).
+
+        Returns:
+            Tuple of (slot, the matrix that row belongs to)
+        """
+        matrix = self._matrix
+        if matrix is None:
+            capacity = min(self._INITIAL_CAPACITY, self.max_entries)
+            matrix = self._matrix = np.zeros((capacity, dim), dtype=np.float32)
+
+        if self._free_slots:
+            return self._free_slots.pop(), matrix
+
+        slot = len(self._slot_keys)
+        if slot >= matrix.shape[0]:
+            capacity = min(matrix.shape[0] * 2, self.max_entries)
+            grown = np.zeros((capacity, dim), dtype=np.float32)
+            grown[:slot] = matrix
+            matrix = self._matrix = grown
+
+        self._slot_keys.append(None)
+        return slot, matrix
+
+    def _release(self, key: Tuple[str, Hashable]) -> None:
+        """Evict an entry and zero its matrix row so it can never match."""
+        entry = self._entries.pop(key)
+        if self._matrix is not None:
+            self._matrix[entry.slot] = 0.0
+        self._slot_keys[entry.slot] = None
+        self._free_slots.append(entry.slot)
@@ -15,7 +15,9 @@ from qdrant_client.models import (
     FieldCondition,
     MatchValue,
     Condition,
+    SearchRequest,
 )
+from app.core.batching import MicroBatcher
 from app.core.config import settings
 
 if TYPE_CHECKING:
@@ -40,6 +42,12 @@ class VectorDBService:
         self.client: Optional[AsyncQdrantClient] = None
         self.collection_name = settings.QDRANT_COLLECTION
         self.query_cache = query_cache
+        self._search_batcher: MicroBatcher[Dict[str, Any], List[Dict[str, Any]]] = MicroBatcher(
+            self.search_batch,
+            max_batch_size=settings.MICRO_BATCH_MAX_SIZE,
+            max_wait_ms=settings.MICRO_BATCH_MAX_WAIT_MS,
+            name="vector_search",
+        )
 
     async def initialize(self) -> None:
         """
@@ -82,6 +90,7 @@ class VectorDBService:
 
     async def close(self) -> None:
         """Close the Qdrant client connection."""
+        await self._search_batcher.close()
         if self.client:
             await self.client.close()
             self.client = None
@@ -210,33 +219,15 @@ class VectorDBService:
         # Cache miss or caching disabled - perform search
         start_time = time.time()
 
-        query_filter = None
-        if filters:
-            conditions: List[Condition] = []
-            for key, value in filters.items():
-                conditions.append(
-                    FieldCondition(key=f"metadata.{key}", match=MatchValue(value=value))
-                )
-            if conditions:
-                query_filter = Filter(must=conditions)
-
         results = await self.client.search(
             collection_name=self.collection_name,
             query_vector=query_embedding,
             limit=limit,
             score_threshold=score_threshold,
-            query_filter=query_filter,
+            query_filter=self._build_filter(filters),
         )
 
-        formatted_results = [
-            {
-                "id": result.id,
-                "score": result.score,
-                "content": result.payload.get("content"),
-                "metadata": result.payload.get("metadata"),
-            }
-            for result in results
-        ]
+        formatted_results = self._format_results(results)
 
         # Cache results if query_text provided
         if self.query_cache and query_text:
@@ -253,6 +244,97 @@ class VectorDBService:
 
         return formatted_results
 
+    async def search_batch(self, queries: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+        """
+        Run several searches in a single Qdrant request.
+
+        Args:
+            queries: List of dicts with keys:
+                - query_embedding: List[float] (required)
+                - limit: int (default: 10)
+                - score_threshold: Optional[float]
+                - filters: Optional[Dict[str, Any]]
+
+        Returns:
+            One result list per query, in the same order
+        """
+        if self.client is None:
+            raise RuntimeError("VectorDBService not initialized. Call initialize() first.")
+
+        requests = [
+            SearchRequest(
+                vector=query["query_embedding"],
+                limit=query.get("limit", 10),
+                score_threshold=query.get("score_threshold"),
+                filter=self._build_filter(query.get("filters")),
+                with_payload=True,
+            )
+            for query in queries
+        ]
+
+        batch_results = await self.client.search_batch(
+            collection_name=self.collection_name,
+            requests=requests,
+        )
+
+        return [self._format_results(results) for results in batch_results]
+
+    async def batched_search(
+        self,
+        query_embedding: List[float],
+        limit: int = 10,
+        score_threshold: Optional[float] = None,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Search for similar documents, coalescing with concurrent callers.
+
+        Concurrent calls are collected for a few milliseconds and sent to
+        Qdrant as one search_batch request. Results are not cached.
+
+        Args:
+            query_embedding: Vector embedding of the query
+            limit: Maximum number of results to return
+            score_threshold: Minimum similarity score
+            filters: Optional filters to apply
+
+        Returns:
+            List of matching documents with scores
+        """
+        return await self._search_batcher.submit(
+            {
+                "query_embedding": query_embedding,
+                "limit": limit,
+                "score_threshold": score_threshold,
+                "filters": filters,
+            }
+        )
+
+    @staticmethod
+    def _build_filter(filters: Optional[Dict[str, Any]]) -> Optional[Filter]:
+        """Build a Qdrant filter matching each key against the document metadata."""
+        if not filters:
+            return None
+
+        conditions: List[Condition] = [
+            FieldCondition(key=f"metadata.{key}", match=MatchValue(value=value))
+            for key, value in filters.items()
+        ]
+        return Filter(must=conditions)
+
+    @staticmethod
+    def _format_results(results: List[Any]) -> List[Dict[str, Any]]:
+        """Convert Qdrant scored points into plain result dicts."""
+        return [
+            {
+                "id": result.id,
+                "score": result.score,
+                "content": result.payload.get("content"),
+                "metadata": result.payload.get("metadata"),
+            }
+            for result in results
+        ]
+
     async def delete_document(self, doc_id: str):
         """Delete a document from the vector database."""
         if self.client is None:
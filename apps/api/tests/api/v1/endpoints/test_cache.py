@@ -0,0 +1,50 @@
+"""Tests for query cache management endpoints."""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from httpx import AsyncClient
+
+from app.main import app
+from app.dependencies import get_query_cache
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def mock_query_cache():
+    """Mock QueryCache whose invalidation succeeds."""
+    cache = MagicMock()
+    cache.invalidate_collection = AsyncMock(return_value=1)
+    return cache
+
+
+class TestInvalidateCollectionCache:
+    """Tests for DELETE /api/v1/cache/invalidate/collection/{collection}"""
+
+    async def test_invalidate_collection_success(self, test_client: AsyncClient, mock_query_cache):
+        """Test a valid collection name is invalidated."""
+        app.dependency_overrides[get_query_cache] = lambda: mock_query_cache
+
+        try:
+            response = await test_client.delete("/api/v1/cache/invalidate/collection/graph_rag-1")
+
+            assert response.status_code == 200
+            assert response.json()["deleted_count"] == 1
+            mock_query_cache.invalidate_collection.assert_called_once_with("graph_rag-1")
+        finally:
+            app.dependency_overrides.clear()
+
+    @pytest.mark.parametrize("collection", ["bad.name", "bad%20name", "a" * 101])
+    async def test_invalidate_collection_rejects_invalid_name(
+        self, test_client: AsyncClient, mock_query_cache, collection
+    ):
+        """Test names outside the allowed pattern or length are rejected."""
+        app.dependency_overrides[get_query_cache] = lambda: mock_query_cache
+
+        try:
+            response = await test_client.delete(f"/api/v1/cache/invalidate/collection/{collection}")
+
+            assert response.status_code == 422
+            mock_query_cache.invalidate_collection.assert_not_called()
+        finally:
+            app.dependency_overrides.clear()
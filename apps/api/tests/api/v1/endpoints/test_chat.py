@@ -1,10 +1,16 @@
 """Tests for chat endpoint with RAG integration."""
 
+import asyncio
+import json
 import pytest
 from httpx import AsyncClient
+from unittest.mock import MagicMock
 from uuid import UUID
 
 from app.main import app
+from app.api.v1.endpoints.chat import format_context
+from app.db.database import async_session_factory
+from app.db.models import Message
 from app.dependencies import (
     get_embeddings_service,
     get_vector_db_service,
@@ -150,7 +156,7 @@ class TestChatWithRAG:
         """Test chat with RAG enabled queries vector database."""
         # Setup mocks
         mock_embeddings_service.generate_embedding.return_value = [0.1] * 768
-        mock_vector_db_service.search.return_value = [
+        mock_vector_db_service.batched_search.return_value = [
             {
                 "id": "doc1",
                 "score": 0.95,
@@ -180,7 +186,7 @@ class TestChatWithRAG:
             # Verify embeddings were generated
             mock_embeddings_service.generate_embedding.assert_called_once_with("What is GraphRAG?")
             # Verify vector search was performed
-            mock_vector_db_service.search.assert_called_once()
+            mock_vector_db_service.batched_search.assert_called_once()
         finally:
             app.dependency_overrides.clear()
 
@@ -190,7 +196,7 @@ class TestChatWithRAG:
         """Test chat returns RAG sources when enabled."""
         # Setup mocks
         mock_embeddings_service.generate_embedding.return_value = [0.1] * 768
-        mock_vector_db_service.search.return_value = [
+        mock_vector_db_service.batched_search.return_value = [
             {
                 "id": "doc1",
                 "score": 0.95,
@@ -246,7 +252,7 @@ class TestChatWithRAG:
         """Test chat passes vector search results as context to LLM."""
         # Setup mocks
         mock_embeddings_service.generate_embedding.return_value = [0.1] * 768
-        mock_vector_db_service.search.return_value = [
+        mock_vector_db_service.batched_search.return_value = [
             {
                 "id": "doc1",
                 "score": 0.95,
@@ -328,3 +334,215 @@ class TestChatWithRAG:
             assert response.status_code == 404
         finally:
             app.dependency_overrides.clear()
+
+    async def test_chat_invalid_conversation_wins_over_search_error(
+        self, test_client: AsyncClient, mock_embeddings_service, mock_vector_db_service, mock_llm_service
+    ):
+        """Test a missing conversation is reported even when retrieval fails concurrently."""
+        mock_vector_db_service.batched_search.side_effect = ConnectionError("Qdrant down")
+        app.dependency_overrides[get_embeddings_service] = lambda: mock_embeddings_service
+        app.dependency_overrides[get_vector_db_service] = lambda: mock_vector_db_service
+        app.dependency_overrides[get_llm_service] = lambda: mock_llm_service
+
+        try:
+            payload = {
+                "conversation_id": "00000000-0000-0000-0000-000000000000",
+                "message": "Hello!",
+                "use_rag": True,
+            }
+
+            response = await test_client.post("/api/v1/chat/", json=payload)
+
+            assert response.status_code == 404
+            mock_llm_service.generate_response.assert_not_called()
+        finally:
+            app.dependency_overrides.clear()
+
+    async def test_chat_persists_user_message_before_assistant(
+        self, test_client: AsyncClient, mock_embeddings_service, mock_vector_db_service, mock_llm_service
+    ):
+        """Test user and assistant messages are stored in conversation order."""
+        app.dependency_overrides[get_embeddings_service] = lambda: mock_embeddings_service
+        app.dependency_overrides[get_vector_db_service] = lambda: mock_vector_db_service
+        app.dependency_overrides[get_llm_service] = lambda: mock_llm_service
+
+        try:
+            response = await test_client.post(
+                "/api/v1/chat/", json={"message": "First question", "use_rag": False}
+            )
+            data = response.json()
+
+            conv_response = await test_client.get(
+                f"/api/v1/conversations/{data['conversation_id']}"
+            )
+            messages = conv_response.json()["messages"]
+
+            assert [m["role"] for m in messages] == ["user", "assistant"]
+            assert messages[1]["id"] == data["message"]["id"]
+        finally:
+            app.dependency_overrides.clear()
+
+
+class TestFormatContext:
+    """Tests for format_context helper."""
+
+    def test_format_context_numbers_sources(self):
+        """Test results are numbered and separated by blank lines."""
+        results = [
+            {"content": "First", "metadata": {"sourceURL": "https://a.example"}},
+            {"payload": {"content": "Second", "metadata": {"sourceURL": "https://b.example"}}},
+            {"content": "Third", "metadata": {}},
+        ]
+
+        assert format_context(results) == (
+            "Source 1 (https://a.example):\nFirst\n\n"
+            "Source 2 (https://b.example):\nSecond\n\n"
+            "Source 3 (Unknown):\nThird"
+        )
+
+    def test_format_context_empty(self):
+        """Test no results produce an empty context."""
+        assert format_context([]) == ""
+
+
+class TestChatStream:
+    """Tests for POST /api/v1/chat/stream"""
+
+    async def test_chat_stream_emits_sse_tokens(
+        self, test_client: AsyncClient, mock_embeddings_service, mock_vector_db_service, mock_llm_service
+    ):
+        """Test streaming chat sends start, token and done events."""
+        app.dependency_overrides[get_embeddings_service] = lambda: mock_embeddings_service
+        app.dependency_overrides[get_vector_db_service] = lambda: mock_vector_db_service
+        app.dependency_overrides[get_llm_service] = lambda: mock_llm_service
+
+        try:
+            response = await test_client.post(
+                "/api/v1/chat/stream", json={"message": "Hello!", "use_rag": False}
+            )
+
+            assert response.status_code == 200
+            assert response.headers["content-type"].startswith("text/event-stream")
+
+            frames = [line[len("data: "):] for line in response.text.splitlines() if line]
+            assert frames[-1] == "[DONE]"
+
+            events = [json.loads(frame) for frame in frames[:-1]]
+            assert events[0]["type"] == "start"
+            assert UUID(events[0]["conversation_id"])
+            tokens = [e["content"] for e in events if e["type"] == "token"]
+            assert "".join(tokens) == "This is a test response from the LLM."
+        finally:
+            app.dependency_overrides.clear()
+
+    async def test_chat_stream_persists_full_reply(
+        self, test_client: AsyncClient, mock_embeddings_service, mock_vector_db_service, mock_llm_service
+    ):
+        """Test the streamed reply is saved to the assistant message."""
+        app.dependency_overrides[get_embeddings_service] = lambda: mock_embeddings_service
+        app.dependency_overrides[get_vector_db_service] = lambda: mock_vector_db_service
+        app.dependency_overrides[get_llm_service] = lambda: mock_llm_service
+
+        try:
+            response = await test_client.post(
+                "/api/v1/chat/stream", json={"message": "Stream me", "use_rag": False}
+            )
+            start = json.loads(response.text.splitlines()[0][len("data: "):])
+
+            conv_response = await test_client.get(
+                f"/api/v1/conversations/{start['conversation_id']}"
+            )
+            messages = conv_response.json()["messages"]
+
+            assert [m["role"] for m in messages] == ["user", "assistant"]
+            assert messages[1]["id"] == start["message_id"]
+            assert messages[1]["content"] == "This is a test response from the LLM."
+        finally:
+            app.dependency_overrides.clear()
+
+    async def test_chat_stream_error_hides_exception_detail(
+        self, test_client: AsyncClient, mock_embeddings_service, mock_vector_db_service
+    ):
+        """Test a failed generation sends a generic error event, not the exception text."""
+
+        async def stream_response(*args, **kwargs):
+            yield "Partial"
+            raise RuntimeError("upstream secret at http://internal:8000")
+
+        llm = MagicMock()
+        llm.stream_response = MagicMock(side_effect=stream_response)
+        app.dependency_overrides[get_embeddings_service] = lambda: mock_embeddings_service
+        app.dependency_overrides[get_vector_db_service] = lambda: mock_vector_db_service
+        app.dependency_overrides[get_llm_service] = lambda: llm
+
+        try:
+            response = await test_client.post(
+                "/api/v1/chat/stream", json={"message": "Hello!", "use_rag": False}
+            )
+
+            assert "internal:8000" not in response.text
+            frames = [line[len("data: ") :] for line in response.text.splitlines() if line]
+            errors = [json.loads(f) for f in frames[:-1] if '"error"' in f]
+            assert errors == [{"type": "error", "error": "Failed to generate response"}]
+            assert frames[-1] == "[DONE]"
+        finally:
+            app.dependency_overrides.clear()
+
+    async def test_chat_stream_persists_partial_reply_on_disconnect(
+        self, test_client: AsyncClient, mock_embeddings_service, mock_vector_db_service
+    ):
+        """Test a client disconnect mid-stream still saves the tokens sent so far."""
+        first_token_sent = asyncio.Event()
+
+        async def stream_response(*args, **kwargs):
+            yield "Partial reply"
+            await asyncio.Event().wait()  # Generation stalls until the client leaves
+
+        llm = MagicMock()
+        llm.stream_response = MagicMock(side_effect=stream_response)
+        app.dependency_overrides[get_embeddings_service] = lambda: mock_embeddings_service
+        app.dependency_overrides[get_vector_db_service] = lambda: mock_vector_db_service
+        app.dependency_overrides[get_llm_service] = lambda: llm
+
+        body = json.dumps({"message": "Stream me", "use_rag": False}).encode()
+        requests = [{"type": "http.request", "body": body, "more_body": False}]
+        frames = []
+
+        async def receive():
+            if requests:
+                return requests.pop()
+            await first_token_sent.wait()
+            return {"type": "http.disconnect"}
+
+        async def send(message):
+            if message["type"] == "http.response.body" and message.get("body"):
+                frames.append(message["body"].decode())
+                if '"token"' in frames[-1]:
+                    first_token_sent.set()
+
+        # uvicorn reports ASGI 2.3, where Starlette cancels the stream on disconnect
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0", "spec_version": "2.3"},
+            "http_version": "1.1",
+            "method": "POST",
+            "scheme": "http",
+            "path": "/api/v1/chat/stream",
+            "raw_path": b"/api/v1/chat/stream",
+            "root_path": "",
+            "query_string": b"",
+            "headers": [(b"content-type", b"application/json")],
+            "client": ("test", 123),
+            "server": ("test", 80),
+        }
+
+        try:
+            await asyncio.wait_for(app(scope, receive, send), timeout=5)
+
+            start = json.loads(frames[0][len("data: ") :])
+            async with async_session_factory() as session:
+                message = await session.get(Message, UUID(start["message_id"]))
+
+            assert message.content == "Partial reply"
+        finally:
+            app.dependency_overrides.clear()
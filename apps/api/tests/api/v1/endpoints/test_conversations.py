@@ -1,7 +1,9 @@
 """Tests for conversation API endpoints."""
 
 import pytest
+from datetime import datetime, timezone
 from httpx import AsyncClient
+from unittest.mock import patch
 from uuid import UUID
 
 pytestmark = pytest.mark.anyio
@@ -60,6 +62,19 @@ class TestCreateConversation:
         assert data["message_count"] == 1
         assert data["last_message_preview"] == "Hello, world!"
 
+    async def test_create_conversation_with_tags(self, test_client: AsyncClient):
+        """Test creating a conversation with tags stores each tag once."""
+        payload = {"title": "Tagged", "tags": ["work", "urgent", "work"]}
+
+        response = await test_client.post("/api/v1/conversations/", json=payload)
+        data = response.json()
+
+        assert response.status_code == 201
+        assert data["tags"] == ["work", "urgent"]
+
+        get_response = await test_client.get(f"/api/v1/conversations/{data['id']}")
+        assert sorted(get_response.json()["tags"]) == ["urgent", "work"]
+
     async def test_create_conversation_requires_title(self, test_client: AsyncClient):
         """Test that title is required."""
         payload = {"space": "work"}
@@ -113,6 +128,21 @@ class TestListConversations:
         
         assert all(c["space"] == "work" for c in data)
 
+    async def test_list_conversations_filters_by_tag(self, test_client: AsyncClient):
+        """Test filtering conversations by tag."""
+        tagged = await test_client.post("/api/v1/conversations/", json={"title": "Tagged"})
+        untagged = await test_client.post("/api/v1/conversations/", json={"title": "Untagged"})
+        tagged_id = tagged.json()["id"]
+        await test_client.put(
+            f"/api/v1/conversations/{tagged_id}", json={"tags": ["filter-me", "other"]}
+        )
+
+        response = await test_client.get("/api/v1/conversations/?tag=filter-me&limit=100")
+        ids = [c["id"] for c in response.json()]
+
+        assert ids.count(tagged_id) == 1
+        assert untagged.json()["id"] not in ids
+
     async def test_list_conversations_with_limit(self, test_client: AsyncClient):
         """Test limiting number of results."""
         # Create multiple conversations
@@ -126,6 +156,44 @@ class TestListConversations:
         assert len(data) <= 3
 
 
+    async def test_list_conversations_includes_message_stats(self, test_client: AsyncClient):
+        """Test list reports message count and latest message preview."""
+        create_response = await test_client.post(
+            "/api/v1/conversations/",
+            json={"title": "Stats", "space": "stats-test"},
+        )
+        conv_id = create_response.json()["id"]
+
+        for content in ("first", "second", "third"):
+            await test_client.post(
+                f"/api/v1/conversations/{conv_id}/messages",
+                json={"role": "user", "content": content},
+            )
+
+        response = await test_client.get("/api/v1/conversations/?space=stats-test&limit=100")
+        conversation = next(c for c in response.json() if c["id"] == conv_id)
+
+        assert conversation["message_count"] == 3
+        assert conversation["last_message_preview"] == "third"
+
+    async def test_list_conversations_includes_tags(self, test_client: AsyncClient):
+        """Test list returns each conversation's tags."""
+        create_response = await test_client.post(
+            "/api/v1/conversations/",
+            json={"title": "Tagged", "space": "tags-test"},
+        )
+        conv_id = create_response.json()["id"]
+        await test_client.put(
+            f"/api/v1/conversations/{conv_id}",
+            json={"tags": ["alpha", "beta"]},
+        )
+
+        response = await test_client.get("/api/v1/conversations/?space=tags-test&limit=100")
+        conversation = next(c for c in response.json() if c["id"] == conv_id)
+
+        assert set(conversation["tags"]) == {"alpha", "beta"}
+
+
 class TestGetConversation:
     """Tests for GET /api/v1/conversations/{id}"""
 
@@ -163,6 +231,107 @@ class TestGetConversation:
         assert len(data["messages"]) == 1
         assert data["messages"][0]["content"] == "Hello"
 
+    async def test_get_conversation_paginates_messages(self, test_client: AsyncClient):
+        """Test messages are paged newest-first with a cursor for older pages."""
+        create_response = await test_client.post(
+            "/api/v1/conversations/",
+            json={"title": "Long"}
+        )
+        conv_id = create_response.json()["id"]
+        for i in range(5):
+            await test_client.post(
+                f"/api/v1/conversations/{conv_id}/messages",
+                json={"role": "user", "content": f"msg {i}"}
+            )
+
+        first = (await test_client.get(f"/api/v1/conversations/{conv_id}?limit=2")).json()
+        assert [m["content"] for m in first["messages"]] == ["msg 3", "msg 4"]
+        assert first["message_count"] == 5
+        assert first["last_message_preview"] == "msg 4"
+        assert first["next_cursor"] is not None
+
+        second = (
+            await test_client.get(
+                f"/api/v1/conversations/{conv_id}",
+                params={"limit": 2, "before": first["next_cursor"]},
+            )
+        ).json()
+        assert [m["content"] for m in second["messages"]] == ["msg 1", "msg 2"]
+        assert second["last_message_preview"] == "msg 4"
+
+        last = (
+            await test_client.get(
+                f"/api/v1/conversations/{conv_id}",
+                params={"limit": 2, "before": second["next_cursor"]},
+            )
+        ).json()
+        assert [m["content"] for m in last["messages"]] == ["msg 0"]
+        assert last["next_cursor"] is None
+
+    async def test_get_conversation_pages_through_equal_timestamps(
+        self, test_client: AsyncClient
+    ):
+        """Test messages saved in the same instant are neither skipped nor repeated."""
+        create_response = await test_client.post(
+            "/api/v1/conversations/",
+            json={"title": "Same instant"}
+        )
+        conv_id = create_response.json()["id"]
+        with patch("app.db.models.datetime") as mock_datetime:
+            mock_datetime.now.return_value = datetime(2025, 1, 1, tzinfo=timezone.utc)
+            for i in range(5):
+                await test_client.post(
+                    f"/api/v1/conversations/{conv_id}/messages",
+                    json={"role": "user", "content": f"msg {i}"}
+                )
+
+        seen = []
+        params = {"limit": 2}
+        while True:
+            page = (
+                await test_client.get(f"/api/v1/conversations/{conv_id}", params=params)
+            ).json()
+            seen.extend(m["content"] for m in page["messages"])
+            if page["next_cursor"] is None:
+                break
+            params["before"] = page["next_cursor"]
+
+        assert sorted(seen) == [f"msg {i}" for i in range(5)]
+
+    async def test_get_conversation_without_limit_returns_all_messages(
+        self, test_client: AsyncClient
+    ):
+        """Test omitting limit returns the whole history, oldest first."""
+        create_response = await test_client.post(
+            "/api/v1/conversations/",
+            json={"title": "Everything"}
+        )
+        conv_id = create_response.json()["id"]
+        for i in range(60):
+            await test_client.post(
+                f"/api/v1/conversations/{conv_id}/messages",
+                json={"role": "user", "content": f"msg {i}"}
+            )
+
+        data = (await test_client.get(f"/api/v1/conversations/{conv_id}")).json()
+
+        assert [m["content"] for m in data["messages"]] == [f"msg {i}" for i in range(60)]
+        assert data["next_cursor"] is None
+
+    async def test_get_conversation_rejects_malformed_cursor(self, test_client: AsyncClient):
+        """Test a cursor that was not issued by the API returns 400."""
+        create_response = await test_client.post(
+            "/api/v1/conversations/",
+            json={"title": "Cursor"}
+        )
+        conv_id = create_response.json()["id"]
+
+        response = await test_client.get(
+            f"/api/v1/conversations/{conv_id}", params={"limit": 2, "before": "yesterday"}
+        )
+
+        assert response.status_code == 400
+
     async def test_get_conversation_not_found(self, test_client: AsyncClient):
         """Test getting non-existent conversation returns 404."""
         fake_id = "00000000-0000-0000-0000-000000000000"
@@ -212,6 +381,47 @@ class TestUpdateConversation:
         assert update_response.status_code == 200
         assert set(data["tags"]) == {"work", "urgent"}
 
+    async def test_update_conversation_reports_message_count(self, test_client: AsyncClient):
+        """Test update response carries the message count and a fresh updated_at."""
+        create_response = await test_client.post(
+            "/api/v1/conversations/",
+            json={"title": "Before", "initial_message": {"role": "user", "content": "Hi"}}
+        )
+        created = create_response.json()
+
+        update_response = await test_client.put(
+            f"/api/v1/conversations/{created['id']}",
+            json={"title": "After"}
+        )
+        data = update_response.json()
+
+        assert data["title"] == "After"
+        assert data["message_count"] == 1
+        assert data["updated_at"] >= created["updated_at"]
+
+    async def test_update_conversation_tags_replaces_existing(self, test_client: AsyncClient):
+        """Test updating tags removes old ones and ignores duplicates."""
+        create_response = await test_client.post(
+            "/api/v1/conversations/",
+            json={"title": "Test"}
+        )
+        conv_id = create_response.json()["id"]
+
+        await test_client.put(f"/api/v1/conversations/{conv_id}", json={"tags": ["old", "shared"]})
+        update_response = await test_client.put(
+            f"/api/v1/conversations/{conv_id}",
+            json={"tags": ["shared", "new", "new"]}
+        )
+
+        assert update_response.status_code == 200
+        assert sorted(update_response.json()["tags"]) == ["new", "shared"]
+
+        get_response = await test_client.get(f"/api/v1/conversations/{conv_id}")
+        assert sorted(get_response.json()["tags"]) == ["new", "shared"]
+
+        clear_response = await test_client.put(f"/api/v1/conversations/{conv_id}", json={"tags": []})
+        assert clear_response.json()["tags"] == []
+
 
 class TestDeleteConversation:
     """Tests for DELETE /api/v1/conversations/{id}"""
@@ -289,3 +499,12 @@ class TestAddMessage:
         assert data["role"] == "user"
         assert data["content"] == "Hello!"
         assert "created_at" in data
+
+    async def test_add_message_conversation_not_found(self, test_client: AsyncClient):
+        """Test adding a message to a missing conversation returns 404."""
+        response = await test_client.post(
+            "/api/v1/conversations/00000000-0000-0000-0000-000000000000/messages",
+            json={"role": "user", "content": "Hello!"}
+        )
+
+        assert response.status_code == 404
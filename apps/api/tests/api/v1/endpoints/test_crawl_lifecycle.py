@@ -56,3 +56,128 @@ class TestCrawlEndpointLifecycle:
         finally:
             # Clean up
             clear_firecrawl_service()
+
+    @pytest.mark.anyio
+    async def test_crawl_options_omit_unset_fields(self, test_client):
+        """Test start_crawl sends the precomputed webhook and only the set options."""
+        from app.api.v1.endpoints.crawl import _WEBHOOK_URL
+
+        mock_service = MagicMock()
+        mock_service.start_crawl = AsyncMock(return_value={
+            "id": "test-crawl-456",
+            "success": True,
+            "url": "https://example.com"
+        })
+        set_firecrawl_service(mock_service)
+
+        try:
+            response = await test_client.post(
+                "/api/v1/crawl/",
+                json={"url": "https://example.com", "includePaths": ["/docs/*"]}
+            )
+
+            assert response.status_code == 200
+            options = mock_service.start_crawl.call_args.args[0]
+            assert options == {
+                "url": "https://example.com/",
+                "webhook": _WEBHOOK_URL,
+                "includePaths": ["/docs/*"],
+                "limit": 10000,
+                "crawlEntireDomain": False,
+                "allowSubdomains": False,
+            }
+            assert _WEBHOOK_URL.endswith("/api/v1/webhooks/firecrawl")
+        finally:
+            clear_firecrawl_service()
+
+    @pytest.mark.anyio
+    @pytest.mark.parametrize("max_depth", [None, 2])
+    @pytest.mark.parametrize("scrape_options", [None, {"formats": ["markdown"]}])
+    async def test_crawl_options_match_request_fields(
+        self, test_client, max_depth, scrape_options
+    ):
+        """Test crawl_options carries every non-None request field and nothing else."""
+        mock_service = MagicMock()
+        mock_service.start_crawl = AsyncMock(return_value={
+            "id": "test-crawl-789",
+            "success": True,
+            "url": "https://example.com"
+        })
+        set_firecrawl_service(mock_service)
+
+        payload = {
+            "url": "https://example.com",
+            "excludePaths": ["/blog/*"],
+            "maxDiscoveryDepth": max_depth,
+            "scrapeOptions": scrape_options,
+        }
+        try:
+            response = await test_client.post("/api/v1/crawl/", json=payload)
+
+            assert response.status_code == 200
+            options = mock_service.start_crawl.call_args.args[0]
+            assert ("maxDiscoveryDepth" in options) is (max_depth is not None)
+            assert ("scrapeOptions" in options) is (scrape_options is not None)
+            assert "includePaths" not in options
+            assert options["excludePaths"] == ["/blog/*"]
+            assert None not in options.values()
+        finally:
+            clear_firecrawl_service()
+
+    @pytest.mark.anyio
+    async def test_crawl_status_returns_validated_payload(self, test_client):
+        """Test get_crawl_status passes the Firecrawl payload through response_model."""
+        mock_service = MagicMock()
+        mock_service.get_crawl_status = AsyncMock(return_value={
+            "status": "scraping",
+            "total": 10,
+            "completed": 4,
+            "creditsUsed": 4,
+            "expiresAt": "2025-01-01T00:00:00Z",
+            "unexpected": "dropped",
+        })
+        set_firecrawl_service(mock_service)
+
+        try:
+            response = await test_client.get("/api/v1/crawl/test-crawl-123")
+
+            assert response.status_code == 200
+            data = response.json()
+            assert data["status"] == "scraping"
+            assert data["completed"] == 4
+            assert data["data"] is None
+            assert "unexpected" not in data
+        finally:
+            clear_firecrawl_service()
+
+    @pytest.mark.anyio
+    async def test_crawl_status_invalid_payload_returns_500(self, test_client):
+        """Test a Firecrawl payload that fails validation maps to the status 500."""
+        mock_service = MagicMock()
+        mock_service.get_crawl_status = AsyncMock(return_value={"total": 10})
+        set_firecrawl_service(mock_service)
+
+        try:
+            response = await test_client.get("/api/v1/crawl/test-crawl-123")
+
+            assert response.status_code == 500
+            assert response.json()["detail"].startswith("Failed to get crawl status:")
+        finally:
+            clear_firecrawl_service()
+
+    @pytest.mark.anyio
+    async def test_crawl_status_timeout_returns_504(self, test_client):
+        """Test a Firecrawl timeout maps to 504 rather than a generic 500."""
+        from httpx import TimeoutException
+
+        mock_service = MagicMock()
+        mock_service.get_crawl_status = AsyncMock(side_effect=TimeoutException("timed out"))
+        set_firecrawl_service(mock_service)
+
+        try:
+            response = await test_client.get("/api/v1/crawl/test-crawl-123")
+
+            assert response.status_code == 504
+            assert "timed out" in response.json()["detail"]
+        finally:
+            clear_firecrawl_service()
@@ -0,0 +1,103 @@
+"""
+Tests for extract endpoint ingestion backpressure and error mapping.
+"""
+
+import asyncio
+import httpx
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from app.main import app
+from app.core.work_queue import BoundedWorkQueue
+from app.dependencies import get_firecrawl_service, get_ingestion_queue
+from app.services.document_processor import process_and_store_document
+
+pytestmark = pytest.mark.anyio
+
+EXTRACT_BODY = {"url": "https://example.com", "schema": {"title": "string"}}
+
+
+@pytest.fixture
+def mock_firecrawl():
+    """Mock FirecrawlService returning a small extraction result."""
+    service = MagicMock()
+    service.extract_data = AsyncMock(return_value={"success": True, "data": {"title": "Hi"}})
+    return service
+
+
+@pytest.fixture
+def mock_queue():
+    """Mock ingestion queue with room for more work."""
+    queue = MagicMock(spec=BoundedWorkQueue)
+    queue.full.return_value = False
+    return queue
+
+
+@pytest.fixture
+def overrides(mock_firecrawl, mock_queue):
+    """Install the mocked Firecrawl service and ingestion queue."""
+    app.dependency_overrides[get_firecrawl_service] = lambda: mock_firecrawl
+    app.dependency_overrides[get_ingestion_queue] = lambda: mock_queue
+    yield
+    app.dependency_overrides.clear()
+
+
+class TestExtractIngestion:
+    """Tests for POST /api/v1/extract/ queueing."""
+
+    async def test_extract_queues_document(self, test_client, overrides, mock_queue):
+        """Test extracted data is submitted to the ingestion queue."""
+        response = await test_client.post("/api/v1/extract/", json=EXTRACT_BODY)
+
+        assert response.status_code == 200
+        mock_queue.submit.assert_called_once()
+        args, kwargs = mock_queue.submit.call_args
+        assert args == (process_and_store_document,)
+        assert kwargs["content"] == '{"title":"Hi"}'
+        assert kwargs["source_type"] == "extract"
+
+    async def test_full_queue_rejects_before_calling_firecrawl(
+        self, test_client, overrides, mock_firecrawl, mock_queue
+    ):
+        """Test a full queue returns 429 without spending a Firecrawl call."""
+        mock_queue.full.return_value = True
+
+        response = await test_client.post("/api/v1/extract/", json=EXTRACT_BODY)
+
+        assert response.status_code == 429
+        mock_firecrawl.extract_data.assert_not_called()
+
+    async def test_queue_filling_during_extract_still_returns_data(
+        self, test_client, overrides, mock_queue
+    ):
+        """Test an extraction already paid for is returned when it cannot be queued."""
+        mock_queue.submit.side_effect = asyncio.QueueFull
+
+        response = await test_client.post("/api/v1/extract/", json=EXTRACT_BODY)
+
+        assert response.status_code == 200
+        assert response.json() == {"success": True, "data": {"title": "Hi"}}
+
+
+class TestExtractErrors:
+    """Tests for POST /api/v1/extract/ error mapping."""
+
+    async def test_firecrawl_timeout_returns_504(self, test_client, overrides, mock_firecrawl):
+        """Test an httpx timeout maps to 504 rather than the 502 for other HTTP errors."""
+        mock_firecrawl.extract_data.side_effect = httpx.ReadTimeout("timed out")
+
+        response = await test_client.post("/api/v1/extract/", json=EXTRACT_BODY)
+
+        assert response.status_code == 504
+        assert "timed out" in response.json()["detail"]
+
+    async def test_firecrawl_connection_error_returns_502(
+        self, test_client, overrides, mock_firecrawl
+    ):
+        """Test non-timeout httpx errors still map to 502."""
+        mock_firecrawl.extract_data.side_effect = httpx.ConnectError("refused")
+
+        response = await test_client.post("/api/v1/extract/", json=EXTRACT_BODY)
+
+        assert response.status_code == 502
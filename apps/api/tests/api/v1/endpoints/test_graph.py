@@ -119,6 +119,25 @@ class TestGraphSearch:
         finally:
             app.dependency_overrides.clear()
 
+    async def test_graph_search_whitespace_query_rejected(
+        self, test_client: AsyncClient, mock_hybrid_query_engine
+    ):
+        """Test whitespace-only queries fail validation and others are stripped."""
+        mock_hybrid_query_engine.hybrid_search.return_value = {"combined_results": []}
+        app.dependency_overrides[get_hybrid_query_engine] = lambda: mock_hybrid_query_engine
+
+        try:
+            response = await test_client.post("/api/v1/graph/search", json={"query": "  \t "})
+            assert response.status_code == 422
+            mock_hybrid_query_engine.hybrid_search.assert_not_called()
+
+            response = await test_client.post("/api/v1/graph/search", json={"query": " alice "})
+            assert response.status_code == 200
+            call_args = mock_hybrid_query_engine.hybrid_search.call_args
+            assert call_args.kwargs["query"] == "alice"
+        finally:
+            app.dependency_overrides.clear()
+
     async def test_graph_search_empty_results(
         self, test_client: AsyncClient, mock_hybrid_query_engine
     ):
@@ -152,15 +171,8 @@ class TestEntityConnections:
         self, test_client: AsyncClient, mock_graph_db_service
     ):
         """Test successful entity connections retrieval."""
-        # Mock entity exists
-        mock_graph_db_service.get_entity_by_id.return_value = {
-            "id": "test_entity",
-            "type": "PERSON",
-            "text": "Test Person"
-        }
-        
-        # Mock connections
-        mock_graph_db_service.find_connected_entities.return_value = [
+        # Mock entity exists with connections
+        mock_graph_db_service.get_entity_connections.return_value = [
             {"id": "entity2", "type": "ORG", "text": "Test Company", "distance": 1},
             {"id": "entity3", "type": "GPE", "text": "Test City", "distance": 1}
         ]
@@ -183,7 +195,7 @@ class TestEntityConnections:
         self, test_client: AsyncClient, mock_graph_db_service
     ):
         """Test entity not found (404)."""
-        mock_graph_db_service.get_entity_by_id.return_value = None
+        mock_graph_db_service.get_entity_connections.return_value = None
 
         app.dependency_overrides[get_graph_db_service] = lambda: mock_graph_db_service
 
@@ -198,8 +210,7 @@ class TestEntityConnections:
         self, test_client: AsyncClient, mock_graph_db_service
     ):
         """Test connections with depth parameter."""
-        mock_graph_db_service.get_entity_by_id.return_value = {"id": "test_entity"}
-        mock_graph_db_service.find_connected_entities.return_value = []
+        mock_graph_db_service.get_entity_connections.return_value = []
 
         app.dependency_overrides[get_graph_db_service] = lambda: mock_graph_db_service
 
@@ -210,7 +221,7 @@ class TestEntityConnections:
 
             assert response.status_code == 200
             # Verify depth parameter was passed
-            call_args = mock_graph_db_service.find_connected_entities.call_args
+            call_args = mock_graph_db_service.get_entity_connections.call_args
             assert call_args.kwargs["max_depth"] == 2
         finally:
             app.dependency_overrides.clear()
@@ -219,8 +230,7 @@ class TestEntityConnections:
         self, test_client: AsyncClient, mock_graph_db_service
     ):
         """Test connections with relationship type filter."""
-        mock_graph_db_service.get_entity_by_id.return_value = {"id": "test_entity"}
-        mock_graph_db_service.find_connected_entities.return_value = []
+        mock_graph_db_service.get_entity_connections.return_value = []
 
         app.dependency_overrides[get_graph_db_service] = lambda: mock_graph_db_service
 
@@ -231,7 +241,7 @@ class TestEntityConnections:
 
             assert response.status_code == 200
             # Verify relationship_types parameter was passed
-            call_args = mock_graph_db_service.find_connected_entities.call_args
+            call_args = mock_graph_db_service.get_entity_connections.call_args
             assert call_args.kwargs["relationship_types"] == ["WORKS_AT", "LOCATED_IN"]
         finally:
             app.dependency_overrides.clear()
@@ -301,3 +311,43 @@ class TestEntitySearch:
             assert data["entities"] == []
         finally:
             app.dependency_overrides.clear()
+
+    async def test_entity_search_ignores_blank_type_filters(
+        self, test_client: AsyncClient, mock_graph_db_service
+    ):
+        """Test blank entries in entity_types are dropped and an all-blank filter is ignored."""
+        mock_graph_db_service.search_entities.return_value = []
+
+        app.dependency_overrides[get_graph_db_service] = lambda: mock_graph_db_service
+
+        try:
+            await test_client.get(
+                "/api/v1/graph/entities/search?query=Doe&entity_types= PERSON,,ORG ,"
+            )
+            call_args = mock_graph_db_service.search_entities.call_args
+            assert call_args.kwargs["entity_types"] == ["PERSON", "ORG"]
+
+            await test_client.get("/api/v1/graph/entities/search?query=Doe&entity_types=,")
+            call_args = mock_graph_db_service.search_entities.call_args
+            assert call_args.kwargs["entity_types"] is None
+        finally:
+            app.dependency_overrides.clear()
+
+
+class TestGraphDependencies:
+    """Tests for graph endpoint service wiring."""
+
+    async def test_entity_endpoints_use_lifespan_graph_db_singleton(
+        self, test_client: AsyncClient, mock_graph_db_service
+    ):
+        """Test entity endpoints resolve the GraphDBService set by the app lifespan."""
+        from app.dependencies import set_graph_db_service, clear_graph_db_service
+
+        set_graph_db_service(mock_graph_db_service)
+        try:
+            response = await test_client.get("/api/v1/graph/entities/search?query=Doe")
+
+            assert response.status_code == 200
+            mock_graph_db_service.search_entities.assert_awaited_once()
+        finally:
+            clear_graph_db_service()
@@ -0,0 +1,84 @@
+"""
+Tests for map endpoint.
+
+Tests that the endpoint uses the singleton FirecrawlService and flattens links.
+"""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from app.dependencies import set_firecrawl_service, clear_firecrawl_service
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def mock_service():
+    """Install a mock FirecrawlService as the application singleton."""
+    service = MagicMock()
+    service.map_url = AsyncMock()
+    set_firecrawl_service(service)
+    yield service
+    clear_firecrawl_service()
+
+
+class TestMapEndpoint:
+    """Tests for POST /api/v1/map/"""
+
+    async def test_map_uses_singleton_service(self, test_client, mock_service):
+        """Test the map endpoint resolves the lifespan-managed FirecrawlService."""
+        mock_service.map_url.return_value = {"success": True, "links": []}
+
+        response = await test_client.post(
+            "/api/v1/map/", json={"url": "https://example.com", "search": "docs"}
+        )
+
+        assert response.status_code == 200
+        mock_service.map_url.assert_awaited_once_with("https://example.com/", {"search": "docs"})
+
+    @pytest.mark.parametrize(
+        "links",
+        [
+            [{"url": "https://example.com/a"}, {"url": "https://example.com/b"}],
+            ["https://example.com/a", "https://example.com/b"],
+        ],
+    )
+    async def test_map_flattens_link_objects_and_strings(self, test_client, mock_service, links):
+        """Test both v2 link objects and plain v1 strings are returned as URLs."""
+        mock_service.map_url.return_value = {"success": True, "links": links}
+
+        response = await test_client.post("/api/v1/map/", json={"url": "https://example.com"})
+
+        assert response.json() == {
+            "success": True,
+            "urls": ["https://example.com/a", "https://example.com/b"],
+            "total": 2,
+        }
+
+    @pytest.mark.parametrize(
+        "links",
+        [
+            [{"url": "https://example.com/b"}, {"url": "https://example.com/a"}]
+            + [{"url": "https://example.com/b"}],
+            ["https://example.com/b", "https://example.com/a", "https://example.com/b"],
+        ],
+    )
+    async def test_map_deduplicates_urls_in_order(self, test_client, mock_service, links):
+        """Test repeated URLs are dropped and first-seen order is kept."""
+        mock_service.map_url.return_value = {"success": True, "links": links}
+
+        response = await test_client.post("/api/v1/map/", json={"url": "https://example.com"})
+
+        assert response.json()["urls"] == ["https://example.com/b", "https://example.com/a"]
+        assert response.json()["total"] == 2
+
+    async def test_response_matches_documented_schema(self, test_client, mock_service):
+        """Test the pre-serialized body still validates against MapResponse."""
+        from app.api.v1.endpoints.map import MapResponse
+
+        mock_service.map_url.return_value = {"links": [{"url": "https://example.com/a"}]}
+
+        response = await test_client.post("/api/v1/map/", json={"url": "https://example.com"})
+
+        assert response.headers["content-type"] == "application/json"
+        assert MapResponse.model_validate(response.json()).total == 1
@@ -0,0 +1,271 @@
+"""
+Tests for the RAG query endpoint and its semantic cache.
+"""
+
+import json
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from app.main import app
+from app.dependencies import (
+    get_embeddings_service,
+    get_vector_db_service,
+    get_llm_service,
+    get_query_cache,
+    get_semantic_cache,
+)
+from app.api.v1.endpoints.query import build_llm_context
+from app.services.semantic_cache import SemanticQueryCache
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def mock_query_cache():
+    """Mock QueryCache reporting a fixed revision."""
+    cache = MagicMock()
+    cache.current_revision = AsyncMock(return_value="0.0")
+    return cache
+
+
+@pytest.fixture
+def overrides(mock_embeddings_service, mock_vector_db_service, mock_llm_service, mock_query_cache):
+    """Install mocked services and a real semantic cache."""
+    mock_vector_db_service.collection_name = "graphrag"
+    app.dependency_overrides[get_embeddings_service] = lambda: mock_embeddings_service
+    app.dependency_overrides[get_vector_db_service] = lambda: mock_vector_db_service
+    app.dependency_overrides[get_llm_service] = lambda: mock_llm_service
+    app.dependency_overrides[get_query_cache] = lambda: mock_query_cache
+    semantic_cache = SemanticQueryCache()
+    app.dependency_overrides[get_semantic_cache] = lambda: semantic_cache
+    yield semantic_cache
+    app.dependency_overrides.clear()
+
+
+class TestQuerySemanticCache:
+    """Tests for POST /api/v1/query/ caching."""
+
+    async def test_repeat_query_skips_embedding_and_search(
+        self, test_client, overrides, mock_embeddings_service, mock_vector_db_service
+    ):
+        """Test an identical repeat query is served from the semantic cache."""
+        payload = {"query": "what is rag", "use_llm": False}
+
+        first = await test_client.post("/api/v1/query/", json=payload)
+        second = await test_client.post("/api/v1/query/", json=payload)
+
+        assert first.status_code == second.status_code == 200
+        assert first.json() == second.json()
+        assert mock_embeddings_service.generate_embedding.await_count == 1
+        assert mock_vector_db_service.search.await_count == 1
+
+    async def test_similar_query_skips_search(
+        self, test_client, overrides, mock_embeddings_service, mock_vector_db_service
+    ):
+        """Test a differently worded query with the same embedding reuses results."""
+        await test_client.post("/api/v1/query/", json={"query": "what is rag", "use_llm": False})
+        response = await test_client.post(
+            "/api/v1/query/", json={"query": "What is RAG?", "use_llm": False}
+        )
+
+        assert response.status_code == 200
+        assert mock_embeddings_service.generate_embedding.await_count == 2
+        assert mock_vector_db_service.search.await_count == 1
+
+    async def test_filtered_queries_cached_per_filter_set(
+        self, test_client, overrides, mock_vector_db_service
+    ):
+        """Test filtered queries are cached, keyed by filter content not key order."""
+        base = {"query": "what is rag", "use_llm": False}
+
+        await test_client.post(
+            "/api/v1/query/", json={**base, "filters": {"domain": "a.com", "tags": ["x", "y"]}}
+        )
+        await test_client.post(
+            "/api/v1/query/", json={**base, "filters": {"tags": ["x", "y"], "domain": "a.com"}}
+        )
+        assert mock_vector_db_service.search.await_count == 1
+
+        await test_client.post("/api/v1/query/", json={**base, "filters": {"domain": "b.com"}})
+        await test_client.post("/api/v1/query/", json=base)
+        assert mock_vector_db_service.search.await_count == 3
+
+    async def test_unavailable_revision_bypasses_cache(
+        self, test_client, overrides, mock_vector_db_service, mock_query_cache
+    ):
+        """Test the semantic cache is skipped when the cache revision is unknown."""
+        mock_query_cache.current_revision.return_value = None
+        payload = {"query": "what is rag", "use_llm": False}
+
+        await test_client.post("/api/v1/query/", json=payload)
+        await test_client.post("/api/v1/query/", json=payload)
+
+        assert mock_vector_db_service.search.await_count == 2
+
+    async def test_response_matches_documented_schema(self, test_client, overrides):
+        """Test the pre-serialized body still validates against QueryResponse."""
+        from app.api.v1.endpoints.query import QueryResponse
+
+        response = await test_client.post(
+            "/api/v1/query/", json={"query": "what is rag", "use_llm": False}
+        )
+
+        body = QueryResponse.model_validate(response.json())
+        assert body.results[0].id == "doc1"
+        assert body.llm_response is None
+
+
+class TestLLMConfidenceGate:
+    """Tests for skipping the LLM when retrieval is weak."""
+
+    @pytest.fixture
+    def weak_hits(self, mock_vector_db_service):
+        """Vector search returning only a low-scoring hit."""
+        mock_vector_db_service.search = AsyncMock(
+            return_value=[{"id": "doc9", "score": 0.1, "content": "noise", "metadata": {}}]
+        )
+
+    async def test_low_score_skips_llm(self, test_client, overrides, weak_hits, mock_llm_service):
+        """Test a best score below MIN_LLM_SCORE returns the fixed answer without the LLM."""
+        from app.api.v1.endpoints.query import INSUFFICIENT_CONTEXT_RESPONSE
+
+        response = await test_client.post(
+            "/api/v1/query/", json={"query": "q", "score_threshold": 0.0}
+        )
+
+        assert response.json()["llm_response"] == INSUFFICIENT_CONTEXT_RESPONSE
+        assert response.json()["total_results"] == 1
+        mock_llm_service.generate_response.assert_not_called()
+
+    async def test_low_score_stream_skips_llm(
+        self, test_client, overrides, weak_hits, mock_llm_service
+    ):
+        """Test the streaming endpoint applies the same gate."""
+        from app.api.v1.endpoints.query import INSUFFICIENT_CONTEXT_RESPONSE
+
+        response = await test_client.post(
+            "/api/v1/query/stream", json={"query": "q", "score_threshold": 0.0}
+        )
+
+        frames = [line[len("data: ") :] for line in response.text.splitlines() if line]
+        assert json.loads(frames[1]) == {"type": "token", "content": INSUFFICIENT_CONTEXT_RESPONSE}
+        mock_llm_service.stream_response.assert_not_called()
+
+    async def test_confident_results_call_llm(self, test_client, overrides, mock_llm_service):
+        """Test hits above the threshold still get an LLM answer."""
+        response = await test_client.post("/api/v1/query/", json={"query": "q"})
+
+        assert response.json()["llm_response"] == "This is a test response from the LLM."
+        mock_llm_service.generate_response.assert_awaited_once()
+
+
+class TestBatchQuery:
+    """Tests for POST /api/v1/query/batch."""
+
+    async def test_batch_embeds_and_searches_unique_queries_once(
+        self, test_client, overrides, mock_embeddings_service, mock_vector_db_service
+    ):
+        """Test duplicates are collapsed into one TEI call and one Qdrant batch."""
+        mock_embeddings_service.generate_embeddings = AsyncMock(
+            return_value=[[1.0, 0.0], [0.0, 1.0]]
+        )
+        hit = {"id": 1, "score": 0.9, "content": "x" * 600, "metadata": {}}
+        mock_vector_db_service.search_batch = AsyncMock(return_value=[[hit], []])
+
+        response = await test_client.post(
+            "/api/v1/query/batch", json={"queries": ["a", "b", "a"], "limit": 3}
+        )
+
+        assert response.status_code == 200
+        mock_embeddings_service.generate_embeddings.assert_awaited_once_with(["a", "b"])
+        searches = mock_vector_db_service.search_batch.call_args.args[0]
+        assert [s["query_embedding"] for s in searches] == [[1.0, 0.0], [0.0, 1.0]]
+        assert all(s["limit"] == 3 for s in searches)
+
+        responses = response.json()["responses"]
+        assert [r["query"] for r in responses] == ["a", "b", "a"]
+        assert [r["total_results"] for r in responses] == [1, 0, 1]
+        assert len(responses[0]["results"][0]["content"]) == 500
+
+    async def test_batch_size_is_capped(self, test_client, overrides):
+        """Test more than 64 queries are rejected by validation."""
+        response = await test_client.post("/api/v1/query/batch", json={"queries": ["q"] * 65})
+
+        assert response.status_code == 422
+
+
+class TestQueryStream:
+    """Tests for POST /api/v1/query/stream."""
+
+    async def test_stream_sends_results_then_tokens(self, test_client, overrides):
+        """Test search results arrive as the first event, followed by LLM tokens."""
+        response = await test_client.post("/api/v1/query/stream", json={"query": "what is rag"})
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+
+        frames = [line[len("data: ") :] for line in response.text.splitlines() if line]
+        assert frames[-1] == "[DONE]"
+
+        events = [json.loads(frame) for frame in frames[:-1]]
+        assert events[0]["type"] == "results"
+        assert events[0]["results"][0]["id"] == "doc1"
+        tokens = [e["content"] for e in events if e["type"] == "token"]
+        assert "".join(tokens) == "This is a test response from the LLM."
+
+    async def test_stream_without_llm(self, test_client, overrides, mock_llm_service):
+        """Test use_llm=false streams only the results."""
+        response = await test_client.post(
+            "/api/v1/query/stream", json={"query": "what is rag", "use_llm": False}
+        )
+
+        frames = [line for line in response.text.splitlines() if line]
+        assert len(frames) == 2
+        mock_llm_service.stream_response.assert_not_called()
+
+    async def test_search_failure_is_500(self, test_client, overrides, mock_vector_db_service):
+        """Test retrieval errors are reported before the stream starts."""
+        mock_vector_db_service.search = AsyncMock(side_effect=RuntimeError("qdrant down"))
+
+        response = await test_client.post("/api/v1/query/stream", json={"query": "q"})
+
+        assert response.status_code == 500
+        assert "qdrant down" in response.json()["detail"]
+
+
+class TestBuildLLMContext:
+    """Tests for the character-budgeted LLM context."""
+
+    def _hit(self, url, content):
+        return {"content": content, "metadata": {"sourceURL": url}}
+
+    def test_includes_every_source_within_budget(self):
+        """Test sources are not capped by count when they fit."""
+        hits = [self._hit(f"https://ex.com/{i}", "x" * 10) for i in range(5)]
+
+        context = build_llm_context(hits, max_chars=1000)
+
+        assert context.count("[Source: ") == 5
+        assert context.startswith("[Source: https://ex.com/0]\nxxxxxxxxxx\n\n")
+
+    def test_truncates_last_source_to_budget(self):
+        """Test the budget is never exceeded and the last source is cut, not dropped."""
+        hits = [self._hit("https://ex.com/a", "a" * 50), self._hit("https://ex.com/b", "b" * 50)]
+
+        context = build_llm_context(hits, max_chars=120)
+
+        assert len(context) <= 120
+        assert "[Source: https://ex.com/b]" in context
+        assert context.endswith("b")
+
+    def test_missing_source_url(self):
+        """Test hits without a sourceURL are labelled Unknown."""
+        context = build_llm_context([{"content": "text", "metadata": {}}])
+
+        assert context == "[Source: Unknown]\ntext"
+
+    def test_null_source_url(self):
+        """Test a null sourceURL in the payload is labelled Unknown rather than crashing."""
+        context = build_llm_context([{"content": "text", "metadata": {"sourceURL": None}}])
+
+        assert context == "[Source: Unknown]\ntext"
@@ -4,21 +4,18 @@ Tests for scrape endpoint.
 Following TDD: Write tests first, watch them fail, then implement.
 """
 
+import asyncio
+
 import pytest
 from fastapi.testclient import TestClient
 from unittest.mock import AsyncMock, patch, MagicMock
 from httpx import TimeoutException, HTTPStatusError, Request, Response
 
 from app.main import app
+from app.core.work_queue import BoundedWorkQueue
 from app.services.firecrawl import FirecrawlService
 
 
-@pytest.fixture
-def client():
-    """Test client fixture."""
-    return TestClient(app)
-
-
 @pytest.fixture
 def mock_firecrawl_service():
     """Mock FirecrawlService for dependency injection."""
@@ -27,6 +24,32 @@ def mock_firecrawl_service():
     return service
 
 
+@pytest.fixture
+def mock_ingestion_queue():
+    """Mock ingestion queue with room for more work."""
+    queue = MagicMock(spec=BoundedWorkQueue)
+    queue.full.return_value = False
+    return queue
+
+
+@pytest.fixture
+def service_overrides(mock_firecrawl_service, mock_ingestion_queue):
+    """Override the shared FirecrawlService and ingestion queue for one test."""
+    from app.dependencies import get_firecrawl_service, get_ingestion_queue
+
+    app.dependency_overrides[get_firecrawl_service] = lambda: mock_firecrawl_service
+    app.dependency_overrides[get_ingestion_queue] = lambda: mock_ingestion_queue
+    yield
+    app.dependency_overrides.pop(get_firecrawl_service, None)
+    app.dependency_overrides.pop(get_ingestion_queue, None)
+
+
+@pytest.fixture
+def client(service_overrides):
+    """Test client fixture with the shared FirecrawlService and ingestion queue overridden."""
+    return TestClient(app)
+
+
 class TestScrapeRequestValidation:
     """Test suite for ScrapeRequest model validation."""
 
@@ -307,3 +330,98 @@ class TestScrapeOptionsConstruction:
             assert call_args[0][1]["formats"] == ["markdown", "html"]
         finally:
             app.dependency_overrides.clear()
+
+
+@pytest.mark.anyio
+class TestScrapeInflightDeduplication:
+    """Test suite for collapsing concurrent identical scrapes."""
+
+    async def test_concurrent_identical_scrapes_share_one_call(
+        self, test_client, service_overrides, mock_firecrawl_service, mock_ingestion_queue
+    ):
+        """Test concurrent requests for one URL make one Firecrawl call and store once."""
+        gate = asyncio.Event()
+
+        async def slow_scrape(url, options):
+            await gate.wait()
+            return {"success": True, "data": {"markdown": "# Page"}}
+
+        mock_firecrawl_service.scrape_url.side_effect = slow_scrape
+
+        requests = [
+            test_client.post(
+                "/api/v1/scrape/",
+                json={"url": "https://example.com", "formats": formats},
+            )
+            for formats in (["markdown", "html"], ["html", "markdown"], ["markdown"])
+        ]
+        pending = asyncio.gather(*requests)
+        await asyncio.sleep(0.05)
+        gate.set()
+        responses = await pending
+
+        assert [r.status_code for r in responses] == [200, 200, 200]
+        assert all(r.json()["data"] == {"markdown": "# Page"} for r in responses)
+        # Format order does not matter; a different format set is a separate scrape
+        assert mock_firecrawl_service.scrape_url.call_count == 2
+        assert mock_ingestion_queue.submit.call_count == 2
+
+    async def test_inflight_entry_removed_after_failure(
+        self, test_client, service_overrides, mock_firecrawl_service
+    ):
+        """Test a failed scrape is not reused by later requests."""
+        from app.api.v1.endpoints.scrape import _inflight
+
+        mock_firecrawl_service.scrape_url.side_effect = TimeoutException("Request timeout")
+
+        response = await test_client.post("/api/v1/scrape/", json={"url": "https://example.com"})
+
+        assert response.status_code == 504
+        assert _inflight == {}
+
+
+class TestScrapeIngestionQueue:
+    """Test suite for queueing scraped content for ingestion."""
+
+    def test_scraped_markdown_is_queued(self, client, mock_firecrawl_service, mock_ingestion_queue):
+        """Test successful scrapes submit the markdown to the ingestion queue."""
+        from app.services.document_processor import process_and_store_document
+
+        mock_firecrawl_service.scrape_url.return_value = {
+            "success": True,
+            "data": {"markdown": "# Page", "metadata": {"title": "Page"}},
+        }
+
+        response = client.post("/api/v1/scrape/", json={"url": "https://example.com"})
+
+        assert response.status_code == 200
+        args, kwargs = mock_ingestion_queue.submit.call_args
+        assert args == (process_and_store_document,)
+        assert kwargs["source_url"] == "https://example.com/"
+        assert kwargs["source_type"] == "scrape"
+
+    def test_queue_filling_during_scrape_still_returns_result(
+        self, client, mock_firecrawl_service, mock_ingestion_queue
+    ):
+        """Test a scrape already paid for is returned when it cannot be queued."""
+        mock_firecrawl_service.scrape_url.return_value = {
+            "success": True,
+            "data": {"markdown": "# Page"},
+        }
+        mock_ingestion_queue.submit.side_effect = asyncio.QueueFull
+
+        response = client.post("/api/v1/scrape/", json={"url": "https://example.com"})
+
+        assert response.status_code == 200
+        assert response.json()["data"] == {"markdown": "# Page"}
+
+    def test_full_queue_rejects_before_calling_firecrawl(
+        self, client, mock_firecrawl_service, mock_ingestion_queue
+    ):
+        """Test a full queue returns 429 without spending a Firecrawl call."""
+        mock_ingestion_queue.full.return_value = True
+
+        response = client.post("/api/v1/scrape/", json={"url": "https://example.com"})
+
+        assert response.status_code == 429
+        mock_firecrawl_service.scrape_url.assert_not_called()
@@ -0,0 +1,152 @@
+"""
+Tests for search endpoint.
+
+Tests result formatting and batching of documents for ingestion.
+"""
+
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.api.v1.endpoints.search import _store_search_documents
+from app.core.work_queue import BoundedWorkQueue
+from app.dependencies import (
+    set_firecrawl_service,
+    clear_firecrawl_service,
+    set_ingestion_queue,
+    clear_ingestion_queue,
+)
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def mock_service():
+    """Install a mock FirecrawlService as the application singleton."""
+    service = MagicMock()
+    service.search_web = AsyncMock()
+    set_firecrawl_service(service)
+    yield service
+    clear_firecrawl_service()
+
+
+@pytest.fixture(autouse=True)
+def reset_fingerprints():
+    """Forget content seen by earlier tests."""
+    from app.api.v1.endpoints.search import _recent_fingerprints
+
+    _recent_fingerprints.clear()
+    yield
+    _recent_fingerprints.clear()
+
+
+@pytest.fixture
+def mock_queue():
+    """Install a mock ingestion queue with room for more work."""
+    queue = MagicMock(spec=BoundedWorkQueue)
+    queue.full.return_value = False
+    set_ingestion_queue(queue)
+    yield queue
+    clear_ingestion_queue()
+
+
+class TestSearchEndpoint:
+    """Tests for POST /api/v1/search/"""
+
+    async def test_search_formats_results_and_batches_documents(
+        self, test_client, mock_service, mock_queue
+    ):
+        """Test results fall back to html/Untitled and only complete ones are stored."""
+        mock_service.search_web.return_value = {
+            "data": [
+                {
+                    "url": "https://example.com/a",
+                    "markdown": "# A",
+                    "metadata": {"title": "A"},
+                },
+                {"url": "https://example.com/b", "markdown": "", "html": "<p>B</p>"},
+                {"url": "", "markdown": "orphan", "metadata": None},
+            ]
+        }
+
+        response = await test_client.post("/api/v1/search/", json={"query": "rag"})
+
+        assert response.status_code == 200
+        assert response.json() == {
+            "success": True,
+            "results": [
+                {"url": "https://example.com/a", "title": "A", "content": "# A"},
+                {"url": "https://example.com/b", "title": "Untitled", "content": "<p>B</p>"},
+                {"url": "", "title": "Untitled", "content": "orphan"},
+            ],
+            "total": 3,
+        }
+
+        func, documents, _ = mock_queue.submit.call_args.args
+        assert func is _store_search_documents
+        assert [d["source_url"] for d in documents] == [
+            "https://example.com/a",
+            "https://example.com/b",
+        ]
+        assert documents[0]["metadata"] == {"title": "A"}
+
+    async def test_full_queue_rejects_before_calling_firecrawl(
+        self, test_client, mock_service, mock_queue
+    ):
+        """Test a full queue returns 429 without spending a Firecrawl call."""
+        mock_queue.full.return_value = True
+
+        response = await test_client.post("/api/v1/search/", json={"query": "rag"})
+
+        assert response.status_code == 429
+        mock_service.search_web.assert_not_called()
+
+    async def test_duplicate_content_is_stored_once(self, test_client, mock_service, mock_queue):
+        """Test syndicated copies are returned to the caller but only queued once."""
+        page = "# Same article\n\nBody text."
+        mock_service.search_web.return_value = {
+            "data": [
+                {"url": "https://a.example/post", "markdown": page},
+                {"url": "https://b.example/copy", "markdown": "# Same article\nBody   text."},
+            ]
+        }
+
+        first = await test_client.post("/api/v1/search/", json={"query": "rag"})
+        second = await test_client.post("/api/v1/search/", json={"query": "rag"})
+
+        assert first.json()["total"] == 2
+        assert second.json()["total"] == 2
+        mock_queue.submit.assert_called_once()
+        _, documents, _ = mock_queue.submit.call_args.args
+        assert [d["source_url"] for d in documents] == ["https://a.example/post"]
+
+    async def test_rejected_job_does_not_mark_content_seen(
+        self, test_client, mock_service, mock_queue
+    ):
+        """Test results the queue had no room for are returned and re-queued on retry."""
+        mock_service.search_web.return_value = {
+            "data": [{"url": "https://a.example/post", "markdown": "# Article"}]
+        }
+        mock_queue.submit.side_effect = [asyncio.QueueFull, None]
+
+        first = await test_client.post("/api/v1/search/", json={"query": "rag"})
+        await test_client.post("/api/v1/search/", json={"query": "rag"})
+
+        assert first.status_code == 200
+        assert first.json()["total"] == 1
+        assert mock_queue.submit.call_count == 2
+
+    async def test_failed_job_forgets_its_fingerprints(self):
+        """Test content whose storage failed is not treated as seen."""
+        from app.api.v1.endpoints.search import _recent_fingerprints
+
+        _recent_fingerprints[b"fp"] = None
+        with patch(
+            "app.api.v1.endpoints.search.process_and_store_documents_batch",
+            AsyncMock(side_effect=RuntimeError("TEI down")),
+        ):
+            with pytest.raises(RuntimeError):
+                await _store_search_documents([{"content": "x"}], [b"fp"])
+
+        assert b"fp" not in _recent_fingerprints
@@ -5,11 +5,13 @@ Tests verify that pages processed during crawl.page events
 are skipped in crawl.completed events to avoid duplicate processing.
 """
 
+import logging
 import pytest
 from fastapi.testclient import TestClient
 from unittest.mock import patch
 from app.main import app
 from app.dependencies import get_redis_service, get_language_detection_service
+from app.models import FirecrawlMetadata
 
 
 class TestWebhookDeduplication:
@@ -290,3 +292,247 @@ class TestWebhookDeduplication:
                 mock_batch.assert_called_once()
         finally:
             app.dependency_overrides.clear()
+
+    @pytest.mark.asyncio
+    async def test_crawl_completed_rejects_invalid_page(
+        self, client, sample_page_data, mock_redis_service, mock_language_detection_service
+    ):
+        """Test one malformed page rejects the crawl before anything is processed."""
+        app.dependency_overrides[get_redis_service] = lambda: mock_redis_service
+        app.dependency_overrides[get_language_detection_service] = lambda: mock_language_detection_service
+
+        try:
+            with patch(
+                "app.api.v1.endpoints.webhooks.process_and_store_documents_batch"
+            ) as mock_batch:
+                payload = {
+                    "type": "crawl.completed",
+                    "id": "test-crawl-789",
+                    "data": [sample_page_data, {"markdown": "# Broken", "metadata": {}}],
+                }
+
+                response = client.post("/api/v1/webhooks/firecrawl", json=payload)
+
+                assert response.status_code == 400
+                mock_batch.assert_not_called()
+                mock_redis_service.are_pages_processed.assert_not_called()
+        finally:
+            app.dependency_overrides.clear()
+
+    @pytest.mark.asyncio
+    async def test_crawl_completed_requires_page_list(
+        self, client, mock_redis_service, mock_language_detection_service
+    ):
+        """Test the completed envelope is still validated."""
+        app.dependency_overrides[get_redis_service] = lambda: mock_redis_service
+        app.dependency_overrides[get_language_detection_service] = lambda: mock_language_detection_service
+
+        try:
+            response = client.post(
+                "/api/v1/webhooks/firecrawl",
+                json={"type": "crawl.completed", "id": "test-crawl-789", "data": "oops"},
+            )
+
+            assert response.status_code == 400
+        finally:
+            app.dependency_overrides.clear()
+
+    @pytest.mark.asyncio
+    async def test_crawl_completed_filters_languages_in_one_batch(
+        self, client, mock_redis_service, mock_language_detection_service
+    ):
+        """Test crawl.completed detects all page languages with a single batch call."""
+        app.dependency_overrides[get_redis_service] = lambda: mock_redis_service
+        app.dependency_overrides[get_language_detection_service] = lambda: mock_language_detection_service
+
+        pages = [
+            {
+                "markdown": f"# Page {i}",
+                "metadata": {"sourceURL": f"https://example.com/{i}", "statusCode": 200},
+            }
+            for i in range(3)
+        ]
+
+        try:
+            with patch("app.api.v1.endpoints.webhooks.settings") as mock_settings, patch(
+                "app.api.v1.endpoints.webhooks.process_and_store_documents_batch"
+            ) as mock_batch:
+                mock_settings.ENABLE_STREAMING_PROCESSING = False
+                mock_settings.ENABLE_LANGUAGE_FILTERING = True
+                mock_settings.allowed_languages_set = frozenset({"en"})
+                mock_settings.LANGUAGE_FILTER_MODE = "strict"
+                mock_settings.FIRECRAWL_WEBHOOK_SECRET = None
+                mock_settings.is_production = False
+                mock_redis_service.is_page_processed.return_value = False
+                mock_language_detection_service.detect_languages_batch.side_effect = None
+                mock_language_detection_service.detect_languages_batch.return_value = [
+                    "en",
+                    "de",
+                    "en",
+                ]
+
+                response = client.post(
+                    "/api/v1/webhooks/firecrawl",
+                    json={"type": "crawl.completed", "id": "test-crawl-lang", "data": pages},
+                )
+
+                assert response.status_code == 200
+                assert response.json()["pages_skipped"] == 1
+                mock_language_detection_service.detect_languages_batch.assert_called_once_with(
+                    ["# Page 0", "# Page 1", "# Page 2"]
+                )
+                mock_language_detection_service.detect_language.assert_not_called()
+                mock_redis_service.mark_page_processed.assert_called_once_with(
+                    "test-crawl-lang", "https://example.com/1"
+                )
+                documents = mock_batch.call_args[0][0]
+                assert [d["source_url"] for d in documents] == [
+                    "https://example.com/0",
+                    "https://example.com/2",
+                ]
+        finally:
+            app.dependency_overrides.clear()
+
+    @pytest.mark.asyncio
+    async def test_crawl_completed_checks_redis_once(
+        self, client, mock_redis_service, mock_language_detection_service
+    ):
+        """Test crawl.completed looks up all pages with a single batch Redis call."""
+        app.dependency_overrides[get_redis_service] = lambda: mock_redis_service
+        app.dependency_overrides[get_language_detection_service] = lambda: mock_language_detection_service
+
+        pages = [
+            {
+                "markdown": f"# Page {i}",
+                "metadata": {"sourceURL": f"https://example.com/{i}", "statusCode": 200},
+            }
+            for i in range(5)
+        ]
+
+        try:
+            with patch("app.api.v1.endpoints.webhooks.process_and_store_documents_batch"):
+                response = client.post(
+                    "/api/v1/webhooks/firecrawl",
+                    json={"type": "crawl.completed", "id": "test-crawl-rtt", "data": pages},
+                )
+
+            assert response.status_code == 200
+            mock_redis_service.are_pages_processed.assert_awaited_once_with(
+                "test-crawl-rtt", [f"https://example.com/{i}" for i in range(5)]
+            )
+        finally:
+            app.dependency_overrides.clear()
+
+    @pytest.mark.asyncio
+    async def test_crawl_completed_passes_plain_metadata_dicts(
+        self, client, sample_page_data, mock_redis_service, mock_language_detection_service
+    ):
+        """Test batch documents carry the full metadata dump of each kept page."""
+        app.dependency_overrides[get_redis_service] = lambda: mock_redis_service
+        app.dependency_overrides[get_language_detection_service] = lambda: mock_language_detection_service
+
+        empty_page = {"markdown": "", "metadata": {"sourceURL": "https://example.com/empty", "statusCode": 200}}
+
+        try:
+            with patch(
+                "app.api.v1.endpoints.webhooks.process_and_store_documents_batch"
+            ) as mock_batch:
+                response = client.post(
+                    "/api/v1/webhooks/firecrawl",
+                    json={
+                        "type": "crawl.completed",
+                        "id": "test-crawl-meta",
+                        "data": [empty_page, sample_page_data],
+                    },
+                )
+
+            assert response.status_code == 200
+            documents = mock_batch.call_args[0][0]
+            assert len(documents) == 1
+            assert documents[0]["metadata"] == FirecrawlMetadata(
+                **sample_page_data["metadata"]
+            ).model_dump()
+        finally:
+            app.dependency_overrides.clear()
+
+    @pytest.mark.asyncio
+    async def test_crawl_completed_logs_filter_summary_not_per_page(
+        self, client, mock_redis_service, mock_language_detection_service, caplog
+    ):
+        """Test language filtering logs one summary at INFO instead of a line per page."""
+        app.dependency_overrides[get_redis_service] = lambda: mock_redis_service
+        app.dependency_overrides[get_language_detection_service] = lambda: mock_language_detection_service
+
+        pages = [
+            {
+                "markdown": f"# Seite {i}",
+                "metadata": {"sourceURL": f"https://example.com/{i}", "statusCode": 200},
+            }
+            for i in range(3)
+        ]
+
+        try:
+            with patch("app.api.v1.endpoints.webhooks.settings") as mock_settings, patch(
+                "app.api.v1.endpoints.webhooks.process_and_store_documents_batch"
+            ):
+                mock_settings.ENABLE_STREAMING_PROCESSING = False
+                mock_settings.ENABLE_LANGUAGE_FILTERING = True
+                mock_settings.allowed_languages_set = frozenset({"en"})
+                mock_settings.LANGUAGE_FILTER_MODE = "strict"
+                mock_settings.FIRECRAWL_WEBHOOK_SECRET = None
+                mock_settings.is_production = False
+                mock_language_detection_service.detect_languages_batch.side_effect = None
+                mock_language_detection_service.detect_languages_batch.return_value = ["de"] * 3
+
+                caplog.set_level(logging.INFO, logger="app.api.v1.endpoints.webhooks")
+                response = client.post(
+                    "/api/v1/webhooks/firecrawl",
+                    json={"type": "crawl.completed", "id": "test-crawl-logs", "data": pages},
+                )
+
+            assert response.status_code == 200
+            messages = [record.getMessage() for record in caplog.records]
+            assert not any("FILTERED" in message for message in messages)
+            assert any("Filtered 3 non-English pages" in message for message in messages)
+        finally:
+            app.dependency_overrides.clear()
+
+    @pytest.mark.asyncio
+    async def test_crawl_completed_builds_documents_only_for_new_pages(
+        self, client, mock_redis_service, mock_language_detection_service
+    ):
+        """Test metadata of already-streamed pages is never dumped."""
+        from app.api.v1.endpoints import webhooks
+
+        app.dependency_overrides[get_redis_service] = lambda: mock_redis_service
+        app.dependency_overrides[get_language_detection_service] = lambda: mock_language_detection_service
+
+        pages = [
+            {
+                "markdown": f"# Page {i}",
+                "metadata": {"sourceURL": f"https://example.com/{i}", "statusCode": 200},
+            }
+            for i in range(3)
+        ]
+        mock_redis_service.are_pages_processed.side_effect = None
+        mock_redis_service.are_pages_processed.return_value = [True, False, True]
+
+        try:
+            with patch(
+                "app.api.v1.endpoints.webhooks.process_and_store_documents_batch"
+            ) as mock_batch, patch.object(
+                webhooks, "METADATA_LIST_ADAPTER", wraps=webhooks.METADATA_LIST_ADAPTER
+            ) as adapter:
+                response = client.post(
+                    "/api/v1/webhooks/firecrawl",
+                    json={"type": "crawl.completed", "id": "test-crawl-phases", "data": pages},
+                )
+
+            assert response.status_code == 200
+            assert response.json()["pages_skipped"] == 2
+            dumped = adapter.dump_python.call_args[0][0]
+            assert [m.sourceURL for m in dumped] == ["https://example.com/1"]
+            documents = mock_batch.call_args[0][0]
+            assert [d["source_url"] for d in documents] == ["https://example.com/1"]
+        finally:
+            app.dependency_overrides.clear()
@@ -394,6 +394,113 @@ class TestWebhookErrorHandling:
             app.dependency_overrides.clear()
 
 
+class TestWebhookBodyLimits:
+    """Tests for per-event body caps announced via X-Firecrawl-Event."""
+
+    async def test_oversized_lifecycle_event_rejected_before_read(
+        self, test_client: AsyncClient, mock_redis_service, mock_language_detection_service
+    ):
+        """Test a crawl.started body over its cap gets 413."""
+        app.dependency_overrides[get_redis_service] = lambda: mock_redis_service
+        app.dependency_overrides[get_language_detection_service] = lambda: mock_language_detection_service
+
+        try:
+            # Arrange
+            payload = {"type": "crawl.started", "id": "crawl_123", "padding": "x" * 256}
+
+            # Act
+            with patch("app.api.v1.endpoints.webhooks.settings.WEBHOOK_MAX_EVENT_BYTES", 128):
+                response = await test_client.post(
+                    "/api/v1/webhooks/firecrawl",
+                    json=payload,
+                    headers={"X-Firecrawl-Event": "crawl.started"},
+                )
+
+            # Assert
+            assert response.status_code == 413
+        finally:
+            app.dependency_overrides.clear()
+
+    async def test_body_within_cap_or_without_event_header_accepted(
+        self, test_client: AsyncClient, mock_redis_service, mock_language_detection_service
+    ):
+        """Test the cap only applies to the event named in the header."""
+        app.dependency_overrides[get_redis_service] = lambda: mock_redis_service
+        app.dependency_overrides[get_language_detection_service] = lambda: mock_language_detection_service
+
+        try:
+            # Arrange
+            payload = {"type": "crawl.started", "id": "crawl_123", "padding": "x" * 256}
+
+            # Act
+            with patch("app.api.v1.endpoints.webhooks.settings.WEBHOOK_MAX_EVENT_BYTES", 128):
+                unlabelled = await test_client.post("/api/v1/webhooks/firecrawl", json=payload)
+                uncapped = await test_client.post(
+                    "/api/v1/webhooks/firecrawl",
+                    json=payload,
+                    headers={"X-Firecrawl-Event": "crawl.completed"},
+                )
+
+            # Assert
+            assert unlabelled.status_code == 200
+            assert uncapped.status_code == 200
+        finally:
+            app.dependency_overrides.clear()
+
+
+class TestWebhookTypedParsing:
+    """Tests for the tagged-union parse of page events straight from bytes."""
+
+    async def test_completed_event_skips_dict_parse(
+        self, test_client: AsyncClient, sample_webhook_crawl_completed,
+        mock_redis_service, mock_language_detection_service
+    ):
+        """Test a crawl.completed body never goes through orjson.loads."""
+        app.dependency_overrides[get_redis_service] = lambda: mock_redis_service
+        app.dependency_overrides[get_language_detection_service] = lambda: mock_language_detection_service
+
+        try:
+            # Act
+            with patch("app.api.v1.endpoints.webhooks.orjson.loads") as mock_loads, patch(
+                "app.api.v1.endpoints.webhooks.process_and_store_documents_batch",
+                new_callable=AsyncMock,
+            ):
+                response = await test_client.post(
+                    "/api/v1/webhooks/firecrawl",
+                    json=sample_webhook_crawl_completed,
+                )
+
+            # Assert
+            assert response.status_code == 200
+            data = response.json()
+            assert data["pages_processed"] == len(sample_webhook_crawl_completed["data"])
+            mock_loads.assert_not_called()
+        finally:
+            app.dependency_overrides.clear()
+
+    async def test_invalid_page_still_rejected(
+        self, test_client: AsyncClient, mock_redis_service, mock_language_detection_service
+    ):
+        """Test a page event that fails validation gets 400 without a dict parse."""
+        app.dependency_overrides[get_redis_service] = lambda: mock_redis_service
+        app.dependency_overrides[get_language_detection_service] = lambda: mock_language_detection_service
+
+        try:
+            # Arrange
+            payload = {"type": "crawl.page", "id": "crawl_123", "data": {"markdown": "x"}}
+
+            # Act
+            with patch("app.api.v1.endpoints.webhooks.orjson.loads") as mock_loads:
+                response = await test_client.post("/api/v1/webhooks/firecrawl", json=payload)
+
+            # Assert
+            assert response.status_code == 400
+            assert response.json()["detail"].startswith("Invalid payload:")
+            mock_loads.assert_not_called()
+        finally:
+            app.dependency_overrides.clear()
+
+
 class TestProcessCrawledPageFunction:
     """Tests for the process_crawled_page background task function."""
 
@@ -721,6 +721,41 @@ class TestVerifyWebhookSignatureFunction:
         # Correct case should succeed
         assert verify_webhook_signature(payload, signature, secret) is True
 
+    def test_verify_webhook_signature_reuses_keyed_state(self):
+        """Test the keyed HMAC state is built once per secret and never mutated."""
+        from app.api.v1.endpoints.webhooks import _keyed_hmac, verify_webhook_signature
+
+        secret = "test-secret-reuse"
+        _keyed_hmac.cache_clear()
+
+        for body in (b'{"n": 1}', b'{"n": 2}', b'{"n": 1}'):
+            signature = hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+            assert verify_webhook_signature(body, signature, secret) is True
+
+        assert _keyed_hmac.cache_info().misses == 1
+
+
+    async def test_large_bodies_are_verified_in_a_thread(self):
+        """Test only bodies past the offload threshold leave the event loop."""
+        import asyncio
+        from app.api.v1.endpoints.webhooks import (
+            SIGNATURE_OFFLOAD_BYTES,
+            _verify_signature_off_loop,
+        )
+
+        secret = "test-secret"
+        small = b'{"type": "crawl.page"}'
+        large = b'{"data": "' + b"x" * SIGNATURE_OFFLOAD_BYTES + b'"}'
+
+        with patch(
+            "app.api.v1.endpoints.webhooks.asyncio.to_thread", wraps=asyncio.to_thread
+        ) as mock_to_thread:
+            for body in (small, large):
+                signature = hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+                assert await _verify_signature_off_loop(body, signature, secret) is True
+            assert await _verify_signature_off_loop(large, "0" * 64, secret) is False
+
+        assert mock_to_thread.call_count == 2
 
 class TestWebhookSignatureIntegration:
     """Integration tests for webhook signature verification with real events."""
@@ -827,3 +862,4 @@ class TestWebhookSignatureIntegration:
             assert "Invalid webhook signature" in data["detail"]
         finally:
             app.dependency_overrides.clear()
+
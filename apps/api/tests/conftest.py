@@ -80,7 +80,7 @@ def mock_vector_db_service():
     Mock VectorDBService with pre-configured responses.
 
     Returns:
-        Mock object with upsert_document, search, and get_collection_info methods
+        Mock object with upsert_document, search, batched_search, and get_collection_info methods
     """
     service = MagicMock()
     service.upsert_document = AsyncMock(return_value=None)
@@ -94,6 +94,7 @@ def mock_vector_db_service():
             }
         ]
     )
+    service.batched_search = AsyncMock(return_value=service.search.return_value)
     service.get_collection_info = AsyncMock(
         return_value={
             "name": "graphrag",
@@ -137,10 +138,16 @@ def mock_llm_service():
     Mock LLMService with pre-configured responses.
 
     Returns:
-        Mock object with generate_response method
+        Mock object with generate_response and stream_response methods
     """
     service = MagicMock()
     service.generate_response = AsyncMock(return_value="This is a test response from the LLM.")
+
+    async def stream_response(*args, **kwargs):
+        for fragment in ("This is a test ", "response from the LLM."):
+            yield fragment
+
+    service.stream_response = MagicMock(side_effect=stream_response)
     return service
 
 
@@ -162,6 +169,18 @@ def mock_redis_service():
     service.is_page_processed = AsyncMock(return_value=False)
     service.cleanup_crawl_tracking = AsyncMock(return_value=True)
     service.get_processed_count = AsyncMock(return_value=0)
+
+    # Batch variants answer through the per-page mocks, so tests configure one place
+    async def are_pages_processed(crawl_id, source_urls):
+        return [await service.is_page_processed(crawl_id, url) for url in source_urls]
+
+    async def mark_pages_processed(crawl_id, source_urls):
+        for url in source_urls:
+            await service.mark_page_processed(crawl_id, url)
+        return True
+
+    service.are_pages_processed = AsyncMock(side_effect=are_pages_processed)
+    service.mark_pages_processed = AsyncMock(side_effect=mark_pages_processed)
     return service
 
 
@@ -178,6 +197,7 @@ def mock_language_detection_service():
     service.is_supported = AsyncMock(return_value=True)
     # The webhook code calls detect_language (sync method)
     service.detect_language = MagicMock(return_value="en")
+    service.detect_languages_batch = MagicMock(side_effect=lambda texts: ["en"] * len(texts))
     return service
 
 
@@ -192,6 +212,7 @@ def mock_graph_db_service():
     service = MagicMock()
     service.get_entity_by_id = AsyncMock(return_value=None)
     service.find_connected_entities = AsyncMock(return_value=[])
+    service.get_entity_connections = AsyncMock(return_value=None)
     service.search_entities = AsyncMock(return_value=[])
     service.create_entity = AsyncMock(return_value=None)
     service.create_relationship = AsyncMock(return_value=None)
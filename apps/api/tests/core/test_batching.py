@@ -0,0 +1,95 @@
+"""
+Tests for MicroBatcher request coalescing.
+"""
+
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, patch
+from app.core.batching import MicroBatcher
+
+
+@pytest.mark.anyio
+class TestMicroBatcher:
+    """Tests for MicroBatcher."""
+
+    async def test_concurrent_submissions_share_one_call(self):
+        """Test concurrent submits are dispatched as a single handler call."""
+        handler = AsyncMock(side_effect=lambda items: [item * 2 for item in items])
+        batcher = MicroBatcher(handler, max_batch_size=32, max_wait_ms=5)
+
+        results = await asyncio.gather(*[batcher.submit(i) for i in range(5)])
+
+        assert results == [0, 2, 4, 6, 8]
+        handler.assert_called_once_with([0, 1, 2, 3, 4])
+        await batcher.close()
+
+    async def test_batches_capped_at_max_size(self):
+        """Test submissions beyond max_batch_size spill into another call."""
+        handler = AsyncMock(side_effect=lambda items: list(items))
+        batcher = MicroBatcher(handler, max_batch_size=2, max_wait_ms=5)
+
+        results = await asyncio.gather(*[batcher.submit(i) for i in range(5)])
+
+        assert results == [0, 1, 2, 3, 4]
+        assert handler.call_count == 3
+        assert all(len(call.args[0]) <= 2 for call in handler.call_args_list)
+        await batcher.close()
+
+    async def test_handler_error_propagates_to_every_caller(self):
+        """Test a failed batch raises the handler error in each caller."""
+        handler = AsyncMock(side_effect=ConnectionError("TEI down"))
+        batcher = MicroBatcher(handler, max_wait_ms=5)
+
+        results = await asyncio.gather(
+            batcher.submit("a"), batcher.submit("b"), return_exceptions=True
+        )
+
+        assert all(isinstance(r, ConnectionError) for r in results)
+        await batcher.close()
+
+    async def test_result_count_mismatch_raises(self):
+        """Test a handler returning the wrong number of results fails the batch."""
+        handler = AsyncMock(return_value=[])
+        batcher = MicroBatcher(handler, max_wait_ms=0)
+
+        with pytest.raises(RuntimeError, match="returned 0 results"):
+            await batcher.submit("a")
+        await batcher.close()
+
+    async def test_close_allows_restart(self):
+        """Test the batcher restarts its worker after close()."""
+        handler = AsyncMock(side_effect=lambda items: list(items))
+        batcher = MicroBatcher(handler, max_wait_ms=0)
+
+        assert await batcher.submit(1) == 1
+        await batcher.close()
+        assert await batcher.submit(2) == 2
+        await batcher.close()
+
+    def test_invalid_batch_size(self):
+        """Test max_batch_size must be positive."""
+        with pytest.raises(ValueError):
+            MicroBatcher(AsyncMock(), max_batch_size=0)
+
+
+@pytest.mark.anyio
+async def test_batched_embeddings_service_coalesces_requests():
+    """Test BatchedEmbeddingsService sends concurrent texts in one TEI call."""
+    from app.services.embeddings import BatchedEmbeddingsService
+
+    service = BatchedEmbeddingsService()
+    with patch.object(
+        service,
+        "generate_embeddings",
+        AsyncMock(side_effect=lambda texts: [[float(len(t))] for t in texts]),
+    ) as mock_embed:
+        # Rebind the handler to the patched method
+        service._batcher.handler = mock_embed
+
+        results = await asyncio.gather(
+            service.generate_embedding("a"), service.generate_embedding("bbb")
+        )
+
+    assert results == [[1.0], [3.0]]
+    mock_embed.assert_called_once_with(["a", "bbb"])
+    await service.close()
@@ -124,6 +124,23 @@ class TestRedisCircuitBreakerBackend:
         ttl = await fake_redis.ttl(stored_key)
         assert ttl > 0
 
+    async def test_save_state_replaces_previous_fields(self, redis_backend, fake_redis):
+        """Test fields cleared since the last save do not survive in the hash."""
+        service_name = "test_service"
+        await redis_backend.save_state(
+            service_name, {"state": "open", "failure_count": 3, "opened_at": 1234567890.0}
+        )
+
+        await redis_backend.save_state(
+            service_name, {"state": "closed", "failure_count": 0, "opened_at": None}
+        )
+
+        loaded = await redis_backend.load_state(service_name)
+        assert loaded == {"state": "closed", "failure_count": 0}
+
+        ttl = await fake_redis.ttl(f"circuit_breaker:{service_name}:state")
+        assert 0 < ttl <= 3600
+
     async def test_state_persistence_handles_all_circuit_states(self, redis_backend):
         """Test persistence works with all circuit states."""
         test_states = [
@@ -171,6 +188,103 @@ class TestRedisCircuitBreakerBackend:
         await redis_backend.save_state("test", {"state": "OPEN"})
         # Implementation handles gracefully - no exception raised
 
+    async def test_schedule_save_coalesces_into_one_pipeline(self, fake_redis):
+        """Test buffered saves are written behind, latest state per breaker, in one pipeline."""
+        backend = RedisCircuitBreakerBackend(redis_client=fake_redis, flush_interval=0.01)
+        pipeline_calls = 0
+        real_pipeline = fake_redis.pipeline
+
+        def counting_pipeline(*args, **kwargs):
+            nonlocal pipeline_calls
+            pipeline_calls += 1
+            return real_pipeline(*args, **kwargs)
+
+        fake_redis.pipeline = counting_pipeline
+
+        backend.schedule_save("service1", {"state": "closed", "failure_count": 1})
+        backend.schedule_save("service1", {"state": "closed", "failure_count": 2})
+        backend.schedule_save("service2", {"state": "open", "failure_count": 5})
+
+        # Nothing is written until the flush interval elapses
+        assert await fake_redis.exists("circuit_breaker:service1:state") == 0
+
+        await asyncio.sleep(0.05)
+
+        assert pipeline_calls == 1
+        assert (await backend.load_state("service1"))["failure_count"] == 2
+        assert (await backend.load_state("service2"))["state"] == "open"
+
+    async def test_close_flushes_buffered_state(self, fake_redis):
+        """Test close() writes buffered states without waiting for the interval."""
+        backend = RedisCircuitBreakerBackend(redis_client=fake_redis, flush_interval=60.0)
+
+        backend.schedule_save("service1", {"state": "open", "failure_count": 3})
+        await backend.close()
+
+        assert (await backend.load_state("service1"))["failure_count"] == 3
+
+    async def test_close_waits_for_flush_in_progress(self, fake_redis):
+        """Test close() does not return while a timer-started flush is still writing."""
+        backend = RedisCircuitBreakerBackend(redis_client=fake_redis, flush_interval=0.0)
+        writing, release = asyncio.Event(), asyncio.Event()
+        real_pipeline = fake_redis.pipeline
+
+        def gated_pipeline(*args, **kwargs):
+            pipe = real_pipeline(*args, **kwargs)
+            real_execute = pipe.execute
+
+            async def execute(*a, **kw):
+                writing.set()
+                await release.wait()
+                return await real_execute(*a, **kw)
+
+            pipe.execute = execute
+            return pipe
+
+        fake_redis.pipeline = gated_pipeline
+
+        backend.schedule_save("service1", {"state": "open", "failure_count": 3})
+        await writing.wait()
+        close_task = asyncio.create_task(backend.close())
+        await asyncio.sleep(0.01)
+
+        assert not close_task.done()
+
+        release.set()
+        await close_task
+
+        assert (await backend.load_state("service1"))["failure_count"] == 3
+
+    async def test_direct_save_supersedes_buffered_state(self, fake_redis):
+        """Test an awaited save_state is not overwritten by an older buffered state."""
+        backend = RedisCircuitBreakerBackend(redis_client=fake_redis, flush_interval=0.01)
+
+        backend.schedule_save("service1", {"state": "open", "failure_count": 3})
+        await backend.save_state("service1", {"state": "closed", "failure_count": 0})
+        await asyncio.sleep(0.05)
+
+        assert (await backend.load_state("service1"))["state"] == "closed"
+
+    async def test_default_schedule_save_keeps_task_referenced(self):
+        """Test the base backend holds its fire-and-forget save until it finishes."""
+        from app.core import circuit_breaker_persistence
+        from app.core.circuit_breaker_persistence import CircuitBreakerPersistenceBackend
+
+        release = asyncio.Event()
+
+        class SlowBackend(CircuitBreakerPersistenceBackend):
+            async def save_state(self, name, state):
+                await release.wait()
+
+        SlowBackend().schedule_save("service1", {"state": "open"})
+        await asyncio.sleep(0)
+        assert len(circuit_breaker_persistence._background_saves) == 1
+
+        release.set()
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        assert not circuit_breaker_persistence._background_saves
+
     @pytest.mark.skip(reason="list_all() method not yet implemented")
     async def test_list_all_circuit_breakers(self, redis_backend):
         """Test listing all circuit breakers with their states."""
@@ -508,6 +622,9 @@ class TestPersistencePerformance:
             "last_failure_time": time.time(),
         }
 
+        # Warm up: the first command builds the fake server and its connection
+        await redis_backend.save_state("warmup_service", state_data)
+
         start = time.time()
         await redis_backend.save_state("test_service", state_data)
         elapsed = time.time() - start
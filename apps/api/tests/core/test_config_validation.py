@@ -63,6 +63,24 @@ class TestConfigValidation:
                 from app.core.config import Settings
                 Settings()
 
+    def test_allowed_languages_set_parsed_once(self):
+        """Test allowed languages are exposed as a cached frozenset."""
+        with patch.dict(os.environ, {
+            'ALLOWED_LANGUAGES': 'en, es,fr',
+            'FIRECRAWL_URL': 'http://localhost:4200',
+            'FIRECRAWL_API_KEY': 'test-key',
+            'QDRANT_URL': 'http://localhost:4203',
+            'TEI_URL': 'http://localhost:4207',
+            'DEBUG': 'true'
+        }):
+            from app.core.config import Settings
+            settings = Settings()
+
+            assert settings.allowed_languages_set == frozenset({"en", "es", "fr"})
+            assert settings.allowed_languages_set is settings.allowed_languages_set
+            assert settings.allowed_languages_list is settings.allowed_languages_list
+            assert "allowed_languages_set" not in settings.model_dump()
+
     def test_language_filter_mode_validation(self):
         """
         Test that only 'strict' and 'lenient' modes are accepted.
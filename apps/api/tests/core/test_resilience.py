@@ -4,7 +4,7 @@ Tests for resilience patterns: retry logic and circuit breaker.
 
 import pytest
 import asyncio
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 from app.core.resilience import (
     RetryPolicy,
     CircuitBreaker,
@@ -50,6 +50,14 @@ class TestRetryPolicy:
         # Attempt 2 would be 10 * 2^2 = 40, but capped at 15
         assert policy.get_delay(2) == 15.0
 
+    def test_get_delay_beyond_max_attempts(self):
+        """Test attempts past the precomputed schedule still back off correctly."""
+        policy = RetryPolicy(max_attempts=2, base_delay=1.0, max_delay=30.0, jitter=False)
+
+        assert policy.get_delay(1) == 2.0
+        assert policy.get_delay(3) == 8.0
+        assert policy.get_delay(10) == 30.0
+
     def test_get_delay_with_jitter(self):
         """Test jitter adds randomness to delay."""
         policy = RetryPolicy(base_delay=2.0, jitter=True)
@@ -109,6 +117,28 @@ class TestCircuitBreaker:
         assert breaker.can_attempt() is True
         assert breaker.state == CircuitState.HALF_OPEN
 
+    def test_success_without_failures_skips_persistence(self):
+        """Test a steady-state success schedules no backend write."""
+        backend = MagicMock()
+        breaker = CircuitBreaker("test", CircuitBreakerConfig(), persistence_backend=backend)
+
+        breaker.record_success()
+        backend.schedule_save.assert_not_called()
+
+        breaker.record_failure()
+        breaker.record_success()
+        assert backend.schedule_save.call_count == 2
+
+    def test_wall_clock_jump_does_not_end_open_state(self):
+        """Test recovery timing ignores wall-clock steps (e.g. NTP corrections)."""
+        config = CircuitBreakerConfig(failure_threshold=1, recovery_timeout=60)
+        breaker = CircuitBreaker("test", config)
+        breaker.record_failure()
+
+        with patch("app.core.resilience.time.time", return_value=breaker.last_failure_time + 3600):
+            assert breaker.can_attempt() is False
+        assert breaker.state == CircuitState.OPEN
+
     @pytest.mark.anyio
     async def test_closes_on_success_in_half_open(self):
         """Test circuit closes after successful request in HALF_OPEN state."""
@@ -343,6 +373,52 @@ class TestPredefinedPolicies:
         assert breaker2 is breaker1
         assert breaker2.failure_count == 1
 
+    def test_get_circuit_breaker_shares_backend_per_redis_client(self):
+        """Test breakers on the same Redis client share one persistence backend."""
+        from fakeredis import FakeAsyncRedis
+        from app.core.resilience import _circuit_breakers, _persistence_backends
+
+        redis = FakeAsyncRedis(decode_responses=True)
+
+        try:
+            with patch("app.core.config.settings.ENABLE_CIRCUIT_BREAKER_PERSISTENCE", True):
+                breaker1 = get_circuit_breaker("shared_backend_1", redis_client=redis)
+                breaker2 = get_circuit_breaker("shared_backend_2", redis_client=redis)
+
+            assert breaker1.persistence_backend is not None
+            assert breaker1.persistence_backend is breaker2.persistence_backend
+        finally:
+            _circuit_breakers.pop("shared_backend_1", None)
+            _circuit_breakers.pop("shared_backend_2", None)
+            _persistence_backends.pop(id(redis), None)
+
+    @pytest.mark.anyio
+    async def test_close_persistence_backends_flushes_buffered_state(self):
+        """Test the shutdown helper writes state still sitting in a backend's buffer."""
+        from fakeredis import FakeAsyncRedis
+        from app.core.resilience import (
+            _circuit_breakers,
+            _persistence_backends,
+            close_persistence_backends,
+        )
+
+        redis = FakeAsyncRedis(decode_responses=True)
+
+        try:
+            with patch("app.core.config.settings.ENABLE_CIRCUIT_BREAKER_PERSISTENCE", True):
+                breaker = get_circuit_breaker("shutdown_flush", redis_client=redis)
+            backend = breaker.persistence_backend
+            backend.flush_interval = 60.0
+            backend.schedule_save("shutdown_flush", {"state": "open", "failure_count": 4})
+
+            await close_persistence_backends()
+
+            assert (await backend.load_state("shutdown_flush"))["failure_count"] == 4
+        finally:
+            _circuit_breakers.pop("shutdown_flush", None)
+            _persistence_backends.pop(id(redis), None)
+            await redis.aclose()
+
     def test_reset_all_circuit_breakers(self):
         """Test reset_all_circuit_breakers() resets all breakers."""
         reset_all_circuit_breakers()
@@ -366,41 +442,41 @@ class TestCircuitBreakerPersistence:
     async def test_persistence_backend_save_and_load(self):
         """Test persistence backend can save and load circuit breaker state."""
         from app.core.circuit_breaker_persistence import RedisCircuitBreakerBackend
-        from unittest.mock import AsyncMock
+        from fakeredis import FakeAsyncRedis
 
-        # Mock Redis client
-        mock_redis = MagicMock()
-        mock_redis.set = AsyncMock()
-        mock_redis.get = AsyncMock(return_value='{"state": "open", "failure_count": 5}')
-        mock_redis.delete = AsyncMock()
+        redis = FakeAsyncRedis(decode_responses=True)
+        backend = RedisCircuitBreakerBackend(redis)
 
-        backend = RedisCircuitBreakerBackend(mock_redis)
-
-        # Test save_state
+        # Test save_state (stored as a hash of native fields)
         state = {"state": "open", "failure_count": 5}
         await backend.save_state("test_service", state)
-        mock_redis.set.assert_called_once()
+        assert await redis.hgetall("circuit_breaker:test_service:state") == {
+            "state": "open",
+            "failure_count": "5",
+        }
 
         # Test load_state
         loaded_state = await backend.load_state("test_service")
         assert loaded_state == state
-        mock_redis.get.assert_called_once()
 
         # Test delete_state
         await backend.delete_state("test_service")
-        mock_redis.delete.assert_called_once()
+        assert await redis.exists("circuit_breaker:test_service:state") == 0
 
     @pytest.mark.anyio
     async def test_circuit_breaker_with_persistence_loads_state(self):
         """Test CircuitBreaker loads state from persistence backend on initialization."""
         from app.core.circuit_breaker_persistence import RedisCircuitBreakerBackend
-        from unittest.mock import AsyncMock
+        from fakeredis import FakeAsyncRedis
 
-        # Mock Redis client with OPEN state
-        mock_redis = MagicMock()
-        mock_redis.get = AsyncMock(return_value='{"state": "open", "failure_count": 5, "opened_at": 1234567890.0}')
+        # Redis holding an OPEN state
+        redis = FakeAsyncRedis(decode_responses=True)
+        await redis.hset(
+            "circuit_breaker:test_service:state",
+            mapping={"state": "open", "failure_count": 5, "opened_at": 1234567890.0},
+        )
 
-        backend = RedisCircuitBreakerBackend(mock_redis)
+        backend = RedisCircuitBreakerBackend(redis)
 
         # Create circuit breaker with persistence
         config = CircuitBreakerConfig(failure_threshold=3)
@@ -412,20 +488,39 @@ class TestCircuitBreakerPersistence:
         # Verify state was loaded
         assert breaker.state == CircuitState.OPEN
         assert breaker.failure_count == 5
+        assert breaker.last_failure_time == 1234567890.0
+
+    @pytest.mark.anyio
+    async def test_unknown_persisted_state_loads_as_closed(self):
+        """Test an unrecognised stored state string falls back to CLOSED."""
+        from app.core.circuit_breaker_persistence import RedisCircuitBreakerBackend
+        from fakeredis import FakeAsyncRedis
+
+        redis = FakeAsyncRedis(decode_responses=True)
+        await redis.hset(
+            "circuit_breaker:test_service:state",
+            mapping={"state": "tripped", "failure_count": 2},
+        )
+
+        breaker = CircuitBreaker(
+            "test_service",
+            CircuitBreakerConfig(),
+            persistence_backend=RedisCircuitBreakerBackend(redis),
+        )
+        await breaker.load_from_backend()
+
+        assert breaker.state is CircuitState.CLOSED
+        assert breaker.failure_count == 2
 
     @pytest.mark.anyio
     async def test_circuit_breaker_persists_state_changes(self):
         """Test CircuitBreaker persists state changes to backend."""
         from app.core.circuit_breaker_persistence import RedisCircuitBreakerBackend
-        from unittest.mock import AsyncMock
+        from fakeredis import FakeAsyncRedis
         import asyncio
 
-        # Mock Redis client
-        mock_redis = MagicMock()
-        mock_redis.get = AsyncMock(return_value=None)  # No initial state
-        mock_redis.set = AsyncMock()
-
-        backend = RedisCircuitBreakerBackend(mock_redis)
+        redis = FakeAsyncRedis(decode_responses=True)  # No initial state
+        backend = RedisCircuitBreakerBackend(redis)
 
         # Create circuit breaker with persistence
         config = CircuitBreakerConfig(failure_threshold=2)
@@ -439,7 +534,9 @@ class TestCircuitBreakerPersistence:
         await asyncio.sleep(0.1)
 
         # Verify state was persisted (called after each state change)
-        assert mock_redis.set.call_count >= 1
+        stored = await redis.hgetall("circuit_breaker:test_service:state")
+        assert stored["state"] == "open"
+        assert stored["failure_count"] == "2"
         assert breaker.state == CircuitState.OPEN
 
     @pytest.mark.anyio
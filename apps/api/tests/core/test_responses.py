@@ -0,0 +1,41 @@
+"""
+Tests for pre-serialized model responses.
+"""
+
+import json
+from typing import Optional
+from pydantic import BaseModel
+from app.core.responses import model_response
+
+
+class Item(BaseModel):
+    name: str
+    note: Optional[str] = None
+
+
+class TestModelResponse:
+    """Tests for model_response."""
+
+    def test_single_model(self):
+        """Test a model is dumped to a JSON body."""
+        response = model_response(Item(name="a"))
+
+        assert response.status_code == 200
+        assert response.media_type == "application/json"
+        assert json.loads(response.body) == {"name": "a", "note": None}
+
+    def test_list_of_models(self):
+        """Test a sequence of models becomes a JSON array."""
+        response = model_response([Item(name="a"), Item(name="b", note="x")])
+
+        assert json.loads(response.body) == [
+            {"name": "a", "note": None},
+            {"name": "b", "note": "x"},
+        ]
+
+    def test_empty_list_and_status_code(self):
+        """Test an empty list and a custom status code."""
+        response = model_response([], status_code=201)
+
+        assert response.status_code == 201
+        assert json.loads(response.body) == []
@@ -0,0 +1,52 @@
+"""
+Tests for ResponseTimeMiddleware.
+"""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from httpx import ASGITransport, AsyncClient
+
+from app.core.timing import ResponseTimeMiddleware
+
+
+@pytest.fixture
+def timed_app():
+    """Minimal app with the timing middleware installed."""
+    app = FastAPI()
+    app.add_middleware(ResponseTimeMiddleware)
+
+    @app.get("/ping")
+    async def ping():
+        return {"ok": True}
+
+    @app.get("/stream")
+    async def stream():
+        async def body():
+            yield b"a"
+            yield b"b"
+
+        return StreamingResponse(body(), media_type="text/plain")
+
+    return app
+
+
+@pytest.mark.anyio
+class TestResponseTimeMiddleware:
+    """Tests for ResponseTimeMiddleware."""
+
+    async def test_adds_response_time_header(self, timed_app):
+        """Test JSON responses carry a non-negative X-Response-Time-ms header."""
+        async with AsyncClient(transport=ASGITransport(app=timed_app), base_url="http://t") as c:
+            response = await c.get("/ping")
+
+        assert response.json() == {"ok": True}
+        assert float(response.headers["X-Response-Time-ms"]) >= 0
+
+    async def test_streaming_body_passes_through(self, timed_app):
+        """Test streaming responses are timed without altering the body."""
+        async with AsyncClient(transport=ASGITransport(app=timed_app), base_url="http://t") as c:
+            response = await c.get("/stream")
+
+        assert response.text == "ab"
+        assert "X-Response-Time-ms" in response.headers
@@ -0,0 +1,43 @@
+"""
+Tests for startup warm-up of the query path.
+"""
+
+import asyncio
+import pytest
+from unittest.mock import AsyncMock
+
+from app.core.warmup import warm_up_services
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_warm_up_runs_every_step(
+    mock_embeddings_service, mock_vector_db_service, mock_llm_service
+):
+    """Test the embedding feeds an uncached search and the LLM is called once."""
+    results = await warm_up_services(
+        mock_embeddings_service, mock_vector_db_service, mock_llm_service
+    )
+
+    assert all(results.values())
+    mock_vector_db_service.search.assert_awaited_once_with(query_embedding=[0.1] * 768, limit=1)
+    mock_llm_service.generate_response.assert_awaited_once()
+
+
+async def test_failures_and_timeouts_do_not_raise(
+    mock_embeddings_service, mock_vector_db_service, mock_llm_service
+):
+    """Test an unreachable backend or a slow model load is logged, not raised."""
+    mock_embeddings_service.generate_embedding = AsyncMock(side_effect=ConnectionError("TEI down"))
+
+    async def slow_generate(**kwargs):
+        await asyncio.sleep(1)
+
+    mock_llm_service.generate_response = AsyncMock(side_effect=slow_generate)
+
+    results = await warm_up_services(
+        mock_embeddings_service, mock_vector_db_service, mock_llm_service, timeout=0.01
+    )
+
+    assert results == {"Embeddings + vector search": False, "LLM": False}
+    mock_vector_db_service.search.assert_not_called()
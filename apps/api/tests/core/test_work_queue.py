@@ -0,0 +1,95 @@
+"""
+Tests for BoundedWorkQueue background job execution.
+"""
+
+import asyncio
+import pytest
+from unittest.mock import AsyncMock
+from app.core.work_queue import BoundedWorkQueue
+
+
+@pytest.mark.anyio
+class TestBoundedWorkQueue:
+    """Tests for BoundedWorkQueue."""
+
+    async def test_submitted_jobs_run_with_arguments(self):
+        """Test jobs run on a worker with the submitted args and kwargs."""
+        job = AsyncMock()
+        queue = BoundedWorkQueue(maxsize=4, workers=2)
+        queue.start()
+
+        queue.submit(job, "doc", source_type="extract")
+        await queue.close()
+
+        job.assert_awaited_once_with("doc", source_type="extract")
+
+    async def test_concurrency_capped_at_worker_count(self):
+        """Test no more than `workers` jobs run at once."""
+        running = 0
+        peak = 0
+
+        async def job():
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+        queue = BoundedWorkQueue(maxsize=10, workers=2)
+        queue.start()
+        for _ in range(6):
+            queue.submit(job)
+        await queue.close()
+
+        assert peak == 2
+
+    async def test_submit_raises_when_full(self):
+        """Test submit rejects work beyond maxsize instead of growing."""
+        gate = asyncio.Event()
+        queue = BoundedWorkQueue(maxsize=1, workers=1)
+        queue.start()
+
+        queue.submit(gate.wait)
+        await asyncio.sleep(0)  # let the worker pick up the first job
+        queue.submit(gate.wait)
+
+        assert queue.full()
+        with pytest.raises(asyncio.QueueFull):
+            queue.submit(gate.wait)
+
+        gate.set()
+        await queue.close()
+
+    async def test_failing_job_does_not_stop_worker(self):
+        """Test a job error is logged and the worker keeps going."""
+        after = AsyncMock()
+        queue = BoundedWorkQueue(maxsize=4, workers=1)
+        queue.start()
+
+        queue.submit(AsyncMock(side_effect=RuntimeError("TEI down")))
+        queue.submit(after)
+        await queue.close()
+
+        after.assert_awaited_once()
+
+    async def test_close_drops_jobs_after_timeout(self):
+        """Test close() gives up on queued work after the timeout."""
+        queue = BoundedWorkQueue(maxsize=4, workers=1)
+        queue.start()
+        queue.submit(asyncio.sleep, 10)
+
+        await queue.close(timeout=0.01)
+
+        assert queue.qsize() == 0
+
+    def test_submit_before_start_raises(self):
+        """Test submit fails fast if the queue was never started."""
+        with pytest.raises(RuntimeError, match="not started"):
+            BoundedWorkQueue().submit(AsyncMock())
+
+    def test_invalid_sizes(self):
+        """Test maxsize and workers must be positive."""
+        with pytest.raises(ValueError):
+            BoundedWorkQueue(maxsize=0)
+        with pytest.raises(ValueError):
+            BoundedWorkQueue(workers=0)
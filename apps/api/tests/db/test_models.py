@@ -176,3 +176,17 @@ class TestConversationTagModel:
         assert len(conversation.tags) == 2
         assert any(t.tag == "work" for t in conversation.tags)
         assert any(t.tag == "urgent" for t in conversation.tags)
+
+    async def test_conversation_tag_names_proxy(self, db_session):
+        """Test tag_names exposes and creates tags as plain strings."""
+        from app.db.models import Conversation
+
+        conversation = Conversation(title="Test")
+        conversation.tag_names.append("work")
+        conversation.tag_names.append("urgent")
+        db_session.add(conversation)
+        await db_session.commit()
+        await db_session.refresh(conversation)
+
+        assert sorted(conversation.tag_names) == ["urgent", "work"]
+        assert all(t.conversation_id == conversation.id for t in conversation.tags)
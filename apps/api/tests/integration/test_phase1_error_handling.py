@@ -103,8 +103,9 @@ class TestWebhookInvalidJSON:
             headers={"Content-Type": "application/json"},
         )
 
-        # Assert: Should return 500 Internal Server Error for JSON parsing errors
-        assert response.status_code == 500
+        # Assert: Non-UTF-8 bodies are reported like any other invalid JSON
+        assert response.status_code == 200
+        assert response.json() == {"status": "error", "error": "Invalid JSON payload"}
 
     async def test_extremely_large_json_payload(self, test_client: AsyncClient):
         """Test webhook with extremely large JSON payload."""
@@ -390,6 +390,42 @@ class TestDocumentProcessorBatchOptimization:
                 assert len(call_args[0][0]) == 2  # 2 documents in single upsert
 
 
+    @pytest.mark.asyncio
+    async def test_batches_group_documents_of_similar_length(self):
+        """
+        Verify documents are batched in length order and keep their own embeddings.
+        """
+        mock_embeddings_service = AsyncMock()
+        mock_embeddings_service.generate_embeddings.side_effect = (
+            lambda contents: [[float(len(c))] for c in contents]
+        )
+
+        mock_vector_db_service = AsyncMock()
+
+        documents = [
+            {"content": "x" * n, "source_url": f"https://example.com/{n}",
+             "metadata": {}, "source_type": "test"}
+            for n in (50, 1, 40, 2)
+        ]
+
+        with patch('app.services.document_processor.MAX_BATCH_SIZE', 2):
+            with patch('app.services.document_processor.get_embeddings_service',
+                       return_value=mock_embeddings_service):
+                with patch('app.services.document_processor.get_vector_db_service',
+                           return_value=mock_vector_db_service):
+
+                    await process_and_store_documents_batch(documents)
+
+        batches = sorted(
+            [len(c) for c in call.args[0]]
+            for call in mock_embeddings_service.generate_embeddings.call_args_list
+        )
+        assert batches == [[1, 2], [40, 50]]
+
+        stored = [doc for call in mock_vector_db_service.upsert_documents.call_args_list
+                  for doc in call.args[0]]
+        assert all(doc["embedding"] == [float(len(doc["content"]))] for doc in stored)
+
 class TestDocumentProcessorEdgeCases:
     """Test edge cases and validation."""
 
@@ -454,3 +490,26 @@ class TestDocumentProcessorEdgeCases:
                 # VERIFY: Only 1 document processed
                 call_args = mock_embeddings_service.generate_embeddings.call_args
                 assert len(call_args[0][0]) == 1
+
+    @pytest.mark.asyncio
+    async def test_doc_id_is_stable_md5_of_source_url(self):
+        """Verify point IDs stay MD5(source_url) so re-ingestion overwrites, not duplicates."""
+        import hashlib
+
+        mock_embeddings_service = AsyncMock()
+        mock_embeddings_service.generate_embeddings.return_value = [[0.1] * 1024]
+
+        mock_vector_db_service = AsyncMock()
+
+        url = "https://example.com/stable"
+        documents = [{"content": "test", "source_url": url, "metadata": {}, "source_type": "test"}]
+
+        with patch('app.services.document_processor.get_embeddings_service',
+                   return_value=mock_embeddings_service):
+            with patch('app.services.document_processor.get_vector_db_service',
+                       return_value=mock_vector_db_service):
+
+                await process_and_store_documents_batch(documents)
+
+                stored = mock_vector_db_service.upsert_documents.call_args[0][0]
+                assert stored[0]["doc_id"] == hashlib.md5(url.encode()).hexdigest()
@@ -0,0 +1,81 @@
+"""
+Tests for TEI embeddings service.
+"""
+
+import json
+import pytest
+import respx
+from httpx import Response
+from app.services.embeddings import EmbeddingsService
+from app.core.config import settings
+
+pytestmark = pytest.mark.anyio
+
+
+class TestGenerateEmbeddings:
+    """Tests for generate_embeddings and generate_embedding."""
+
+    @respx.mock
+    async def test_generate_embeddings_decodes_vectors(self):
+        """Test TEI's JSON float arrays come back as lists of floats, in order."""
+        route = respx.post(f"{settings.TEI_URL}/embed").mock(
+            return_value=Response(200, json=[[0.25, -1.5, 3.0], [1.0, 0.0, 0.5]])
+        )
+
+        result = await EmbeddingsService().generate_embeddings(["a", "b"])
+
+        assert result == [[0.25, -1.5, 3.0], [1.0, 0.0, 0.5]]
+        assert all(type(x) is float for vector in result for x in vector)
+        assert json.loads(route.calls.last.request.content) == {"inputs": ["a", "b"]}
+
+    @respx.mock
+    async def test_generate_embedding_returns_single_vector(self):
+        """Test the single-text helper unwraps the batch response."""
+        respx.post(f"{settings.TEI_URL}/embed").mock(return_value=Response(200, json=[[0.5, 0.5]]))
+
+        assert await EmbeddingsService().generate_embedding("a") == [0.5, 0.5]
+
+    @respx.mock
+    async def test_http_error_raises(self):
+        """Test TEI errors propagate to the caller."""
+        import httpx
+
+        respx.post(f"{settings.TEI_URL}/embed").mock(return_value=Response(503))
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await EmbeddingsService().generate_embeddings(["a"])
+
+    @respx.mock
+    async def test_large_inputs_split_into_ordered_chunks(self, monkeypatch):
+        """Test inputs over EMBEDDINGS_BATCH_SIZE go out as several requests, order kept."""
+        monkeypatch.setattr(settings, "EMBEDDINGS_BATCH_SIZE", 2)
+
+        def embed(request):
+            inputs = json.loads(request.content)["inputs"]
+            return Response(200, json=[[float(text)] for text in inputs])
+
+        route = respx.post(f"{settings.TEI_URL}/embed").mock(side_effect=embed)
+
+        result = await EmbeddingsService().generate_embeddings(["1", "2", "3", "4", "5"])
+
+        assert result == [[1.0], [2.0], [3.0], [4.0], [5.0]]
+        assert route.call_count == 3
+        assert all(len(json.loads(c.request.content)["inputs"]) <= 2 for c in route.calls)
+
+    @respx.mock
+    async def test_chunks_group_similar_lengths(self, monkeypatch):
+        """Test chunked requests hold similar-length texts but results keep input order."""
+        monkeypatch.setattr(settings, "EMBEDDINGS_BATCH_SIZE", 2)
+
+        def embed(request):
+            inputs = json.loads(request.content)["inputs"]
+            return Response(200, json=[[float(len(text))] for text in inputs])
+
+        route = respx.post(f"{settings.TEI_URL}/embed").mock(side_effect=embed)
+        texts = ["x" * 40, "x", "x" * 30, "xx"]
+
+        result = await EmbeddingsService().generate_embeddings(texts)
+
+        assert result == [[40.0], [1.0], [30.0], [2.0]]
+        sent = sorted(json.loads(c.request.content)["inputs"] for c in route.calls)
+        assert sent == [["x", "xx"], ["x" * 30, "x" * 40]]
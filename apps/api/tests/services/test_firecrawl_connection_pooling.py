@@ -8,7 +8,7 @@ Following TDD methodology:
 
 These tests verify:
 - Persistent client creation and reuse across multiple calls
-- Connection pooling configuration (max_connections=100, max_keepalive=20)
+- Connection pooling configuration (max_connections=128, max_keepalive=64)
 - Authorization headers set on client level
 - Proper cleanup with close() method
 - Client recreation after close (is_closed check)
@@ -66,8 +66,8 @@ class TestConnectionPoolingClientCreation:
 
         # Assert
         # Access pool limits via transport._pool
-        assert client._transport._pool._max_connections == 100
-        assert client._transport._pool._max_keepalive_connections == 20
+        assert client._transport._pool._max_connections == 128
+        assert client._transport._pool._max_keepalive_connections == 64
 
     async def test_client_has_correct_timeout_configuration(self):
         """Test that client has correct timeout settings."""
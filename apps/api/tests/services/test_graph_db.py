@@ -209,6 +209,22 @@ class TestGraphDBService:
         assert "org1" in entity_ids
         assert "person2" not in entity_ids
 
+    async def test_get_entity_connections_missing_entity(self, graph_db):
+        """Test get_entity_connections returns None for an unknown entity."""
+        assert await graph_db.get_entity_connections(entity_id="missing") is None
+
+    async def test_get_entity_connections_isolated_entity(self, graph_db):
+        """Test get_entity_connections returns [] for an entity with no neighbours."""
+        await graph_db.create_entity("lonely", "PERSON", "Alice", {})
+        await graph_db.create_entity("org1", "ORG", "Microsoft", {})
+        await graph_db.create_relationship("lonely", "org1", "WORKS_AT", {})
+
+        connected = await graph_db.get_entity_connections(
+            entity_id="lonely", max_depth=1, relationship_types=["KNOWS"]
+        )
+
+        assert connected == []
+
     async def test_search_entities_by_text(self, graph_db):
         """Test searching for entities by text content."""
         # Create test entities
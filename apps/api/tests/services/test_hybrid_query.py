@@ -266,6 +266,27 @@ class TestHybridQueryEngine:
         assert "combined_results" in result
         assert "retrieval_strategy" in result
 
+    async def test_injected_services_are_reused(self):
+        """Test services passed to the constructor are used instead of new instances."""
+        entity_extractor = AsyncMock()
+        embeddings = AsyncMock()
+        vector_db = AsyncMock()
+        graph_db = AsyncMock()
+
+        with patch('app.services.hybrid_query.VectorDBService') as mock_vector_class:
+            engine = HybridQueryEngine(
+                entity_extractor=entity_extractor,
+                embeddings_service=embeddings,
+                vector_db_service=vector_db,
+                graph_db_service=graph_db,
+            )
+
+        mock_vector_class.assert_not_called()
+        assert engine.entity_extractor is entity_extractor
+        assert engine.embeddings_service is embeddings
+        assert engine.vector_db_service is vector_db
+        assert engine.graph_db_service is graph_db
+
 
 @pytest.mark.asyncio
 class TestHybridQueryWithCache:
@@ -184,3 +184,16 @@ class TestLanguageDetectionCache:
         # Key should be a valid MD5 hex digest (32 chars)
         assert len(key1) == 32
         assert all(c in "0123456789abcdef" for c in key1)
+
+    def test_detect_languages_batch_preserves_order(self):
+        """Test batch detection returns one code per text, in input order."""
+        service = LanguageDetectionService()
+
+        english = "This is a fairly long English sentence used for language detection tests."
+        spanish = "Esta es una frase bastante larga en español para las pruebas de idioma."
+
+        result = service.detect_languages_batch([english, spanish, "short", english])
+
+        assert result == ["en", "es", "unknown", "en"]
+        # The repeated English text is answered from the cache
+        assert service.get_cache_stats()["hits"] == 1
@@ -227,3 +227,39 @@ class TestLLMGenerateResponse:
 
         # Assert - timeout is set in the request (verified by successful completion)
         assert route.called
+
+
+class TestLLMStreamResponse:
+    """Tests for stream_response method."""
+
+    @respx.mock
+    async def test_stream_response_yields_fragments(self):
+        """Test streamed NDJSON chunks are yielded in order."""
+        # Arrange
+        service = LLMService()
+        lines = [
+            {"response": "Graph", "done": False},
+            {"response": "RAG", "done": False},
+            {"response": "", "done": True},
+        ]
+        body = "\n".join(json.dumps(line) for line in lines)
+
+        route = respx.post(f"{settings.OLLAMA_URL}/api/generate").mock(
+            return_value=Response(200, text=body)
+        )
+
+        # Act
+        fragments = [f async for f in service.stream_response("What?", "Context")]
+
+        # Assert
+        assert fragments == ["Graph", "RAG"]
+        assert json.loads(route.calls.last.request.content)["stream"] is True
+
+    async def test_stream_response_when_llm_not_configured(self, monkeypatch):
+        """Test streaming reports an unconfigured LLM instead of failing."""
+        monkeypatch.setattr(settings, "OLLAMA_URL", "")
+        service = LLMService()
+
+        fragments = [f async for f in service.stream_response("What?", "Context")]
+
+        assert fragments == ["LLM service not configured"]
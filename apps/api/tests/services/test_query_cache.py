@@ -205,7 +205,7 @@ class TestCacheInvalidation:
 
         # Invalidate test collection
         deleted = await query_cache.invalidate_collection(collection)
-        assert deleted == 3
+        assert deleted == 1
 
         # Queries from invalidated collection should return None
         assert await query_cache.get(collection, "query1") is None
@@ -224,13 +224,49 @@ class TestCacheInvalidation:
 
         # Invalidate all
         deleted = await query_cache.invalidate_all()
-        assert deleted == 3
+        assert deleted == 1
 
         # All queries should return None
         assert await query_cache.get("collection1", "query1") is None
         assert await query_cache.get("collection2", "query2") is None
         assert await query_cache.get("collection3", "query3") is None
 
+    async def test_invalidate_collection_is_single_incr(self, query_cache, fake_redis):
+        """Test invalidation bumps a revision instead of deleting keys."""
+        await query_cache.set("gen", "query", {"data": 1}, query_time_ms=10.0)
+        keys_before = await fake_redis.keys("query_cache:v1:gen:*")
+
+        await query_cache.invalidate_collection("gen")
+
+        # Old generation is left to expire, but is no longer readable
+        assert await fake_redis.keys("query_cache:v1:gen:*") == keys_before
+        assert await fake_redis.get("query_cache:rev:gen") == "1"
+        assert await query_cache.get("gen", "query") is None
+
+        await query_cache.set("gen", "query", {"data": 2}, query_time_ms=10.0)
+        assert await query_cache.get("gen", "query") == {"data": 2}
+
+    async def test_revision_seen_by_other_instances(self, query_cache, fake_redis):
+        """Test another cache instance observes invalidation once its revision expires."""
+        other = QueryCache(redis_client=fake_redis)
+        other.REVISION_CACHE_TTL = 0
+
+        await query_cache.set("shared", "query", {"data": 1}, query_time_ms=10.0)
+        assert await other.get("shared", "query") == {"data": 1}
+
+        await query_cache.invalidate_all()
+
+        assert await other.get("shared", "query") is None
+
+    async def test_current_revision_tracks_invalidation(self, query_cache, fake_redis):
+        """Test current_revision changes on invalidation and is None when disabled."""
+        before = await query_cache.current_revision("rev")
+        await query_cache.invalidate_collection("rev")
+
+        assert await query_cache.current_revision("rev") != before
+        disabled = QueryCache(redis_client=fake_redis, enabled=False)
+        assert await disabled.current_revision("rev") is None
+
 
 @pytest.mark.asyncio
 class TestCacheWithQueryParameters:
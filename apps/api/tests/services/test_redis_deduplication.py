@@ -195,6 +195,50 @@ class TestRedisDeduplication:
         assert is_processed_lower is True
         assert is_processed_upper is False
 
+    # =========================================================================
+    # Test batch variants - one round-trip per crawl
+    # =========================================================================
+
+    @pytest.mark.asyncio
+    async def test_mark_pages_processed_batch(self, redis_service, fake_redis_client):
+        """Test several pages are marked in one call, with the usual TTL."""
+        crawl_id = "crawl-batch-mark"
+        urls = ["https://example.com/a", "https://example.com/b"]
+
+        assert await redis_service.mark_pages_processed(crawl_id, urls) is True
+
+        key = f"crawl:{crawl_id}:processed"
+        assert await fake_redis_client.smembers(key) == set(urls)
+        assert 0 < await fake_redis_client.ttl(key) <= 3600
+
+    @pytest.mark.asyncio
+    async def test_are_pages_processed_preserves_order(self, redis_service):
+        """Test batch membership returns one flag per URL, in input order."""
+        crawl_id = "crawl-batch-check"
+        await redis_service.mark_page_processed(crawl_id, "https://example.com/b")
+
+        flags = await redis_service.are_pages_processed(
+            crawl_id, ["https://example.com/a", "https://example.com/b", "https://example.com/c"]
+        )
+
+        assert flags == [False, True, False]
+
+    @pytest.mark.asyncio
+    async def test_batch_variants_handle_empty_input(self, redis_service, fake_redis_client):
+        """Test empty URL lists make no Redis calls."""
+        assert await redis_service.are_pages_processed("crawl-empty", []) == []
+        assert await redis_service.mark_pages_processed("crawl-empty", []) is True
+        assert await fake_redis_client.exists("crawl:crawl-empty:processed") == 0
+
+    @pytest.mark.asyncio
+    async def test_are_pages_processed_when_redis_unavailable(self):
+        """Test safe default for batch checks when Redis is unavailable."""
+        service = RedisService()
+        service.client = None
+
+        assert await service.are_pages_processed("crawl", ["u1", "u2"]) == [False, False]
+        assert await service.mark_pages_processed("crawl", ["u1"]) is False
+
     @pytest.mark.asyncio
     async def test_is_page_processed_returns_false_when_redis_unavailable(self):
         """Test safe default when Redis is unavailable."""
@@ -0,0 +1,96 @@
+"""
+Tests for SemanticQueryCache.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from app.services.semantic_cache import SemanticQueryCache
+
+PARAMS = (5, 0.5)
+RESULTS = [{"id": "doc1", "score": 0.9, "content": "c", "metadata": {}}]
+
+
+class TestSemanticQueryCache:
+    """Tests for SemanticQueryCache lookups and eviction."""
+
+    def test_exact_hit(self):
+        """Test an identical query and params hit without an embedding."""
+        cache = SemanticQueryCache()
+        cache.put("what is rag", PARAMS, "0.0", [1.0, 0.0], RESULTS)
+
+        assert cache.get("what is rag", PARAMS, "0.0") is RESULTS
+        assert cache.get("what is rag", (10, 0.5), "0.0") is None
+
+    def test_similar_hit_above_threshold(self):
+        """Test a near-identical embedding reuses the cached results."""
+        cache = SemanticQueryCache(similarity_threshold=0.97)
+        cache.put("what is rag", PARAMS, "0.0", [1.0, 0.0], RESULTS)
+
+        assert cache.get_similar([0.99, 0.05], PARAMS, "0.0") is RESULTS
+        assert cache.get_similar([0.5, 0.5], PARAMS, "0.0") is None
+        assert cache.get_stats()["similar_hits"] == 1
+
+    def test_similar_requires_matching_params(self):
+        """Test a similar query with different search params misses."""
+        cache = SemanticQueryCache()
+        cache.put("what is rag", PARAMS, "0.0", [1.0, 0.0], RESULTS)
+
+        assert cache.get_similar([1.0, 0.0], (10, 0.5), "0.0") is None
+
+    def test_revision_change_invalidates(self):
+        """Test entries from an older QueryCache revision are never served."""
+        cache = SemanticQueryCache()
+        cache.put("what is rag", PARAMS, "0.0", [1.0, 0.0], RESULTS)
+
+        assert cache.get("what is rag", PARAMS, "0.1") is None
+        assert cache.get_similar([1.0, 0.0], PARAMS, "0.1") is None
+
+    def test_ttl_expiry(self):
+        """Test entries expire after the TTL."""
+        cache = SemanticQueryCache(ttl=10)
+        with patch("app.services.semantic_cache.time.monotonic", return_value=100.0):
+            cache.put("what is rag", PARAMS, "0.0", [1.0, 0.0], RESULTS)
+        with patch("app.services.semantic_cache.time.monotonic", return_value=111.0):
+            assert cache.get("what is rag", PARAMS, "0.0") is None
+            assert cache.get_similar([1.0, 0.0], PARAMS, "0.0") is None
+
+    def test_lru_eviction_frees_matrix_rows(self):
+        """Test the least recently used entry is evicted and can no longer match."""
+        cache = SemanticQueryCache(max_entries=2)
+        cache.put("a", PARAMS, "0.0", [1.0, 0.0, 0.0], [{"id": "a"}])
+        cache.put("b", PARAMS, "0.0", [0.0, 1.0, 0.0], [{"id": "b"}])
+        cache.get("a", PARAMS, "0.0")  # a is now most recently used
+        cache.put("c", PARAMS, "0.0", [0.0, 0.0, 1.0], [{"id": "c"}])
+
+        assert cache.get("b", PARAMS, "0.0") is None
+        assert cache.get_similar([0.0, 1.0, 0.0], PARAMS, "0.0") is None
+        assert cache.get_similar([1.0, 0.0, 0.0], PARAMS, "0.0") == [{"id": "a"}]
+        assert cache.get_stats()["size"] == 2
+
+    def test_matrix_grows_past_initial_capacity(self):
+        """Test more entries than the initial matrix capacity are all matchable."""
+        cache = SemanticQueryCache(max_entries=1000)
+        count = SemanticQueryCache._INITIAL_CAPACITY + 5
+        for i in range(count):
+            vector = [0.0] * count
+            vector[i] = 1.0
+            cache.put(f"q{i}", PARAMS, "0.0", vector, [{"id": i}])
+
+        last = [0.0] * count
+        last[-1] = 1.0
+        assert cache.get_similar(last, PARAMS, "0.0") == [{"id": count - 1}]
+
+    def test_disabled_cache_is_noop(self):
+        """Test a disabled cache never stores or returns results."""
+        cache = SemanticQueryCache(enabled=False)
+        cache.put("what is rag", PARAMS, "0.0", [1.0, 0.0], RESULTS)
+
+        assert cache.get("what is rag", PARAMS, "0.0") is None
+        assert cache.get_similar([1.0, 0.0], PARAMS, "0.0") is None
+
+    def test_invalid_max_entries(self):
+        """Test max_entries must be positive."""
+        with pytest.raises(ValueError):
+            SemanticQueryCache(max_entries=0)
@@ -4,6 +4,7 @@ VectorDB Async Initialization Tests
 RED Phase: These tests should FAIL initially (no async methods exist yet)
 """
 
+import asyncio
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 from app.services.vector_db import VectorDBService
@@ -128,6 +129,64 @@ class TestVectorDBAsync:
             
             await service.close()
     
+    async def test_search_batch_sends_single_request(self, mock_qdrant_client):
+        """Test search_batch issues one Qdrant call and returns results per query."""
+        point = MagicMock()
+        point.id = "doc1"
+        point.score = 0.9
+        point.payload = {"content": "Batch content", "metadata": {"sourceURL": "https://a.com"}}
+        mock_qdrant_client.search_batch.return_value = [[point], []]
+
+        with patch('app.services.vector_db.AsyncQdrantClient', return_value=mock_qdrant_client):
+            service = VectorDBService()
+            await service.initialize()
+
+            results = await service.search_batch(
+                [
+                    {"query_embedding": [0.1] * 1024, "limit": 3},
+                    {"query_embedding": [0.2] * 1024, "filters": {"source_type": "crawl"}},
+                ]
+            )
+
+            mock_qdrant_client.search_batch.assert_called_once()
+            requests = mock_qdrant_client.search_batch.call_args.kwargs["requests"]
+            assert len(requests) == 2
+            assert requests[0].limit == 3
+            assert requests[1].filter is not None
+            assert results == [
+                [
+                    {
+                        "id": "doc1",
+                        "score": 0.9,
+                        "content": "Batch content",
+                        "metadata": {"sourceURL": "https://a.com"},
+                    }
+                ],
+                [],
+            ]
+
+            await service.close()
+
+    async def test_batched_search_coalesces_concurrent_calls(self, mock_qdrant_client):
+        """Test concurrent batched_search calls share one search_batch request."""
+        mock_qdrant_client.search_batch.side_effect = lambda collection_name, requests: [
+            [] for _ in requests
+        ]
+
+        with patch('app.services.vector_db.AsyncQdrantClient', return_value=mock_qdrant_client):
+            service = VectorDBService()
+            await service.initialize()
+
+            results = await asyncio.gather(
+                *[service.batched_search([0.1] * 1024, limit=5) for _ in range(4)]
+            )
+
+            assert results == [[], [], [], []]
+            mock_qdrant_client.search_batch.assert_called_once()
+            assert len(mock_qdrant_client.search_batch.call_args.kwargs["requests"]) == 4
+
+            await service.close()
+
     async def test_multiple_initialize_calls_safe(self, mock_qdrant_client):
         """
         Test that calling initialize() multiple times is safe.